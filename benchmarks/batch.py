@@ -0,0 +1,48 @@
+"""Benchmark batch type checking of many small data frames against looping over single type checks.
+
+Usage: python benchmarks/batch.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+
+from pandas_type_checks import DataFrameReturnValue
+from pandas_type_checks.batch import check_many
+
+NUM_FRAMES = 2_000
+NUM_ROWS = 50
+
+
+def measure(label: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<40} {NUM_FRAMES / seconds:12.0f} frames/s")
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    data_frames = [
+        pd.DataFrame({'A': rng.random(NUM_ROWS), 'B': rng.integers(0, 100, NUM_ROWS), 'C': ['foo'] * NUM_ROWS})
+        for _ in range(NUM_FRAMES)
+    ]
+    dict_spec = DataFrameReturnValue({'A': np.dtype('float64'), 'B': np.dtype('int64'), 'C': data_frames[0]['C'].dtype})
+    pandera_spec = DataFrameReturnValue(pa.DataFrameSchema({
+        'A': pa.Column('float64', checks=pa.Check.in_range(0.0, 1.0)),
+        'B': pa.Column('int64', checks=pa.Check.ge(0))
+    }))
+
+    print(f"{NUM_FRAMES} frames with {NUM_ROWS} rows each")
+    for label, spec in [("dict spec", dict_spec), ("Pandera schema", pandera_spec)]:
+        measure(f"{label}: loop over type_check", lambda: [spec.type_check(df, strict=False) for df in data_frames])
+        measure(f"{label}: check_many", lambda: check_many(data_frames, spec, strict=False))
+    measure("Pandera schema: check_many, 4 threads",
+            lambda: check_many(data_frames, pandera_spec, strict=False, max_workers=4))
+    measure("Pandera schema: check_many, concatenated",
+            lambda: check_many(data_frames, pandera_spec, strict=False, concatenate=True))
+
+
+if __name__ == '__main__':
+    main()
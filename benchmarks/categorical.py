@@ -0,0 +1,49 @@
+"""Benchmark type checks of wide data frames with high-cardinality categorical columns.
+
+Usage: python benchmarks/categorical.py
+"""
+import time
+
+import pandas as pd
+
+from pandas_type_checks import Categorical, DataFrameReturnValue
+
+NUM_COLUMNS = 50
+NUM_CATEGORIES = 100_000
+NUM_ROWS = 1_000
+NUM_CHECKS = 20
+
+
+def measure(label: str, func) -> None:
+    # Warm up, such that the one-time resolution and hashing of the type specification is not measured
+    func()
+    start = time.perf_counter()
+    for _ in range(NUM_CHECKS):
+        func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<40} {1000 * seconds / NUM_CHECKS:10.2f} ms/check")
+
+
+def main() -> None:
+    categories = [f'category_{i}' for i in range(NUM_CATEGORIES)]
+    column_type = pd.CategoricalDtype(categories)
+    data_frame = pd.DataFrame({
+        f'column_{i}': pd.Categorical(categories[:NUM_ROWS], dtype=column_type) for i in range(NUM_COLUMNS)
+    })
+
+    # Separate but equal category arrays, such that comparisons cannot short-cut on identity
+    dtype_spec = DataFrameReturnValue({column: pd.CategoricalDtype(list(categories)) for column in data_frame.columns})
+    categorical_spec = DataFrameReturnValue({column: Categorical(list(categories)) for column in data_frame.columns})
+    any_spec = DataFrameReturnValue({column: Categorical() for column in data_frame.columns})
+
+    print(f"{NUM_COLUMNS} categorical columns with {NUM_CATEGORIES} categories each")
+    measure("element-wise dtype comparison", lambda: [
+        data_frame[column].dtype != expected_type for column, expected_type in dtype_spec.dtype.items()
+    ])
+    measure("CategoricalDtype spec", lambda: dtype_spec.type_check(data_frame, strict=False))
+    measure("Categorical spec, exact", lambda: categorical_spec.type_check(data_frame, strict=False))
+    measure("Categorical spec, any", lambda: any_spec.type_check(data_frame, strict=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark batched coercion of mismatched data frame columns against casting column by column.
+
+Usage: python benchmarks/coercion.py
+"""
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from pandas_type_checks import DataFrameArgument
+
+NUM_ROWS = 1_000_000
+NUM_COLUMNS = 20
+NUM_MISMATCHED_COLUMNS = 5
+REPEAT = 10
+
+
+def build_data_frame() -> pd.DataFrame:
+    data = {f'col_{i}': np.arange(NUM_ROWS, dtype='int64') for i in range(NUM_COLUMNS)}
+    data_frame = pd.DataFrame(data)
+    return data_frame.astype({f'col_{i}': 'int32' for i in range(NUM_MISMATCHED_COLUMNS)})
+
+
+def cast_per_column(data_frame: pd.DataFrame, marker: DataFrameArgument) -> pd.DataFrame:
+    # Shallow copy, such that only the cast columns are materialized, as in the batched coercion
+    coerced_data_frame = data_frame.copy(deep=False)
+    for column_name, expected_column_type in marker.expected_column_types.items():
+        if coerced_data_frame[column_name].dtype != expected_column_type:
+            coerced_data_frame[column_name] = coerced_data_frame[column_name].astype(expected_column_type)
+    return coerced_data_frame
+
+
+def measure(label: str, func) -> None:
+    seconds = min(timeit.repeat(func, number=1, repeat=REPEAT))
+    tracemalloc.start()
+    func()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<20} {seconds * 1000:10.2f} ms {peak_bytes / 2 ** 20:10.1f} MiB peak")
+
+
+def main() -> None:
+    data_frame = build_data_frame()
+    marker = DataFrameArgument('data', {f'col_{i}': 'int64' for i in range(NUM_COLUMNS)}, coerce=True)
+
+    print(f"{NUM_ROWS} rows, {NUM_COLUMNS} columns, {NUM_MISMATCHED_COLUMNS} mismatched columns")
+    measure("per-column cast", lambda: cast_per_column(data_frame, marker))
+    measure("batched coercion", lambda: marker.coerce_types(data_frame))
+
+
+if __name__ == '__main__':
+    main()
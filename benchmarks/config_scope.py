@@ -0,0 +1,42 @@
+"""Benchmark the resolution of the configuration on the hot path of the type check decorator, with and without
+configuration scopes.
+
+Usage: python benchmarks/config_scope.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from pandas_type_checks import DataFrameArgument, config, config_scope, current_config, pandas_type_check
+
+NUM_CALLS = 100_000
+
+
+def measure(label: str, func, num_calls: int = NUM_CALLS) -> None:
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<50} {1_000_000_000 * seconds / num_calls:10.1f} ns/call")
+
+
+def main() -> None:
+    data_frame = pd.DataFrame({'A': np.zeros(10), 'B': np.zeros(10, dtype='int64')})
+
+    @pandas_type_check(DataFrameArgument('data', {'A': np.dtype('float64'), 'B': np.dtype('int64')}))
+    def process(data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+    measure("global configuration attribute", lambda: config.strict_type_checks)
+    measure("current configuration", current_config)
+    with config_scope(strict_type_checks=True):
+        measure("current configuration within scope", current_config)
+
+    measure("decorated function", lambda: process(data_frame), num_calls=NUM_CALLS // 100)
+    with config_scope(strict_type_checks=True):
+        measure("decorated function within scope", lambda: process(data_frame), num_calls=NUM_CALLS // 100)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark type checks against dtype classes compared to chains of Pandas dtype predicates.
+
+Usage: python benchmarks/dtype_classes.py
+"""
+import time
+
+import pandas as pd
+
+from pandas_type_checks import AnyInteger, DataFrameReturnValue, Numeric
+
+NUM_COLUMNS = 500
+NUM_CHECKS = 200
+
+
+def measure(label: str, func) -> None:
+    # Warm up, such that the one-time resolution of the type specification is not measured
+    func()
+    start = time.perf_counter()
+    for _ in range(NUM_CHECKS):
+        func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<40} {1000 * seconds / NUM_CHECKS:10.3f} ms/check")
+
+
+def is_numeric(dtype) -> bool:
+    return ((pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype))
+            and not pd.api.types.is_bool_dtype(dtype))
+
+
+def main() -> None:
+    column_types = ['int8', 'Int32', 'uint16', 'int64', 'float32', 'Float64', 'bool', 'string']
+    data_frame = pd.DataFrame({
+        f'column_{i}': pd.Series([1, 0], dtype=column_types[i % len(column_types)]) for i in range(NUM_COLUMNS)
+    })
+    dtypes = list(data_frame.dtypes)
+    numeric = Numeric()
+    integer = AnyInteger()
+
+    print(f"{NUM_COLUMNS} columns")
+    measure("dtype predicates, numeric", lambda: [is_numeric(dtype) for dtype in dtypes])
+    measure("Numeric dtype class", lambda: [numeric.matches(dtype) for dtype in dtypes])
+    measure("dtype predicates, integer", lambda: [pd.api.types.is_integer_dtype(dtype) for dtype in dtypes])
+    measure("AnyInteger dtype class", lambda: [integer.matches(dtype) for dtype in dtypes])
+
+    numeric_columns = [column for column, dtype in data_frame.dtypes.items() if is_numeric(dtype)]
+    numeric_spec = DataFrameReturnValue({column: numeric for column in numeric_columns})
+    measure("type check with Numeric spec", lambda: numeric_spec.type_check(data_frame, strict=False))
+
+
+if __name__ == '__main__':
+    main()
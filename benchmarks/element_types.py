@@ -0,0 +1,43 @@
+"""Benchmark element type checks of object columns with sampled and full inference against an element-wise check.
+
+Usage: python benchmarks/element_types.py
+"""
+import time
+
+import pandas as pd
+
+from pandas_type_checks import DataFrameReturnValue, ObjectOf
+
+NUM_ROWS = 1_000_000
+NUM_CHECKS = 20
+
+
+def measure(label: str, func, num_checks: int = NUM_CHECKS) -> None:
+    start = time.perf_counter()
+    for _ in range(num_checks):
+        func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<40} {1000 * seconds / num_checks:10.3f} ms/check")
+
+
+def main() -> None:
+    print(f"{NUM_ROWS} rows")
+    for sample_size in [1000, None]:
+        spec = DataFrameReturnValue({'name': ObjectOf(str, sample_size=sample_size)})
+        # Fresh data frames, such that no inferred element types are cached
+        data_frames = [pd.DataFrame({'name': pd.Series([f'name_{i}' for i in range(NUM_ROWS)], dtype='object')})
+                       for _ in range(3)]
+        uncached_data_frames = iter(data_frames)
+        measure(f"ObjectOf(str), sample size {sample_size}, uncached",
+                lambda: spec.type_check(next(uncached_data_frames), strict=False), len(data_frames))
+        data_frame = pd.DataFrame({'name': pd.Series(['name'] * NUM_ROWS, dtype='object')})
+        spec.type_check(data_frame, strict=False)
+        measure(f"ObjectOf(str), sample size {sample_size}, cached", lambda: spec.type_check(data_frame, strict=False))
+
+    data_frame = pd.DataFrame({'name': pd.Series(['name'] * NUM_ROWS, dtype='object')})
+    measure("element-wise isinstance check", lambda: data_frame['name'].map(lambda value: isinstance(value, str)).all(),
+            3)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark the cost of reporting type check failures to the Arrow error sink against logging them to a file.
+
+Usage: python benchmarks/error_sink.py
+"""
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from pandas_type_checks.error_sinks import ArrowErrorSink
+from pandas_type_checks.errors import PandasTypeCheckError, build_exception_message
+
+NUM_REPORTS = 100_000
+
+
+def measure(label: str, func) -> None:
+    start = time.perf_counter()
+    for _ in range(NUM_REPORTS):
+        func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<40} {1_000_000 * seconds / NUM_REPORTS:10.2f} us/failure")
+
+
+def main() -> None:
+    arg_type_check_errors = {'data': [
+        PandasTypeCheckError("Expected type 'int64' for column B' but found type 'int32'", expected_type='int64',
+                             given_type='int32', column_name='B'),
+        PandasTypeCheckError("Missing column in DataFrame: 'C'", expected_type='bool', column_name='C')
+    ]}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        logger = logging.getLogger('benchmark')
+        logger.propagate = False
+        handler = logging.FileHandler(Path(tmp_dir) / 'type_errors.log')
+        logger.addHandler(handler)
+        measure("log formatted error message",
+                lambda: logger.error(build_exception_message('process', arg_type_check_errors, [])))
+        handler.close()
+
+        for file_format in ['parquet', 'ipc']:
+            error_sink = ArrowErrorSink(Path(tmp_dir) / file_format, file_format=file_format)
+            measure(f"error sink, {file_format}", lambda: error_sink.report('process', arg_type_check_errors, []))
+            start = time.perf_counter()
+            error_sink.close()
+            print(f"{f'close error sink, {file_format}':<40} {1000 * (time.perf_counter() - start):10.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark the startup cost of instrumenting thousands of functions and the call overhead after removing it.
+
+Usage: python benchmarks/instrumentation.py
+"""
+import time
+import types
+
+import pandas as pd
+
+from pandas_type_checks.core import DataFrameArgument, DataFrameReturnValue
+from pandas_type_checks.instrumentation import instrument
+
+NUM_FUNCTIONS = 5000
+NUM_CALLS = 10_000
+NUM_COLUMNS = 50
+
+
+def measure(label: str, func, num_calls: int = NUM_CALLS) -> None:
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<50} {1_000_000 * seconds / num_calls:10.2f} us/call")
+
+
+def create_module(num_functions: int) -> types.ModuleType:
+    module = types.ModuleType('benchmark_module')
+    source = '\n'.join(f"def function_{i}(data):\n    return data\n" for i in range(num_functions))
+    source += '\nclass Pipeline:\n' + '\n'.join(
+        f"    @staticmethod\n    def step_{i}(data):\n        return data\n" for i in range(num_functions))
+    exec(compile(source, 'benchmark_module.py', 'exec'), module.__dict__)
+    return module
+
+
+def call_function(module: types.ModuleType, data_frame: pd.DataFrame) -> None:
+    function = module.function_0
+    for _ in range(NUM_CALLS):
+        function(data_frame)
+
+
+def main() -> None:
+    module = create_module(NUM_FUNCTIONS)
+    data_frame = pd.DataFrame({f'column_{i}': [1, 2, 3] for i in range(NUM_COLUMNS)})
+    column_types = {f'column_{i}': 'int64' for i in range(NUM_COLUMNS)}
+    # Markers shared by all functions resolve their type specification once
+    markers = [DataFrameArgument('data', column_types), DataFrameReturnValue(column_types)]
+    specs = {f'benchmark_module.function_{i}': markers for i in range(NUM_FUNCTIONS)}
+    specs.update({f'benchmark_module.Pipeline.step_{i}': markers for i in range(NUM_FUNCTIONS)})
+
+    measure("original function", lambda: call_function(module, data_frame))
+    instrumentation = instrument(module, specs)
+    print(f"{'instrumenting ' + str(len(specs)) + ' functions':<50} "
+          f"{1_000_000 * instrumentation.setup_time / len(specs):10.2f} us/function "
+          f"({1000 * instrumentation.setup_time:.1f} ms total)")
+    measure("first call (resolves the type specification)", lambda: module.function_0(data_frame), 1)
+    measure("instrumented function", lambda: call_function(module, data_frame))
+    instrumentation.remove()
+    measure("function after removing the instrumentation", lambda: call_function(module, data_frame))
+
+
+if __name__ == '__main__':
+    main()
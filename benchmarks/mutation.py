@@ -0,0 +1,41 @@
+"""Benchmark the overhead of detecting in-place mutations of data frame arguments against plain type checks.
+
+Usage: python benchmarks/mutation.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from pandas_type_checks import DataFrameArgument, pandas_type_check
+
+NUM_COLUMNS = 100
+NUM_CALLS = 1_000
+
+
+def measure(label: str, func) -> None:
+    # Warm up, such that the one-time resolution of the type specification is not measured
+    func()
+    start = time.perf_counter()
+    for _ in range(NUM_CALLS):
+        func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<40} {1_000_000 * seconds / NUM_CALLS:10.1f} us/call")
+
+
+def main() -> None:
+    data_frame = pd.DataFrame(np.zeros((1_000, NUM_COLUMNS)), columns=[f'column_{i}' for i in range(NUM_COLUMNS)])
+    data_frame_type = {column: np.dtype('float64') for column in data_frame.columns}
+
+    def process(data: pd.DataFrame) -> int:
+        return len(data)
+
+    print(f"{NUM_COLUMNS} columns")
+    for detect_mutation in [None, 'structure', 'buffers']:
+        decorated_process = pandas_type_check(DataFrameArgument('data', data_frame_type,
+                                                                detect_mutation=detect_mutation))(process)
+        measure(f"detect_mutation={detect_mutation}", lambda: decorated_process(data_frame))
+
+
+if __name__ == '__main__':
+    main()
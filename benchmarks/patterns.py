@@ -0,0 +1,46 @@
+"""Benchmark type checks of wide data frames specified by column patterns against spelled out column specs.
+
+Usage: python benchmarks/patterns.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from pandas_type_checks import DataFrameReturnValue, Prefix, Regex
+
+NUM_COLUMNS = 10_000
+NUM_CHECKS = 50
+
+
+def measure(label: str, func) -> None:
+    # Warm up, such that the one-time resolution of the type specification and the column patterns is not measured
+    func()
+    start = time.perf_counter()
+    for _ in range(NUM_CHECKS):
+        func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<40} {1000 * seconds / NUM_CHECKS:10.2f} ms/check")
+
+
+def main() -> None:
+    data_frame = pd.DataFrame(np.zeros((10, NUM_COLUMNS)), columns=[f'feat_{i:04d}' for i in range(NUM_COLUMNS)])
+
+    dict_spec = DataFrameReturnValue({column: np.dtype('float64') for column in data_frame.columns})
+    regex_spec = DataFrameReturnValue({Regex(r'feat_\d{4}', min_count=1): np.dtype('float64')})
+    prefix_spec = DataFrameReturnValue({Prefix('feat_', min_count=1): np.dtype('float64')})
+
+    print(f"{NUM_COLUMNS} columns")
+    for strict in [False, True]:
+        measure(f"dict spec, strict={strict}", lambda: dict_spec.type_check(data_frame, strict=strict))
+        measure(f"regex spec, strict={strict}", lambda: regex_spec.type_check(data_frame, strict=strict))
+        measure(f"prefix spec, strict={strict}", lambda: prefix_spec.type_check(data_frame, strict=strict))
+
+    uncached_spec = DataFrameReturnValue({Regex(r'feat_\d{4}', min_count=1): np.dtype('float64')})
+    start = time.perf_counter()
+    uncached_spec.type_check(data_frame, strict=True)
+    print(f"{'regex spec, first check':<40} {1000 * (time.perf_counter() - start):10.2f} ms/check")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark reading and type checking a CSV file with spec-driven readers against the naive path.
+
+Usage: python benchmarks/readers.py
+"""
+import os
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from pandas_type_checks import DataFrameArgument, pandas_type_check, read_csv
+
+NUM_ROWS = 200_000
+NUM_COLUMNS = 40
+NUM_SPECIFIED_COLUMNS = 8
+REPEAT = 5
+
+
+def main() -> None:
+    spec = DataFrameArgument('data', {f'col_{i}': np.dtype('int32') for i in range(NUM_SPECIFIED_COLUMNS)})
+
+    @pandas_type_check(spec)
+    def process(data: pd.DataFrame) -> int:
+        return len(data)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'data.csv')
+        pd.DataFrame({f'col_{i}': np.arange(NUM_ROWS) for i in range(NUM_COLUMNS)}).to_csv(path, index=False)
+
+        def naive() -> None:
+            process(pd.read_csv(path).astype(spec.dtype))
+
+        def spec_driven() -> None:
+            process(read_csv(path, spec))
+
+        print(f"{NUM_ROWS} rows, {NUM_COLUMNS} columns in file, {NUM_SPECIFIED_COLUMNS} specified columns")
+        for label, func in [("naive read+check", naive), ("spec-driven read", spec_driven)]:
+            seconds = min(timeit.repeat(func, number=1, repeat=REPEAT))
+            print(f"{label:<20} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Benchmark the overhead of recording the structures of function arguments and return values.
+
+Usage: python benchmarks/recording.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from pandas_type_checks import observe
+
+NUM_COLUMNS = 100
+NUM_CALLS = 10_000
+
+
+def measure(label: str, func) -> None:
+    # Warm up, such that recording the first occurrence of a structure is not measured
+    func()
+    start = time.perf_counter()
+    for _ in range(NUM_CALLS):
+        func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<40} {1_000_000 * seconds / NUM_CALLS:10.2f} us/call")
+
+
+def process(data: pd.DataFrame, values: pd.Series) -> pd.DataFrame:
+    return data
+
+
+def main() -> None:
+    data_frame = pd.DataFrame(np.zeros((10, NUM_COLUMNS)), columns=[f'column_{i}' for i in range(NUM_COLUMNS)])
+    values = pd.Series(np.zeros(10))
+    observed_process = observe(process)
+
+    print(f"{NUM_COLUMNS} columns")
+    measure("plain function", lambda: process(data_frame, values))
+    measure("observed function", lambda: observed_process(data_frame, values))
+
+
+if __name__ == '__main__':
+    main()
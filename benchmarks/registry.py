@@ -0,0 +1,40 @@
+"""Benchmark loading a schema file with many schemas with and without the on-disk cache of compiled schemas.
+
+Usage: python benchmarks/registry.py
+"""
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from pandas_type_checks.registry import SchemaRegistry
+
+NUM_SCHEMAS = 500
+NUM_COLUMNS = 50
+COLUMN_TYPES = ['int64', 'float64', 'string', 'bool', 'datetime64[ns]', 'Int32', 'category']
+
+
+def measure(label: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<40} {1000 * seconds:10.1f} ms")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        schema_file = Path(tmp_dir) / 'schemas.json'
+        schema_file.write_text(json.dumps({
+            f'schema_{i}': {f'column_{j}': COLUMN_TYPES[(i + j) % len(COLUMN_TYPES)] for j in range(NUM_COLUMNS)}
+            for i in range(NUM_SCHEMAS)
+        }))
+        cache_dir = Path(tmp_dir) / 'cache'
+
+        print(f"{NUM_SCHEMAS} schemas with {NUM_COLUMNS} columns each")
+        measure("load without cache", lambda: SchemaRegistry().load(schema_file, use_cache=False))
+        measure("load, compile and write cache", lambda: SchemaRegistry().load(schema_file, cache_dir=cache_dir))
+        measure("load precompiled schemas", lambda: SchemaRegistry().load(schema_file, cache_dir=cache_dir))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark the cost of counting type checked calls in a memory-mapped counter file shared by multiple processes.
+
+Usage: python benchmarks/shared_counters.py
+"""
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from pandas_type_checks.shared_counters import SharedCounters
+
+NUM_CALLS = 200_000
+NUM_PROCESSES = 4
+
+
+def measure(label: str, func, num_calls: int = NUM_CALLS) -> None:
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<40} {1_000_000 * seconds / num_calls:10.2f} us/call")
+
+
+def count_calls(counters: SharedCounters, names) -> None:
+    for i in range(NUM_CALLS):
+        counters.record(names[i % len(names)], False, 1000)
+
+
+def count_calls_in_processes(counters: SharedCounters, names) -> None:
+    context = multiprocessing.get_context('fork')
+    processes = [context.Process(target=count_calls, args=(counters, names)) for _ in range(NUM_PROCESSES)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        counters = SharedCounters(Path(tmp_dir) / 'type_checks.counters')
+        measure("single process", lambda: count_calls(counters, ['module.process']))
+        # Total time of all processes divided by the total number of calls
+        measure(f"{NUM_PROCESSES} processes, same function",
+                lambda: count_calls_in_processes(counters, ['module.process']), NUM_PROCESSES * NUM_CALLS)
+        measure(f"{NUM_PROCESSES} processes, 64 functions",
+                lambda: count_calls_in_processes(counters, [f'module.function_{i}' for i in range(64)]),
+                NUM_PROCESSES * NUM_CALLS)
+        counters.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Benchmark the latency of type checks against a Pandera schema with expensive value checks, with and without a
+time budget.
+
+Usage: python benchmarks/time_budget.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+
+from pandas_type_checks.core import DataFrameArgument
+
+NUM_ROWS = 1_000_000
+NUM_CALLS = 10
+
+
+def measure(label: str, func) -> None:
+    start = time.perf_counter()
+    for _ in range(NUM_CALLS):
+        func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<40} {1000 * seconds / NUM_CALLS:10.2f} ms/call")
+
+
+def main() -> None:
+    data_frame = pd.DataFrame({f'col_{i}': np.random.rand(NUM_ROWS) for i in range(8)})
+    schema = pa.DataFrameSchema({
+        column: pa.Column(float, [pa.Check.ge(0), pa.Check.le(1), pa.Check(lambda s: s.rank() > 0)])
+        for column in data_frame.columns
+    })
+    marker = DataFrameArgument('data', schema)
+
+    measure("no time budget", lambda: marker.type_check(data_frame, strict=False))
+    for time_budget in [0.1, 0.01, 0.0]:
+        measure(f"time budget {time_budget:g}s",
+                lambda: marker.type_check(data_frame, strict=False, time_budget=time_budget))
+
+
+if __name__ == '__main__':
+    main()
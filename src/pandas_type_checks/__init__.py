@@ -1,7 +1,23 @@
 from pandas_type_checks.core import PandasTypeCheckError, PandasTypeCheckConfiguration, config
+from pandas_type_checks.core import ConfigScope, config_scope, current_config
+from pandas_type_checks.errors import ErrorSink
 from pandas_type_checks.core import SeriesArgument, SeriesReturnValue, DataFrameArgument, DataFrameReturnValue
+from pandas_type_checks.dtypes import DtypeClass, AnyBackend, Categorical, ObjectOf
+from pandas_type_checks.dtypes import AnyInteger, AnyFloat, Numeric, AnyString, WidenableTo
+from pandas_type_checks.index_spec import IndexSpec
+from pandas_type_checks.patterns import ColumnPattern, Regex, Prefix, Glob
+from pandas_type_checks.registry import SchemaRegistry, schema_registry
+from pandas_type_checks.recording import StructureRecorder, structure_recorder, observe
+from pandas_type_checks.time_budget import TimeBudgetCounters, time_budget_counters
 from pandas_type_checks.decorator import PandasTypeCheckDecoratorException, pandas_type_check
+from pandas_type_checks.instrumentation import Instrumentation, instrument, install_import_hook
+from pandas_type_checks.readers import read_csv, read_parquet
 
-__all__ = ['PandasTypeCheckConfiguration', 'config',
+__all__ = ['PandasTypeCheckConfiguration', 'config', 'ConfigScope', 'config_scope', 'current_config',
            'SeriesArgument', 'SeriesReturnValue', 'DataFrameArgument', 'DataFrameReturnValue',
-           'PandasTypeCheckError', 'PandasTypeCheckDecoratorException', 'pandas_type_check']
+           'DtypeClass', 'AnyBackend', 'Categorical', 'ObjectOf',
+           'AnyInteger', 'AnyFloat', 'Numeric', 'AnyString', 'WidenableTo',
+           'ColumnPattern', 'Regex', 'Prefix', 'Glob', 'IndexSpec', 'SchemaRegistry', 'schema_registry',
+           'StructureRecorder', 'structure_recorder', 'observe', 'TimeBudgetCounters', 'time_budget_counters',
+           'PandasTypeCheckError', 'ErrorSink', 'PandasTypeCheckDecoratorException', 'pandas_type_check',
+           'Instrumentation', 'instrument', 'install_import_hook', 'read_csv', 'read_parquet']
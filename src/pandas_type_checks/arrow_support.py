@@ -0,0 +1,73 @@
+import os
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pandas_type_checks.core import DataFrameReturnValue, DataFrameType
+from pandas_type_checks.errors import PandasTypeCheckError
+
+ArrowSource = Union[str, os.PathLike, pa.Schema, pa.Table, pa.RecordBatch]
+
+
+def read_arrow_schema(source: ArrowSource) -> pa.Schema:
+    """Get the Arrow schema of the given source without reading any data.
+
+    Args:
+        source: Path to a Parquet file, or an Arrow ``Schema``, ``Table`` or ``RecordBatch``.
+          For Parquet files only the footer metadata is read.
+
+    Returns:
+        The Arrow schema of the given source.
+    """
+    if isinstance(source, pa.Schema):
+        return source
+    if isinstance(source, (pa.Table, pa.RecordBatch)):
+        return source.schema
+    return pq.read_schema(source)
+
+
+def arrow_schema_to_pandas_dtypes(schema: pa.Schema, dtype_backend: Optional[str] = None) -> Dict[Any, Any]:
+    """Map the fields of an Arrow schema to the Pandas dtypes of the columns of the corresponding data frame.
+
+    The mapping is derived by converting an empty table with the given schema, such that it takes into account
+    the Pandas metadata stored with the schema, e.g. index columns, categorical or nullable extension dtypes,
+    without materializing any data.
+
+    Args:
+        schema: Arrow schema to map
+        dtype_backend: (Optional) Set to 'pyarrow' to map the fields to Arrow-backed ``ArrowDtype`` dtypes, as
+          done by ``pd.read_parquet(..., dtype_backend='pyarrow')``
+
+    Returns:
+        Column name -> Pandas dtype of the data frame a table with the given schema would be converted into.
+    """
+    types_mapper = pd.ArrowDtype if dtype_backend == 'pyarrow' else None
+    return schema.empty_table().to_pandas(types_mapper=types_mapper).dtypes.to_dict()
+
+
+def type_check_arrow_schema(source: ArrowSource,
+                            spec: Union[DataFrameReturnValue, DataFrameType],
+                            strict: bool = False,
+                            dtype_backend: Optional[str] = None) -> List[PandasTypeCheckError]:
+    """Type check the schema of a Parquet file or Arrow data against a data frame type specification.
+
+    Only the structure (i.e. columns and their types) is checked, no data is read or converted.
+    Value checks contained in Pandera schemas are not evaluated.
+
+    Args:
+        source: Path to a Parquet file, or an Arrow ``Schema``, ``Table`` or ``RecordBatch``
+        spec: Data frame type check marker, dict of column name -> data type, or Pandera ``DataFrameSchema``
+        strict: Flag for strict type check mode. If strict type checking is enabled the schema cannot contain
+            columns which are not part of the type specification.
+        dtype_backend: (Optional) Set to 'pyarrow' to check the schema against the Arrow-backed dtypes the data
+            would be loaded with when reading it with ``dtype_backend='pyarrow'``
+
+    Returns:
+        A list of errors which occurred when type checking the schema of the given source.
+        If and only if no type errors are found, this function returns an empty list.
+    """
+    marker = spec if isinstance(spec, DataFrameReturnValue) else DataFrameReturnValue(spec)
+    column_types = arrow_schema_to_pandas_dtypes(read_arrow_schema(source), dtype_backend=dtype_backend)
+    return marker.check_column_types(column_types, strict=strict)
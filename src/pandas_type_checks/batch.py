@@ -0,0 +1,159 @@
+from collections import Counter
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+import pandas as pd
+
+from pandas_type_checks.core import DataFrameReturnValue, DataFrameType, current_config, pandera_support
+from pandas_type_checks.errors import PandasTypeCheckError
+from pandas_type_checks.fingerprint import StructuralFingerprint, structural_fingerprint
+
+if pandera_support:
+    import pandera as pa
+    from pandas_type_checks.pandera_support import has_row_wise_checks_only
+
+
+class BatchTypeCheckResult(object):
+    """
+    Result of type checking a batch of data frames against a single type specification.
+
+    Attributes:
+        type_check_errors: List containing the list of type check errors for each data frame of the batch,
+            in the order of the data frames. The list for a data frame is empty if it passed the type check.
+        num_layouts: Number of distinct structures (i.e. columns and their types) found in the batch.
+    """
+
+    def __init__(self, type_check_errors: List[List[PandasTypeCheckError]], num_layouts: int):
+        self.type_check_errors = type_check_errors
+        self.num_layouts = num_layouts
+
+    @property
+    def num_frames(self) -> int:
+        """Number of data frames in the batch."""
+        return len(self.type_check_errors)
+
+    @property
+    def failed_frames(self) -> List[int]:
+        """Positions of the data frames in the batch which failed the type check."""
+        return [position for position, errors in enumerate(self.type_check_errors) if errors]
+
+    @property
+    def error_summary(self) -> Dict[str, int]:
+        """Number of data frames per type check error message, most common error messages first."""
+        error_counts: Counter = Counter()
+        for errors in self.type_check_errors:
+            error_counts.update({err.error_msg for err in errors})
+        return dict(error_counts.most_common())
+
+
+def _type_check(marker: DataFrameReturnValue, data_frame: Any, strict: bool) -> List[PandasTypeCheckError]:
+    return marker.type_check(data_frame, strict=strict)
+
+
+def _failing_frames(schema: Any, data_frames: List[pd.DataFrame]) -> Optional[Set[int]]:
+    """Validate the concatenation of the given data frames against a Pandera ``DataFrameSchema``.
+
+    Returns:
+        The positions of the data frames with failure cases, an empty set if the validation succeeds, or None if
+        the failure cases cannot be attributed to individual data frames.
+    """
+    concatenated_data_frame = pd.concat(data_frames, keys=range(len(data_frames)))
+    try:
+        schema.validate(concatenated_data_frame, lazy=True)
+    except pa.errors.SchemaErrors as err:
+        failure_case_indices = err.failure_cases['index']
+        if not all(isinstance(index, tuple) for index in failure_case_indices):
+            return None
+        return {index[0] for index in failure_case_indices}
+    return set()
+
+
+def check_many(data_frames: Iterable[Any],
+               spec: Union[DataFrameReturnValue, DataFrameType],
+               strict: Optional[bool] = None,
+               executor: Optional[Executor] = None,
+               max_workers: Optional[int] = None,
+               concatenate: bool = False) -> BatchTypeCheckResult:
+    """Type check many data frames against a single type specification.
+
+    The data frames are grouped by their structure (i.e. columns and their types). The structure of each distinct
+    layout is checked only once, the index of each data frame is checked individually. Pandera value validation of
+    the data frames whose structure conforms to the type specification can be fanned out to a worker pool, or run once
+    per layout over the concatenation of its data frames. In the latter case only the data frames with failure cases
+    are validated individually afterwards. Concatenation is only used for schemas whose checks are all row-wise (see
+    ``has_row_wise_checks_only``), since aggregate checks (e.g. of the mean or uniqueness of a column) can pass for
+    the concatenation while failing for a single data frame, or the reverse.
+
+    Args:
+        data_frames: Data frames to type check
+        spec: Data frame type check marker, dict of column name -> data type, or Pandera ``DataFrameSchema``
+        strict: (Optional) Flag for strict type check mode. Defaults to the current configuration.
+        executor: (Optional) Executor used for Pandera value validation, e.g. a ``ProcessPoolExecutor``
+        max_workers: (Optional) Number of threads used for Pandera value validation if no executor is given.
+            Value validation runs in the calling thread if neither an executor nor a number of workers is given.
+        concatenate: Flag for running Pandera value validation once per layout over the concatenated data frames,
+            if the schema only contains row-wise checks. Data frames are validated individually otherwise.
+
+    Returns:
+        The type check errors of each data frame together with an aggregated summary.
+    """
+    marker = spec if isinstance(spec, DataFrameReturnValue) else DataFrameReturnValue(spec)
+    strict = current_config().strict_type_checks if strict is None else strict
+    data_frames = list(data_frames)
+    type_check_errors: List[List[PandasTypeCheckError]] = [[] for _ in data_frames]
+
+    # Group data frames by their structural fingerprint
+    layouts: Dict[StructuralFingerprint, List[int]] = {}
+    for position, data_frame in enumerate(data_frames):
+        if isinstance(data_frame, pd.DataFrame):
+            layouts.setdefault(structural_fingerprint(data_frame), []).append(position)
+        else:
+            type_check_errors[position] = marker.type_check(data_frame, strict=strict)
+
+    is_pandera_schema = pandera_support and isinstance(marker.spec, pa.DataFrameSchema)
+
+    # Check the structure of each layout once
+    frames_to_validate: List[int] = []
+    for (columns, dtypes), positions in layouts.items():
+        # The structural check only decides which data frames need to be validated individually for Pandera schemas,
+        # the Pandera validation itself is authoritative. Hence dtypes are compared independent of their backend.
+        layout_errors = marker.check_column_types(dict(zip(columns, dtypes)), strict=strict,
+                                                  any_backend=is_pandera_schema)
+        if not is_pandera_schema:
+            # Elements of object columns specified by an 'ObjectOf' dtype class are checked for each data frame
+            for position in positions:
+                type_check_errors[position] = list(layout_errors) + marker.check_element_types(data_frames[position])
+        elif layout_errors:
+            # Validate individually to report the same errors as the Pandera validation of a single data frame
+            frames_to_validate.extend(positions)
+        elif concatenate and has_row_wise_checks_only(marker.spec):
+            failing_frames = _failing_frames(marker.spec, [data_frames[position] for position in positions])
+            frames_to_validate.extend(positions if failing_frames is None
+                                      else [positions[frame] for frame in sorted(failing_frames)])
+        else:
+            frames_to_validate.extend(positions)
+
+    # Validate Pandera schema for individual data frames
+    validated_frames = [data_frames[position] for position in frames_to_validate]
+    markers = [marker] * len(validated_frames)
+    strict_flags = [strict] * len(validated_frames)
+    if executor is not None:
+        results = list(executor.map(_type_check, markers, validated_frames, strict_flags))
+    elif max_workers is not None and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as thread_pool:
+            results = list(thread_pool.map(_type_check, markers, validated_frames, strict_flags))
+    else:
+        results = list(map(_type_check, markers, validated_frames, strict_flags))
+
+    for position, errors in zip(frames_to_validate, results):
+        type_check_errors[position] = errors
+
+    # Check the index of the data frames whose structure has only been checked per layout
+    if marker.index is not None:
+        validated_positions = set(frames_to_validate)
+        for positions in layouts.values():
+            for position in positions:
+                if position not in validated_positions:
+                    type_check_errors[position].extend(marker.check_index(data_frames[position]))
+
+    return BatchTypeCheckResult(type_check_errors, num_layouts=len(layouts))
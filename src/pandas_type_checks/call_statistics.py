@@ -0,0 +1,69 @@
+import threading
+from typing import Any, Dict, Optional
+
+
+class FunctionStatistics(object):
+    """
+    Statistics of the type checked calls of a decorated function.
+
+    Attributes:
+        calls: Number of type checked calls
+        failures: Number of calls with type errors
+        check_time: Total time in seconds spent type checking arguments and return values
+        function_time: Total time in seconds spent in the decorated function itself
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.check_time = 0.0
+        self.function_time = 0.0
+
+    @property
+    def check_time_per_call(self) -> float:
+        """Mean time in seconds spent type checking a call."""
+        return self.check_time / self.calls if self.calls else 0.0
+
+    @property
+    def overhead(self) -> Optional[float]:
+        """Ratio of the check time to the function time, or None if no function time has been measured."""
+        return self.check_time / self.function_time if self.function_time > 0 else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'calls': self.calls, 'failures': self.failures, 'check_time': self.check_time,
+                'function_time': self.function_time, 'check_time_per_call': self.check_time_per_call,
+                'overhead': self.overhead}
+
+
+class CallStatistics(object):
+    """
+    In-process statistics of the calls, failures, check time and function time of all decorated functions, e.g.
+    collected by the pytest plugin during a test session.
+
+    Set ``PandasTypeCheckConfiguration.call_statistics`` to collect the statistics of all decorated functions.
+
+    Attributes:
+        functions: Qualified function name -> statistics of its type checked calls
+    """
+
+    def __init__(self):
+        self.functions: Dict[str, FunctionStatistics] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, failed: bool, check_time_ns: int, function_time_ns: int) -> None:
+        """Record a type checked call of the function with the given qualified name.
+
+        Args:
+            name: Qualified name of the decorated function
+            failed: Flag if type errors were found
+            check_time_ns: Time in nanoseconds spent type checking arguments and return value
+            function_time_ns: Time in nanoseconds spent in the decorated function
+        """
+        with self._lock:
+            statistics = self.functions.get(name)
+            if statistics is None:
+                statistics = self.functions[name] = FunctionStatistics()
+            statistics.calls += 1
+            statistics.failures += failed
+            statistics.check_time += check_time_ns / 1e9
+            statistics.function_time += function_time_ns / 1e9
@@ -0,0 +1,81 @@
+from itertools import combinations
+from typing import Any, FrozenSet, Set, Tuple, Union
+
+import pandas as pd
+
+# Pandas 3 enables Copy-on-Write by default and deprecates the 'copy' keyword of 'astype'.
+# Unaffected columns are shared lazily in that case, so no copy is made either way.
+_astype_copy_keyword = int(pd.__version__.split('.')[0]) < 3
+
+_signed_integer_types = ['int8', 'int16', 'int32', 'int64']
+_unsigned_integer_types = ['uint8', 'uint16', 'uint32', 'uint64']
+_float_types = ['float16', 'float32', 'float64']
+
+
+def _widening_casts() -> Set[Tuple[str, str]]:
+    """Build the set of lossless casts between NumPy and nullable Pandas dtypes."""
+    casts: Set[Tuple[str, str]] = set()
+
+    # Widening within the same family, e.g. 'int32' -> 'int64' or 'float32' -> 'float64'
+    for family in (_signed_integer_types, _unsigned_integer_types, _float_types):
+        casts.update(combinations(family, 2))
+
+    # Unsigned integers fit into signed integers of more than twice the width, e.g. 'uint16' -> 'int32'
+    for unsigned_index, unsigned_type in enumerate(_unsigned_integer_types):
+        casts.update((unsigned_type, signed_type) for signed_type in _signed_integer_types[unsigned_index + 1:])
+
+    # Integers which fit into the mantissa of a floating point type
+    casts.update((int_type, 'float32') for int_type in ('int8', 'int16', 'uint8', 'uint16'))
+    casts.update((int_type, 'float64') for int_type in ('int8', 'int16', 'int32', 'uint8', 'uint16', 'uint32'))
+
+    # NumPy dtypes into nullable Pandas extension dtypes of the same or a wider type
+    numpy_casts = list(casts)
+    for numpy_type in _signed_integer_types + _unsigned_integer_types + ['float32', 'float64']:
+        casts.add((numpy_type, numpy_type.capitalize().replace('Uint', 'UInt')))
+    for from_type, to_type in numpy_casts:
+        if to_type != 'float16':
+            casts.add((from_type, to_type.capitalize().replace('Uint', 'UInt')))
+    casts.add(('bool', 'boolean'))
+
+    # Python objects into the dedicated string dtypes
+    casts.update({('object', 'string'), ('object', 'str'), ('str', 'string')})
+
+    # Date times into a finer resolution, e.g. parsed 'datetime64[us]' -> 'datetime64[ns]'. Date times out of the range
+    # of the finer resolution raise an error instead of being truncated.
+    casts.update((f'datetime64[{from_unit}]', f'datetime64[{to_unit}]')
+                 for from_unit, to_unit in combinations(['s', 'ms', 'us', 'ns'], 2))
+
+    return casts
+
+
+DEFAULT_SAFE_CASTS: FrozenSet[Tuple[str, str]] = frozenset(_widening_casts())
+"""Default allow-list of casts applied when coercing data frames or series, given as pairs of dtype names."""
+
+
+def is_safe_cast(given_type: Any, expected_type: Any, safe_casts: Union[Set[Tuple[str, str]], FrozenSet]) -> bool:
+    """Check if a value of the given type can be coerced into the expected type.
+
+    Args:
+        given_type: Actual dtype of a data frame column or series
+        expected_type: Expected dtype of a data frame column or series
+        safe_casts: Allow-list of casts given as pairs of dtype names
+
+    Returns:
+        True if the cast from the given type to the expected type is on the allow-list, False otherwise.
+    """
+    return (str(given_type), str(expected_type)) in safe_casts
+
+
+def astype_without_copy(value: Union[pd.DataFrame, pd.Series], dtype: Any) -> Union[pd.DataFrame, pd.Series]:
+    """Cast a data frame or series without copying data that is not affected by the cast.
+
+    Args:
+        value: Pandas data frame or series to cast
+        dtype: Target dtype, or dict of column name -> target dtype for data frames
+
+    Returns:
+        The cast data frame or series.
+    """
+    if _astype_copy_keyword:
+        return value.astype(dtype, copy=False)
+    return value.astype(dtype)
@@ -1,5 +1,10 @@
-from typing import Dict, Any, Union, List, Type
+from typing import Dict, Any, Callable, Union, List, Type, Set, Tuple, Optional, Mapping, Sequence, TYPE_CHECKING
+import copy
+import inspect
 import logging
+import time
+from contextvars import ContextVar, Token
+from functools import wraps
 
 import pandas as pd
 import numpy as np
@@ -13,9 +18,23 @@ except ImportError:
 
 from pandas.core.dtypes.base import ExtensionDtype
 
-from pandas_type_checks.errors import PandasTypeCheckError
+from pandas_type_checks.call_statistics import CallStatistics
+from pandas_type_checks.coercion import DEFAULT_SAFE_CASTS, astype_without_copy, is_safe_cast
+from pandas_type_checks.dtypes import DtypeClass, ObjectOf, as_dtype_class, dtype_matches
+from pandas_type_checks.dask_support import is_dask_frame
+from pandas_type_checks.errors import ErrorSink, PandasTypeCheckError, build_exception_message
+from pandas_type_checks.fingerprint import MutationFingerprint, mutation_errors
+from pandas_type_checks.index_spec import IndexSpec
+from pandas_type_checks.patterns import ColumnPattern, PatternResolver
+from pandas_type_checks.polars_support import is_polars_frame, polars_column_types
+from pandas_type_checks.registry import schema_registry
+from pandas_type_checks.time_budget import incomplete_validation_error
 if pandera_support:
     from pandas_type_checks.pandera_support import pandera_schema_errors_to_type_check_errors
+    from pandas_type_checks.pandera_support import split_data_frame_schema, validate_before_deadline
+# Shared counters require the POSIX-only 'fcntl' module, they are only imported for type checking
+if TYPE_CHECKING:
+    from pandas_type_checks.shared_counters import SharedCounters
 
 
 default_logger = logging.getLogger('pandas_type_checks')
@@ -36,24 +55,185 @@ class PandasTypeCheckConfiguration(object):
         log_type_errors (bool): Flag indicating that type errors for Pandas dataframes or series values should be
             logged instead of raising a 'TypeError' exception. Defaults to False.
         logger (logging.Logger): Logger to be used for logging type errors when 'log_type_errors' flag is enabled.
+        safe_casts (Set[Tuple[str, str]]): Allow-list of casts applied by type check markers in coercion mode,
+            given as pairs of dtype names, e.g. ``('int32', 'int64')``. Defaults to lossless widening casts.
+        record_structures (bool): Flag for recording mode. Defaults to False. If recording mode is enabled, functions
+            decorated with 'pandas_type_check' record the structures of their Pandas data frame and series arguments
+            and return values in 'structure_recorder', in addition to type checking them.
+        error_sink (ErrorSink): (Optional) Sink receiving all type check errors of decorated functions as structured
+            records, e.g. an 'ArrowErrorSink' writing them to Arrow IPC or Parquet files, in addition to raising or
+            logging them. Defaults to None.
+        validation_time_budget (float): (Optional) Time budget in seconds for the value checks of Pandera data frame
+            schemas in each type check of a decorated function. Value checks exceeding the time budget are skipped
+            and reported as incomplete. Defaults to None, i.e. no time budget.
+        shared_counters (SharedCounters): (Optional) Memory-mapped counters of type checked calls, failures and check
+            time per decorated function, shared by all processes of a pre-fork deployment. Defaults to None.
+        call_statistics (CallStatistics): (Optional) In-process statistics of the calls, failures, check time and
+            function time of all decorated functions, e.g. collected by the pytest plugin. Defaults to None.
     """
 
     def __init__(self, enable_type_checks: bool = True,
                  strict_type_checks: bool = False,
                  log_type_errors: bool = False,
-                 logger: logging.Logger = default_logger):
+                 logger: logging.Logger = default_logger,
+                 safe_casts: Optional[Set[Tuple[str, str]]] = None,
+                 record_structures: bool = False,
+                 error_sink: Optional[ErrorSink] = None,
+                 validation_time_budget: Optional[float] = None,
+                 shared_counters: Optional['SharedCounters'] = None,
+                 call_statistics: Optional[CallStatistics] = None):
         self.enable_type_checks = enable_type_checks
         self.strict_type_checks = strict_type_checks
         self.log_type_errors = log_type_errors
         self.logger = logger
+        self.safe_casts = set(DEFAULT_SAFE_CASTS) if safe_casts is None else safe_casts
+        self.record_structures = record_structures
+        self.error_sink = error_sink
+        self.validation_time_budget = validation_time_budget
+        self.shared_counters = shared_counters
+        self.call_statistics = call_statistics
 
 
 config = PandasTypeCheckConfiguration()
 
+# Configuration of the innermost configuration scope of the current thread or asyncio task, if any
+_scoped_config: ContextVar[Optional[PandasTypeCheckConfiguration]] = ContextVar('pandas_type_checks_scoped_config',
+                                                                                default=None)
+# Tokens for restoring the outer scope of each entered configuration scope of the current thread or asyncio task
+_entered_scopes: ContextVar[Tuple[Token, ...]] = ContextVar('pandas_type_checks_entered_scopes', default=())
 
-SeriesType = Union[str, np.dtype, ExtensionDtype]  # type: ignore
+
+def current_config() -> PandasTypeCheckConfiguration:
+    """Get the configuration in effect for the current thread or asyncio task.
+
+    This is the configuration of the innermost configuration scope entered by the current thread or asyncio task, or
+    the global configuration ``config`` outside of configuration scopes.
+    """
+    scoped_config = _scoped_config.get()
+    return config if scoped_config is None else scoped_config
+
+
+class ConfigScope(object):
+    """
+    Scoped override of configuration options, usable as context manager and as decorator.
+
+    Within a configuration scope the overridden options take precedence over the global configuration for the current
+    thread or asyncio task only, other threads and tasks are not affected. Options which are not overridden are taken
+    from the configuration in effect when the scope is entered. Scopes can be nested and asyncio tasks created within a
+    scope inherit it. Decorated functions, including coroutine functions, enter the scope on each call.
+
+    Attributes:
+        overrides: Configuration option name -> value, e.g. ``{'strict_type_checks': True}``
+    """
+
+    def __init__(self, **overrides: Any):
+        unknown_options = sorted(set(overrides) - set(vars(config)))
+        if unknown_options:
+            raise ValueError(f"Unknown configuration options: {', '.join(unknown_options)}")
+        self.overrides = overrides
+
+    def _scoped_config(self) -> PandasTypeCheckConfiguration:
+        scoped_config = copy.copy(current_config())
+        scoped_config.safe_casts = set(scoped_config.safe_casts)
+        for option, value in self.overrides.items():
+            setattr(scoped_config, option, value)
+        return scoped_config
+
+    def __enter__(self) -> PandasTypeCheckConfiguration:
+        scoped_config = self._scoped_config()
+        _entered_scopes.set(_entered_scopes.get() + (_scoped_config.set(scoped_config),))
+        return scoped_config
+
+    def __exit__(self, *exc_info: Any) -> None:
+        entered_scopes = _entered_scopes.get()
+        _scoped_config.reset(entered_scopes[-1])
+        _entered_scopes.set(entered_scopes[:-1])
+
+    def __call__(self, func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def config_scope_async_wrapper(*args, **kwargs):
+                token = _scoped_config.set(self._scoped_config())
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    _scoped_config.reset(token)
+
+            return config_scope_async_wrapper
+
+        @wraps(func)
+        def config_scope_wrapper(*args, **kwargs):
+            token = _scoped_config.set(self._scoped_config())
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _scoped_config.reset(token)
+
+        return config_scope_wrapper
+
+
+def config_scope(**overrides: Any) -> ConfigScope:
+    """Override configuration options for the current thread or asyncio task, e.g. for a single request.
+
+    Example::
+
+        with config_scope(strict_type_checks=True, log_type_errors=True):
+            ...
+
+        @config_scope(enable_type_checks=False)
+        def handle_request(...):
+            ...
+
+    Args:
+        **overrides: Configuration option name -> value, see ``PandasTypeCheckConfiguration``
+
+    Raises:
+        ValueError: If an unknown configuration option is given.
+    """
+    return ConfigScope(**overrides)
+
+
+def report_type_errors(error_msg: str) -> None:
+    """Raise a 'TypeError' with the given error message, or log it if the corresponding configuration flag is set."""
+    current = current_config()
+    if current.log_type_errors:
+        current.logger.error(error_msg)
+    else:
+        raise TypeError(error_msg)
+
+
+def report_function_type_errors(func_name: str,
+                                arg_type_check_errors: Dict[str, List[PandasTypeCheckError]],
+                                ret_value_type_check_errors: List[PandasTypeCheckError]) -> None:
+    """Report the type check errors found for the arguments and return value of a function.
+
+    The errors are passed to the configured error sink, if any, and raised as 'TypeError' or logged with a formatted
+    error message (see ``report_type_errors``). If all errors are markers of incomplete type checks, the formatted
+    message is logged as warning instead.
+    """
+    current = current_config()
+    if current.error_sink is not None:
+        current.error_sink.report(func_name, arg_type_check_errors, ret_value_type_check_errors)
+    error_msg = build_exception_message(func_name, arg_type_check_errors, ret_value_type_check_errors)
+    all_errors = [err for errors in arg_type_check_errors.values() for err in errors] + ret_value_type_check_errors
+    # Incomplete type checks without any type errors do not fail
+    if all(err.incomplete for err in all_errors):
+        current.logger.warning(error_msg)
+    else:
+        report_type_errors(error_msg)
+
+
+def is_data_frame(value: Any) -> bool:
+    """Check if the given value is a data frame supported by data frame type check markers.
+
+    Supported data frames are Pandas data frames, Polars data frames and lazy frames, as well as Dask data frames.
+    """
+    return isinstance(value, pd.DataFrame) or is_polars_frame(value) or is_dask_frame(value)
+
+
+SeriesType = Union[str, np.dtype, ExtensionDtype, DtypeClass]  # type: ignore
 if pandera_support:
-    SeriesType = Union[str, np.dtype, ExtensionDtype, pa.SeriesSchema]  # type: ignore
+    SeriesType = Union[str, np.dtype, ExtensionDtype, DtypeClass, pa.SeriesSchema]  # type: ignore
 
 
 class SeriesReturnValue(object):
@@ -62,24 +242,73 @@ class SeriesReturnValue(object):
 
     Attributes:
         dtype:
-            Expected data type for the Series.
+            Expected data type, or dtype class (e.g. ``AnyBackend``), for the Series.
 
             If the library has been installed with Pandera support this attribute can also hold a Pandera
             ``SeriesSchema``. Pandera schemas will be validated lazily to capture all validation errors.
+        coerce:
+            Flag for coercion mode. If enabled a Series whose type differs from the expected type is cast to the
+            expected type instead of failing the type check, provided the cast is on the allow-list of safe casts.
+        index:
+            (Optional) Expected structure of the index of the Series, e.g. its dtype, level names and dtypes,
+            uniqueness or monotonicity.
     """
 
-    def __init__(self, dtype: SeriesType):
+    def __init__(self, dtype: SeriesType, coerce: bool = False, index: Optional[IndexSpec] = None):
         self.dtype = dtype
+        self.coerce = coerce
+        self.index = index
+
+    @property
+    def dtype(self) -> SeriesType:
+        """Expected data type for the Series. Assigning a new data type resets the cached expected type."""
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, dtype: SeriesType):
+        self._dtype = dtype
+        self._expected_type: Optional[Any] = None
 
     @property
     def corresponding_pandas_type(self) -> Type:
         """Get the Pandas type corresponding to this type check decorator argument."""
         return pd.Series
 
+    @property
+    def expected_type(self) -> Any:
+        """Get the expected Pandas dtype of this type specification, unwrapping Pandera series schemas.
+
+        Categorical dtypes are resolved to the ``Categorical`` dtype class. The expected type is resolved once and
+        cached.
+        """
+        if self._expected_type is None:
+            if pandera_support and isinstance(self.dtype, pa.SeriesSchema):
+                self._expected_type = as_dtype_class(self.dtype.dtype.type) if self.dtype.dtype is not None else None
+            else:
+                self._expected_type = as_dtype_class(self.dtype)
+        return self._expected_type
+
+    def coerce_types(self, series: pd.Series) -> pd.Series:
+        """Cast the given Pandas Series to the expected type if the cast is on the allow-list of safe casts.
+
+        Args:
+            series: The Pandas Series to be coerced to this type specification
+
+        Returns:
+            The coerced Series, or the given Series itself if no safe cast applies.
+        """
+        expected_type = self.expected_type
+        if (expected_type is not None and not isinstance(expected_type, DtypeClass) and series.dtype != expected_type
+                and is_safe_cast(series.dtype, expected_type, current_config().safe_casts)):
+            return astype_without_copy(series, expected_type)
+        return series
+
     def type_check(self, series: pd.Series) -> List[PandasTypeCheckError]:
         """Type check the given Pandas Series against this type specification.
 
-        Compare the 'dtype' of the given Pandas Series with the expected 'dtype' defined in this type specification.
+        Compare the 'dtype' of the given Pandas Series with the expected 'dtype' defined in this type specification,
+        and its index with the expected index structure, if any. The elements of object series are checked against
+        the element type of an expected ``ObjectOf`` dtype class.
 
         Args:
             series: The Pandas Series to be type checked against this type check marker
@@ -99,15 +328,32 @@ class SeriesReturnValue(object):
                 pandera_validation_errors = pandera_schema_errors_to_type_check_errors(err)
                 type_check_errors.extend(pandera_validation_errors)
         # Compare dtypes of both series otherwise
-        elif series.dtype != self.dtype:
+        elif not dtype_matches(series.dtype, self.expected_type):
             error_msg = f"Expected Series of type '{self.dtype}' but found type '{series.dtype}'"
             type_check_error = PandasTypeCheckError(error_msg=error_msg,
                                                     expected_type=self.dtype,
                                                     given_type=series.dtype)
             type_check_errors.append(type_check_error)
+        # Check the elements of object series against the expected element type
+        elif isinstance(self.expected_type, ObjectOf):
+            inferred_type = self.expected_type.element_type_error(series)
+            if inferred_type is not None:
+                error_msg = (f"Expected Series with elements of type '{self.expected_type.element_type_name}' "
+                             f"but found inferred type '{inferred_type}'")
+                type_check_errors.append(PandasTypeCheckError(error_msg=error_msg,
+                                                              expected_type=self.dtype,
+                                                              given_type=inferred_type))
+
+        type_check_errors.extend(self.check_index(series))
 
         return type_check_errors
 
+    def check_index(self, series: pd.Series) -> List[PandasTypeCheckError]:
+        """Type check the index of the given Pandas Series against the expected index structure, if any."""
+        if self.index is None:
+            return []
+        return self.index.type_check(series.index)
+
 
 class SeriesArgument(SeriesReturnValue):
     """
@@ -116,20 +362,61 @@ class SeriesArgument(SeriesReturnValue):
     Attributes:
         name: Name of the argument.
         dtype:
-            Expected data type for the Series.
+            Expected data type, or dtype class (e.g. ``AnyBackend``), for the Series.
 
             If the library has been installed with Pandera support this attribute can also hold a Pandera
             ``SeriesSchema``. Pandera schemas will be validated lazily to capture all validation errors.
+        coerce:
+            Flag for coercion mode. If enabled a Series whose type differs from the expected type is cast to the
+            expected type instead of failing the type check, provided the cast is on the allow-list of safe casts.
+            The coerced Series is passed to the decorated function.
+        index:
+            (Optional) Expected structure of the index of the Series, e.g. its dtype, level names and dtypes,
+            uniqueness or monotonicity.
     """
 
-    def __init__(self, name: str, dtype: SeriesType):
-        super().__init__(dtype)
+    def __init__(self, name: str, dtype: SeriesType, coerce: bool = False, index: Optional[IndexSpec] = None):
+        super().__init__(dtype, coerce, index)
         self.name = name
 
 
-DataFrameType = Dict[str, Any]  # type: ignore
+DataFrameType = Union[str, Dict[Any, Any]]  # type: ignore
 if pandera_support:
-    DataFrameType = Union[Dict[str, Any], pa.DataFrameSchema]  # type: ignore
+    DataFrameType = Union[str, Dict[Any, Any], pa.DataFrameSchema]  # type: ignore
+
+
+def resolve_column_types(spec: Any) -> Tuple[Dict[Any, Any], Dict[ColumnPattern, Any]]:
+    """Resolve the expected dtypes of the named columns and the column patterns of a data frame type specification.
+
+    Concrete dtypes are resolved through Pandas, dtype classes are kept as they are. Categorical dtypes are resolved
+    to the ``Categorical`` dtype class. Columns of a Pandera schema without a specified dtype are mapped to None.
+
+    Args:
+        spec: Dict of column name or column pattern -> data type, or Pandera ``DataFrameSchema``
+
+    Returns:
+        The expected dtype of each column specified by name, and the expected dtype for each column pattern.
+    """
+    if pandera_support and isinstance(spec, pa.DataFrameSchema):
+        return {
+            column_name: as_dtype_class(column_type.type) if column_type is not None else None
+            for column_name, column_type in spec.dtypes.items()
+        }, {}
+
+    specified_types: List[Tuple[Any, Any]] = [(key, as_dtype_class(column_type)) for key, column_type in spec.items()]
+    concrete_types = {position: column_type for position, (_, column_type) in enumerate(specified_types)
+                      if not isinstance(column_type, DtypeClass)}
+    reference_data_frame = pd.DataFrame(columns=list(concrete_types)).astype(concrete_types)
+    resolved_types = reference_data_frame.dtypes.to_dict()
+    expected_types = {
+        key: column_type if isinstance(column_type, DtypeClass) else resolved_types[position]
+        for position, (key, column_type) in enumerate(specified_types)
+    }
+    named_column_types = {key: column_type for key, column_type in expected_types.items()
+                          if not isinstance(key, ColumnPattern)}
+    pattern_column_types = {key: column_type for key, column_type in expected_types.items()
+                            if isinstance(key, ColumnPattern)}
+    return named_column_types, pattern_column_types
 
 
 class DataFrameReturnValue(object):
@@ -144,54 +431,215 @@ class DataFrameReturnValue(object):
             Use a single numpy.dtype or Python type to mark that all columns in the DataFrame have the same type.
             Alternatively, use {col: dtype, ...}, where 'col' is a column label and 'dtype' is a numpy.dtype or
             Python type to mark that one or more of the DataFrame's columns have the given column-specific types.
+            Instead of a concrete data type a column can also be specified by a dtype class, e.g. ``AnyBackend``.
+            Instead of a column label a column pattern, e.g. ``Regex``, ``Prefix`` or ``Glob``, can be used to
+            specify the type of all columns whose labels match the pattern and are not specified by name.
 
             If the library has been installed with Pandera support this attribute can also hold a Pandera
             ``DataFrameSchema``. Pandera schemas will be validated lazily to capture all validation errors.
+
+            Alternatively, use the name of a type specification registered in the schema registry.
+        coerce:
+            Flag for coercion mode. If enabled all columns whose types differ from the expected types are cast to
+            the expected types in a single batch instead of failing the type check, provided the casts are on the
+            allow-list of safe casts.
+        validate_partitions:
+            Flag for validating Dask data frames partition by partition. If enabled the type check, including the
+            value checks of a Pandera schema, is attached lazily to each partition of a Dask data frame and runs
+            when the data frame is computed. Dask data frames are only checked structurally otherwise.
+        index:
+            (Optional) Expected structure of the index of the DataFrame, e.g. its dtype, level names and dtypes,
+            uniqueness or monotonicity.
     """
 
-    def __init__(self, dtype: DataFrameType):
+    def __init__(self, dtype: DataFrameType, coerce: bool = False, validate_partitions: bool = False,
+                 index: Optional[IndexSpec] = None):
         self.dtype = dtype
+        self.coerce = coerce
+        self.validate_partitions = validate_partitions
+        self.index = index
+
+    @property
+    def dtype(self) -> DataFrameType:
+        """Expected data type for the DataFrame. Assigning a new data type resets the cached column types."""
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, dtype: DataFrameType):
+        self._dtype = dtype
+        self._expected_column_types: Optional[Mapping[Any, Any]] = None
+        self._column_patterns: Mapping[ColumnPattern, Any] = {}
+        self._pattern_resolver: Optional[PatternResolver] = None
+        # Pandera schema -> (base schema, schema per value check), for time-bounded validation
+        self._split_schema_cache: Optional[Tuple[Any, Tuple[Any, List[Tuple[str, Any]]]]] = None
 
     @property
     def corresponding_pandas_type(self) -> Type:
         """Get the Pandas type corresponding to this type check decorator argument."""
         return pd.DataFrame
 
-    def type_check(self, data_frame: pd.DataFrame, strict: bool) -> List[PandasTypeCheckError]:
+    @property
+    def expected_column_types(self) -> Mapping[Any, Any]:
+        """Get the expected Pandas dtype of each column specified by name in this type specification.
+
+        The dtypes are resolved once and cached. Categorical dtypes are resolved to the ``Categorical`` dtype class.
+        Columns of a Pandera schema without a specified dtype are mapped to None.
+        """
+        if self._expected_column_types is None:
+            self._expected_column_types, self._column_patterns = self._resolve_column_types()
+        return self._expected_column_types
+
+    @property
+    def spec(self) -> Any:
+        """Type specification of this marker, i.e. its data type with schema names resolved through the registry."""
+        if isinstance(self.dtype, str):
+            return schema_registry.get(self.dtype).spec
+        return self.dtype
+
+    @property
+    def checks_values(self) -> bool:
+        """Flag if this type specification checks the values of a data frame, i.e. is a Pandera schema.
+
+        Marks of data frames validated against such a type specification are not trusted, since in-place changes of
+        their values do not change their structure.
+        """
+        return bool(pandera_support) and isinstance(self.spec, pa.DataFrameSchema)
+
+    def _resolve_column_types(self) -> Tuple[Mapping[Any, Any], Mapping[ColumnPattern, Any]]:
+        """Resolve the expected dtypes of the named columns and the column patterns of this type specification.
+
+        Named schemas are compiled once by the schema registry, all markers referencing them share the compiled
+        column types.
+        """
+        if isinstance(self.dtype, str):
+            compiled_schema = schema_registry.get(self.dtype)
+            return compiled_schema.column_types, compiled_schema.column_patterns
+        return resolve_column_types(self.dtype)
+
+    @property
+    def column_patterns(self) -> Mapping[ColumnPattern, Any]:
+        """Get the expected Pandas dtype of the columns matching each column pattern of this type specification."""
+        if self._expected_column_types is None:
+            self._expected_column_types, self._column_patterns = self._resolve_column_types()
+        return self._column_patterns
+
+    @property
+    def pattern_resolver(self) -> Optional[PatternResolver]:
+        """Get the resolver of column names to the column patterns of this type specification, if there are any."""
+        if self._pattern_resolver is None and self.column_patterns:
+            self._pattern_resolver = PatternResolver(set(self.expected_column_types.keys()),
+                                                     list(self.column_patterns.keys()))
+        return self._pattern_resolver
+
+    def expected_types_of_columns(self, columns: Sequence[Any]) -> Dict[Any, Any]:
+        """Get the expected Pandas dtype of each of the given columns, specified by name or by a column pattern.
+
+        Args:
+            columns: Column names of a data frame
+
+        Returns:
+            Column name -> expected dtype for each of the given columns which is part of this type specification.
+        """
+        expected_column_types = self.expected_column_types
+        column_types = {column_name: expected_column_types[column_name]
+                        for column_name in columns if column_name in expected_column_types}
+        pattern_resolver = self.pattern_resolver
+        if pattern_resolver is not None:
+            for pattern, pattern_columns in pattern_resolver.resolve(columns).matched_columns.items():
+                column_types.update(dict.fromkeys(pattern_columns, self.column_patterns[pattern]))
+        return column_types
+
+    def coerce_types(self, data_frame: pd.DataFrame) -> pd.DataFrame:
+        """Cast all columns of the given data frame whose types differ from this type specification.
+
+        All mismatched columns are determined up front and cast with a single 'astype' call. Columns which are
+        not affected by a cast are not copied. Casts which are not on the allow-list of safe casts are skipped,
+        such that the corresponding columns are still reported by the type check.
+
+        Args:
+            data_frame: Pandas data frame to be coerced to this type specification
+
+        Returns:
+            The coerced data frame, or the given data frame itself if no safe cast applies.
+            Casts of Dask data frames are added lazily to their task graph, Polars frames are returned as they are.
+        """
+        if is_polars_frame(data_frame):
+            return data_frame
+
+        safe_casts = current_config().safe_casts
+        given_column_types = data_frame.dtypes
+        column_casts = {
+            column_name: expected_column_type
+            for column_name, expected_column_type in self.expected_types_of_columns(given_column_types.index).items()
+            if expected_column_type is not None and not isinstance(expected_column_type, DtypeClass)
+            and given_column_types[column_name] != expected_column_type
+            and is_safe_cast(given_column_types[column_name], expected_column_type, safe_casts)
+        }
+        if column_casts and is_dask_frame(data_frame):
+            return data_frame.astype(column_casts)
+        if column_casts:
+            return astype_without_copy(data_frame, column_casts)
+        return data_frame
+
+    def type_check(self, data_frame: pd.DataFrame, strict: bool,
+                   time_budget: Optional[float] = None) -> List[PandasTypeCheckError]:
         """Type check the structure of the given data frame against this type specification.
 
+        Polars data frames and lazy frames are checked against their schema, which is resolved without executing
+        the query plan of a lazy frame. Polars dtypes are mapped to Pandas dtypes and compared independent of the
+        storage backend, e.g. a Polars ``Int64`` column conforms to ``int64``, ``Int64`` and ``int64[pyarrow]``.
+        Value checks of Pandera schemas are not evaluated for Polars frames.
+
+        Dask data frames are checked against their metadata, i.e. the empty Pandas data frame describing the
+        structure of their partitions, without triggering any computation.
+
+        The index of the data frame is checked against the expected index structure, if any. The elements of object
+        columns are checked against the element types of expected ``ObjectOf`` dtype classes (see
+        ``check_element_types``).
+
         Args:
-            data_frame: Pandas data frame to type check against this type specification
+            data_frame: Pandas data frame, Polars data frame or lazy frame, or Dask data frame, to type check
+                against this type specification
             strict: Flag for strict type check mode. If strict type checking is enabled the given dataframe
                 cannot contain columns which are not part of this type specification. Disabling strict type
                 checking in that sense allows a form of structural subtyping for data frames.
+            time_budget: (Optional) Time budget in seconds for the value checks of a Pandera schema. Value checks
+                are validated one after another and cut off once the time budget is exceeded, in which case an
+                incomplete marker listing the skipped checks is added to the returned errors (see
+                ``PandasTypeCheckError.incomplete``). Structural checks always complete.
 
         Returns:
             A list of errors which occurred when type checking the given data frame.
             If and only if no type errors are found, this method returns an empty list.
         """
-        type_check_errors: List[PandasTypeCheckError] = []
+        if is_polars_frame(data_frame):
+            return self.check_column_types(polars_column_types(data_frame), strict=strict, any_backend=True)
+        if is_dask_frame(data_frame):
+            return self._check_columns(data_frame._meta, strict, None) + self.check_index(data_frame)
+        return self._check_columns(data_frame, strict, time_budget) + self.check_index(data_frame)
 
-        if pandera_support and isinstance(self.dtype, pa.DataFrameSchema):
-            reference_columns = list(self.dtype.dtypes.keys())
-        else:
-            reference_columns = list(self.dtype.keys())
-
-        if strict:
-            unspecified_columns = set(data_frame.columns).difference(reference_columns)
-            if unspecified_columns:
-                unspecified_column_errors = [
-                    PandasTypeCheckError(error_msg=f"Found unspecified column in data frame: '{unspecified_column}'",
-                                         given_type=data_frame[unspecified_column].dtype,
-                                         column_name=unspecified_column)
-                    for unspecified_column in unspecified_columns
-                ]
-                type_check_errors.extend(unspecified_column_errors)
+    def _check_columns(self, data_frame: pd.DataFrame, strict: bool,
+                       time_budget: Optional[float]) -> List[PandasTypeCheckError]:
+        # Type check the columns of a Pandas data frame, i.e. everything but its index
+        column_types = data_frame.dtypes
 
         # Validate Pandera data frame schema if used as expected data frame type
-        if pandera_support and isinstance(self.dtype, pa.DataFrameSchema):
+        spec = self.spec
+        if pandera_support and isinstance(spec, pa.DataFrameSchema):
+            type_check_errors: List[PandasTypeCheckError] = []
+            if strict:
+                type_check_errors.extend(self.unspecified_column_errors(column_types))
+            if time_budget is not None:
+                # Validate value checks one after another until the time budget is exceeded
+                base_schema, check_schemas = self._split_schema(spec)
+                validation_errors, skipped_checks = validate_before_deadline(base_schema, check_schemas, data_frame,
+                                                                             time.monotonic() + time_budget)
+                type_check_errors.extend(validation_errors)
+                if skipped_checks:
+                    type_check_errors.append(incomplete_validation_error(time_budget, skipped_checks))
+                return type_check_errors
             try:
-                self.dtype.validate(data_frame, lazy=True)
+                spec.validate(data_frame, lazy=True)
             except pa.errors.SchemaErrors as err:
                 # Catch Pandera validation exception and transform it into type check errors
                 pandera_validation_errors = pandera_schema_errors_to_type_check_errors(err)
@@ -200,18 +648,129 @@ class DataFrameReturnValue(object):
             return type_check_errors
 
         # Compare types of each column otherwise
-        reference_data_frame = pd.DataFrame(columns=reference_columns).astype(self.dtype)
-        for column_name in reference_columns:
-            expected_column_type = reference_data_frame[column_name].dtype
+        return self.check_column_types(column_types, strict=strict) + self.check_element_types(data_frame)
 
-            if column_name not in data_frame.columns:
+    def check_element_types(self, data_frame: pd.DataFrame) -> List[PandasTypeCheckError]:
+        """Type check the elements of the object columns specified by an ``ObjectOf`` dtype class, if any.
+
+        Only columns of dtype ``object`` are checked, other dtypes are reported by ``check_column_types``.
+
+        Args:
+            data_frame: Pandas data frame to type check against this type specification
+
+        Returns:
+            A list containing a type check error for each object column whose inferred element type does not conform
+            to the expected element type.
+        """
+        if not any(isinstance(column_type, ObjectOf)
+                   for column_type in (*self.expected_column_types.values(), *self.column_patterns.values())):
+            return []
+
+        type_check_errors: List[PandasTypeCheckError] = []
+        for column_name, expected_column_type in self.expected_types_of_columns(data_frame.columns).items():
+            if not isinstance(expected_column_type, ObjectOf):
+                continue
+            column = data_frame[column_name]
+            if not isinstance(column, pd.Series) or not expected_column_type.matches(column.dtype):
+                continue
+            inferred_type = expected_column_type.element_type_error(column)
+            if inferred_type is not None:
+                error_msg = (f"Expected elements of type '{expected_column_type.element_type_name}' in column "
+                             f"'{column_name}' but found inferred type '{inferred_type}'")
+                type_check_errors.append(PandasTypeCheckError(error_msg=error_msg,
+                                                              expected_type=expected_column_type,
+                                                              given_type=inferred_type,
+                                                              column_name=column_name))
+        return type_check_errors
+
+    def _split_schema(self, schema: Any) -> Tuple[Any, List[Tuple[str, Any]]]:
+        # Split Pandera schemas into a base schema and a schema per value check once, for time-bounded validation.
+        # The schema is compared as well, since schema names are resolved through the registry on each check.
+        split_schema = self._split_schema_cache
+        if split_schema is None or split_schema[0] is not schema:
+            split_schema = (schema, split_data_frame_schema(schema))
+            self._split_schema_cache = split_schema
+        return split_schema[1]
+
+    def check_index(self, data_frame: Any) -> List[PandasTypeCheckError]:
+        """Type check the index of the given data frame against the expected index structure, if any.
+
+        Polars frames have no index and are not checked. Dask data frames are checked against the index of their
+        metadata, i.e. only the dtypes and names of the index are checked. Uniqueness and monotonicity of their index
+        are checked within each partition in partition validation mode, and reported as not checked otherwise.
+        """
+        if self.index is None or is_polars_frame(data_frame):
+            return []
+        if is_dask_frame(data_frame):
+            type_check_errors = self.index.metadata_spec().type_check(data_frame._meta.index)
+            if self.index.checks_values and not self.validate_partitions:
+                type_check_errors.append(PandasTypeCheckError(
+                    error_msg="Index uniqueness and monotonicity of Dask data frames not checked: they are only "
+                              "checked within each partition with 'validate_partitions=True'",
+                    incomplete=True
+                ))
+            return type_check_errors
+        return self.index.type_check(data_frame.index)
+
+    def unspecified_column_errors(self, column_types: Mapping[Any, Any]) -> List[PandasTypeCheckError]:
+        """Find the columns which are not part of this type specification.
+
+        Args:
+            column_types: Column name -> data type of the columns to check, e.g. the 'dtypes' of a data frame
+
+        Returns:
+            A list containing a type check error for each unspecified column.
+        """
+        pattern_resolver = self.pattern_resolver
+        if pattern_resolver is not None:
+            unspecified_columns = pattern_resolver.resolve(list(column_types.keys())).unspecified_columns
+        else:
+            unspecified_columns = [column_name for column_name in column_types.keys()
+                                   if column_name not in self.expected_column_types]
+        return [
+            PandasTypeCheckError(error_msg=f"Found unspecified column in data frame: '{unspecified_column}'",
+                                 given_type=column_types[unspecified_column],
+                                 column_name=unspecified_column)
+            for unspecified_column in unspecified_columns
+        ]
+
+    def check_column_types(self, column_types: Mapping[Any, Any], strict: bool,
+                           any_backend: bool = False) -> List[PandasTypeCheckError]:
+        """Type check the given column types against the column types of this type specification.
+
+        Only the structure is checked, i.e. the presence of columns and their types. Value checks contained in
+        Pandera schemas are not evaluated, and columns of Pandera schemas without a data type are only checked
+        for presence.
+
+        Args:
+            column_types: Column name -> data type of the columns to check, e.g. the 'dtypes' of a data frame
+            strict: Flag for strict type check mode. If strict type checking is enabled the given columns must
+                not contain columns which are not part of this type specification.
+            any_backend: Flag for comparing concrete dtypes independent of their storage backend, i.e. by their
+                logical types
+
+        Returns:
+            A list of errors which occurred when type checking the given column types.
+            If and only if no type errors are found, this method returns an empty list.
+        """
+        type_check_errors: List[PandasTypeCheckError] = []
+
+        # Look up column types in a dict instead of indexing a Series of column types, e.g. the 'dtypes' of a data frame
+        if isinstance(column_types, pd.Series):
+            column_types = dict(zip(column_types.index.tolist(), column_types.tolist()))
+
+        if strict:
+            type_check_errors.extend(self.unspecified_column_errors(column_types))
+
+        for column_name, expected_column_type in self.expected_column_types.items():
+            if column_name not in column_types:
                 type_check_error = PandasTypeCheckError(error_msg=f"Missing column in DataFrame: '{column_name}'",
                                                         expected_type=expected_column_type,
                                                         column_name=column_name)
                 type_check_errors.append(type_check_error)
-            else:
-                column_type = data_frame[column_name].dtype
-                if column_type != expected_column_type:
+            elif expected_column_type is not None:
+                column_type = column_types[column_name]
+                if not dtype_matches(column_type, expected_column_type, any_backend=any_backend):
                     error_msg = (f"Expected type '{expected_column_type}' for column "
                                  f"{column_name}' but found type '{column_type}'")
                     type_check_error = PandasTypeCheckError(error_msg=error_msg,
@@ -220,6 +779,36 @@ class DataFrameReturnValue(object):
                                                             column_name=column_name)
                     type_check_errors.append(type_check_error)
 
+        pattern_resolver = self.pattern_resolver
+        if pattern_resolver is not None:
+            type_check_errors.extend(self._check_pattern_column_types(pattern_resolver, column_types, any_backend))
+
+        return type_check_errors
+
+    def _check_pattern_column_types(self, pattern_resolver: PatternResolver, column_types: Mapping[Any, Any],
+                                    any_backend: bool) -> List[PandasTypeCheckError]:
+        """Type check the columns matching the column patterns of this type specification."""
+        type_check_errors: List[PandasTypeCheckError] = []
+        resolution = pattern_resolver.resolve(list(column_types.keys()))
+
+        for pattern, pattern_columns in resolution.matched_columns.items():
+            expected_column_type = self.column_patterns[pattern]
+            if expected_column_type is None:
+                continue
+            for column_name in pattern_columns:
+                column_type = column_types[column_name]
+                if not dtype_matches(column_type, expected_column_type, any_backend=any_backend):
+                    error_msg = (f"Expected type '{expected_column_type}' for column "
+                                 f"{column_name}' matching {pattern} but found type '{column_type}'")
+                    type_check_errors.append(PandasTypeCheckError(error_msg=error_msg,
+                                                                  expected_type=expected_column_type,
+                                                                  given_type=column_type,
+                                                                  column_name=column_name))
+
+        for pattern, count_error_msg in resolution.count_errors.items():
+            type_check_errors.append(PandasTypeCheckError(error_msg=count_error_msg,
+                                                          expected_type=self.column_patterns[pattern]))
+
         return type_check_errors
 
 
@@ -237,11 +826,55 @@ class DataFrameArgument(DataFrameReturnValue):
             Use a single numpy.dtype or Python type to mark that all columns in the DataFrame have the same type.
             Alternatively, use {col: dtype, ...}, where 'col' is a column label and 'dtype' is a numpy.dtype or
             Python type to mark that one or more of the DataFrame's columns have the given column-specific types.
+            Instead of a concrete data type a column can also be specified by a dtype class, e.g. ``AnyBackend``.
+            Instead of a column label a column pattern, e.g. ``Regex``, ``Prefix`` or ``Glob``, can be used to
+            specify the type of all columns whose labels match the pattern and are not specified by name.
 
             If the library has been installed with Pandera support this attribute can also hold a Pandera
             ``DataFrameSchema``. Pandera schemas will be validated lazily to capture all validation errors.
+
+            Alternatively, use the name of a type specification registered in the schema registry.
+        coerce:
+            Flag for coercion mode. If enabled all columns whose types differ from the expected types are cast to
+            the expected types in a single batch instead of failing the type check, provided the casts are on the
+            allow-list of safe casts. The coerced data frame is passed to the decorated function.
+        validate_partitions:
+            Flag for validating Dask data frames partition by partition. If enabled the type check, including the
+            value checks of a Pandera schema, is attached lazily to each partition of a Dask data frame passed to
+            the decorated function and runs when the data frame is computed. Dask data frames are only checked
+            structurally otherwise.
+        index:
+            (Optional) Expected structure of the index of the DataFrame, e.g. its dtype, level names and dtypes,
+            uniqueness or monotonicity.
+        detect_mutation:
+            (Optional) Mode for detecting in-place mutations of the DataFrame by the decorated function, either
+            'structure' or 'buffers'. If enabled a structural fingerprint of the DataFrame is taken before the call
+            and compared after the call, and added, dropped or retyped columns as well as a changed number of rows
+            are reported as type errors. In mode 'buffers' columns replaced by other data are reported as well.
+            Fingerprints are computed from metadata only, the data frame is never copied.
     """
 
-    def __init__(self, name: str, dtype: DataFrameType):
-        super().__init__(dtype)
+    def __init__(self, name: str, dtype: DataFrameType, coerce: bool = False, validate_partitions: bool = False,
+                 index: Optional[IndexSpec] = None, detect_mutation: Optional[str] = None):
+        if detect_mutation not in (None, 'structure', 'buffers'):
+            raise ValueError(f"Unsupported mutation detection mode '{detect_mutation}'. "
+                             f"Expected 'structure' or 'buffers'.")
+        super().__init__(dtype, coerce, validate_partitions, index)
         self.name = name
+        self.detect_mutation = detect_mutation
+
+    def mutation_fingerprint(self, data_frame: pd.DataFrame) -> Optional[MutationFingerprint]:
+        """Take the fingerprint of the given data frame for detecting in-place mutations, if enabled for this
+        argument. Returns None if mutation detection is disabled or the data frame is not a Pandas data frame."""
+        if self.detect_mutation is None or not isinstance(data_frame, pd.DataFrame):
+            return None
+        return MutationFingerprint(data_frame, buffers=self.detect_mutation == 'buffers')
+
+    @staticmethod
+    def check_mutation(data_frame: pd.DataFrame, fingerprint: MutationFingerprint) -> List[PandasTypeCheckError]:
+        """Check if the given data frame has been mutated in place since the given fingerprint has been taken.
+
+        Returns:
+            A type check error for each structural mutation of the data frame.
+        """
+        return [PandasTypeCheckError(error_msg=error_msg) for error_msg in mutation_errors(fingerprint, data_frame)]
@@ -0,0 +1,64 @@
+import sys
+from typing import Any, Dict, List, Optional
+
+from pandas_type_checks.errors import PandasTypeCheckError
+
+
+def is_dask_frame(value: Any) -> bool:
+    """Check if the given value is a Dask ``DataFrame``.
+
+    Dask is not imported by this check. If Dask has not been imported yet, the value cannot be a Dask data frame.
+    """
+    dask_dataframe = sys.modules.get('dask.dataframe')
+    return dask_dataframe is not None and isinstance(value, dask_dataframe.DataFrame)
+
+
+def validate_partitions(frame: Any, marker: Any, func_name: str, arg_name: Optional[str] = None,
+                        strict: bool = False) -> Any:
+    """Attach the type check of a data frame type check marker lazily to each partition of a Dask data frame.
+
+    The type check is added to the task graph of the Dask data frame as a ``map_partitions`` step. It runs in
+    parallel, partition by partition, when the graph is computed. Type errors found in a partition are raised
+    as ``TypeError``, or logged if the corresponding configuration flag is set, at that point.
+
+    Configuration scopes (see ``config_scope``) are bound to the thread or asyncio task which entered them and do not
+    reach the threads or processes of the Dask scheduler. The configuration in effect when the type check is attached,
+    including the overrides of an entered configuration scope, is therefore captured and used for the type check of
+    each partition. Outside of configuration scopes the partitions are checked with the global configuration of the
+    process computing them.
+
+    Args:
+        frame: Dask data frame whose partitions should be type checked
+        marker: Data frame type check marker, usually holding a Pandera ``DataFrameSchema`` with value checks
+        func_name: Name of the decorated function, used for error messages
+        arg_name: (Optional) Name of the argument holding the Dask data frame. The data frame is treated as
+          return value of the decorated function if no argument name is given.
+        strict: Flag for strict type check mode, applied to each partition
+
+    Returns:
+        The Dask data frame with the type check attached to each partition.
+    """
+    from pandas_type_checks import core
+
+    # Configuration of the entered configuration scope, if any, which is not visible to the Dask scheduler's workers.
+    # The context variable is looked up through the module, since the partition function must be serializable.
+    scoped_config = core._scoped_config.get()
+
+    def validate_partition(partition: Any) -> Any:
+        token = core._scoped_config.set(scoped_config) if scoped_config is not None else None
+        try:
+            type_check_errors: List[PandasTypeCheckError] = marker.type_check(partition, strict=strict)
+            if type_check_errors:
+                arg_type_check_errors: Dict[str, List[PandasTypeCheckError]] = {}
+                ret_value_type_check_errors: List[PandasTypeCheckError] = []
+                if arg_name is not None:
+                    arg_type_check_errors[arg_name] = type_check_errors
+                else:
+                    ret_value_type_check_errors = type_check_errors
+                core.report_function_type_errors(func_name, arg_type_check_errors, ret_value_type_check_errors)
+        finally:
+            if token is not None:
+                core._scoped_config.reset(token)
+        return partition
+
+    return frame.map_partitions(validate_partition, meta=frame._meta)
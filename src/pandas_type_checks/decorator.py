@@ -1,12 +1,21 @@
 import inspect
+import time
+import weakref
 from functools import wraps
-from typing import List, Dict, Optional, Union
+from typing import Callable, List, Dict, MutableMapping, Optional, Tuple, Union
 
 import pandas as pd
 
 from pandas_type_checks.core import DataFrameArgument, DataFrameReturnValue, SeriesArgument, SeriesReturnValue
-from pandas_type_checks.core import config as pandas_type_checks_config
-from pandas_type_checks.errors import PandasTypeCheckError, build_exception_message
+from pandas_type_checks.core import is_data_frame, report_function_type_errors
+from pandas_type_checks.dask_support import is_dask_frame, validate_partitions
+from pandas_type_checks.core import current_config
+from pandas_type_checks.errors import PandasTypeCheckError
+from pandas_type_checks.explain import CheckPlan, explain_type_checks
+from pandas_type_checks.fingerprint import MutationFingerprint
+from pandas_type_checks.type_hints import TypeCheckMarker, annotated_support, markers_from_type_hints
+from pandas_type_checks.recording import RETURN_VALUE, qualified_name, structure_recorder
+from pandas_type_checks.validated import is_validated
 
 
 class PandasTypeCheckDecoratorException(Exception):
@@ -14,50 +23,155 @@ class PandasTypeCheckDecoratorException(Exception):
     pass
 
 
+# Qualified function name -> wrapper of each function decorated with 'pandas_type_check', as long as it is alive, e.g.
+# for finding decorated functions whose type specifications have never been exercised
+decorated_functions: MutableMapping[str, Callable] = weakref.WeakValueDictionary()
+
+
 def pandas_type_check(*args, **kwargs):
     """A decorator for type checking Pandas data frame and series arguments and return value of a function.
 
     Args:
         *args: Type specifications for Pandas data frame and series arguments and return value of the decorated function
 
+    If no type specifications are given, the arguments and return value are type checked against their ``Annotated``
+    type hints, e.g. ``Annotated[pd.DataFrame, {'A': 'int64'}]`` (see ``markers_from_type_hints``). The decorator can
+    then be applied without parentheses, i.e. ``@pandas_type_check``.
+
+    Arguments which are not passed by the caller, i.e. which take their default value, are not type checked.
+
     Keyword Arguments:
-        strict (bool): Flag for strict type check mode. Keyword argument overrides global configuration.
+        strict (bool): Flag for strict type check mode. Keyword argument overrides the current configuration.
             If strict type checking is enabled data frames cannot contain columns which are not part of the type
             specification against which they are checked. Non-strict type checking in that sense allows a form of
             structural subtyping for data frames.
+        time_budget (float): Time budget in seconds for the value checks of Pandera data frame schemas in each type
+            check. Keyword argument overrides the current configuration (see
+            ``PandasTypeCheckConfiguration.validation_time_budget``). Value checks exceeding the time budget are
+            skipped and reported as incomplete. Incomplete type checks without type errors are logged as warning.
+
+    Type check markers created with ``coerce=True`` cast mismatched data frame columns and series to their expected
+    types if the casts are on the allow-list of safe casts (see ``PandasTypeCheckConfiguration.safe_casts``). Coerced
+    arguments are passed to the decorated function and a coerced return value is returned to the caller.
 
     Raises:
         PandasTypeCheckDecoratorException: An error occurred specifying the Pandas types for the arguments and return
             value of the decorated function
         TypeError: Errors occurred when type checking the Pandas data frame and series arguments and return value of
             the decorated function against the given type specifications
+
+    If recording mode is enabled (see ``PandasTypeCheckConfiguration.record_structures``), the structures of all Pandas
+    data frame and series arguments and the return value are recorded in ``structure_recorder``.
+
+    The decorated function exposes ``explain(*sample_args, **sample_kwargs)``, which lists each type check marker, the
+    engine running its type check and the measured cost of each phase on the given sample inputs (see
+    ``explain_type_checks``). The decorated function is called once with the sample inputs, without type checks.
+    ``explain`` is not bound to instances, i.e. the explanation of a method takes the instance as first sample argument,
+    e.g. ``Pipeline.run.explain(pipeline, data)``.
+
+    If shared counters or call statistics are configured (see ``PandasTypeCheckConfiguration.shared_counters`` and
+    ``PandasTypeCheckConfiguration.call_statistics``), each call is counted together with the time spent type checking
+    and whether type errors were found. Call statistics additionally hold the time spent in the decorated function.
     """
 
+    # Bare decorator '@pandas_type_check' without any type check markers
+    if len(args) == 1 and not kwargs and callable(args[0]):
+        return pandas_type_check()(args[0])
+
     def pandas_type_check_decorator(func):
 
+        if not args and not annotated_support:
+            raise PandasTypeCheckDecoratorException(
+                f"No type specifications given for decorated function '{func.__name__}' and 'Annotated' type hints "
+                f"are not supported, install 'typing_extensions'."
+            )
+
+        # Type check markers given to the decorator, or the markers created from the 'Annotated' type hints of the
+        # decorated function if none are given. Type hints are resolved once, on the first call, such that forward
+        # references to names defined after the function can be resolved.
+        type_check_markers: Optional[List[TypeCheckMarker]] = None
+        # Signature of the decorated function for binding the arguments of each call, resolved on the first call
+        func_signature: Optional[inspect.Signature] = None
+
+        def resolve_type_check_markers() -> List[TypeCheckMarker]:
+            nonlocal type_check_markers
+            if type_check_markers is None:
+                if args:
+                    type_check_markers = list(args)
+                else:
+                    try:
+                        type_check_markers = markers_from_type_hints(func)
+                    except Exception as err:
+                        raise PandasTypeCheckDecoratorException(
+                            f"Cannot resolve type hints of decorated function '{func.__name__}': {err}"
+                        ) from err
+            return type_check_markers
+
+        def resolve_signature() -> inspect.Signature:
+            nonlocal func_signature
+            if func_signature is None:
+                func_signature = inspect.signature(func)
+            return func_signature
+
         @wraps(func)
         def pandas_type_check_wrapper(*func_args, **func_kwargs):
-            # Get argument specification of wrapped function
-            func_spec = inspect.getfullargspec(func)
             func_name = func.__name__
 
+            # Resolve the configuration in effect for the current thread or asyncio task once per call
+            pandas_type_checks_config = current_config()
+
+            # Record structures of the Pandas arguments as passed by the caller in recording mode
+            record_structures: bool = pandas_type_checks_config.record_structures
+            if record_structures:
+                structure_recorder.record_arguments(func, func_args, func_kwargs)
+
             # Evaluate query args of the decorator
             strict: bool = kwargs.get('strict', pandas_type_checks_config.strict_type_checks)
+            time_budget: Optional[float] = kwargs.get('time_budget', pandas_type_checks_config.validation_time_budget)
 
             # Argument name -> type check errors found for given argument
             arg_type_check_errors: Dict[str, List[PandasTypeCheckError]] = {}
 
-            def check_pandas_arg(decorator_arg: Union[DataFrameArgument, SeriesArgument]) -> List[PandasTypeCheckError]:
+            # Arguments passed to the wrapped function bound to its parameters, possibly replaced by coerced data
+            # frames and series. Arguments are only bound if type checks are enabled.
+            bound_func_args: Optional[inspect.BoundArguments] = None
+
+            # Argument name -> (data frame passed by the caller, fingerprint) for detecting in-place mutations
+            mutation_fingerprints: Dict[str, Tuple[pd.DataFrame, MutationFingerprint]] = {}
+
+            def check_pandas_arg(decorator_arg: Union[DataFrameArgument, SeriesArgument],
+                                 bound_args: inspect.BoundArguments) -> List[PandasTypeCheckError]:
                 """Type check Pandas DataFrame and Series arguments."""
                 # Check if wrapped function has an argument with the given name
-                if decorator_arg.name in func_spec.args:
+                if decorator_arg.name in resolve_signature().parameters:
+                    # Arguments which are not passed by the caller take their default value and are not checked
+                    if decorator_arg.name not in bound_args.arguments:
+                        return []
                     # Check if argument of wrapped function is a DataFrame
-                    func_arg = func_args[func_spec.args.index(decorator_arg.name)]
-                    if isinstance(decorator_arg, DataFrameArgument) and isinstance(func_arg, pd.DataFrame):
+                    func_arg = bound_args.arguments[decorator_arg.name]
+                    if isinstance(decorator_arg, DataFrameArgument) and is_data_frame(func_arg):
+                        # Take fingerprint of the data frame passed by the caller in mutation detection mode
+                        fingerprint = decorator_arg.mutation_fingerprint(func_arg)
+                        if fingerprint is not None:
+                            mutation_fingerprints[decorator_arg.name] = (func_arg, fingerprint)
+                        # Cast mismatched columns of function argument in coercion mode
+                        if decorator_arg.coerce:
+                            func_arg = bound_args.arguments[decorator_arg.name] = decorator_arg.coerce_types(func_arg)
+                        # Attach type check to each partition of Dask data frames in partition validation mode
+                        if decorator_arg.validate_partitions and is_dask_frame(func_arg):
+                            bound_args.arguments[decorator_arg.name] = validate_partitions(
+                                func_arg, decorator_arg, func_name, decorator_arg.name, strict=strict)
+                        # Skip data frames which have already been validated against a structure-only type
+                        # specification, only their index is checked
+                        if not decorator_arg.checks_values and is_validated(func_arg, decorator_arg.spec):
+                            return decorator_arg.check_index(func_arg)
                         # Compare DataFrame structure of function argument with
                         # the expected structure given in the type check marker
-                        return decorator_arg.type_check(func_arg, strict=strict)
+                        return decorator_arg.type_check(func_arg, strict=strict, time_budget=time_budget)
                     elif isinstance(decorator_arg, SeriesArgument) and isinstance(func_arg, pd.Series):
+                        # Cast function argument in coercion mode
+                        if decorator_arg.coerce:
+                            func_arg = bound_args.arguments[decorator_arg.name] = decorator_arg.coerce_types(func_arg)
                         # Compare Series type of function argument with
                         # the expected type given in the type check marker
                         return decorator_arg.type_check(func_arg)
@@ -72,12 +186,22 @@ def pandas_type_check(*args, **kwargs):
                         f"Decorated function '{func_name}' has no parameter '{decorator_arg.name}'."
                     )
 
+            # Count calls, failures and check time in the shared counters and call statistics, if any
+            shared_counters = pandas_type_checks_config.shared_counters
+            call_statistics = pandas_type_checks_config.call_statistics
+            timed = shared_counters is not None or call_statistics is not None
+            check_time_ns = 0
+
             # Perform type checks for Pandas arguments defined in decorator
             ret_value_type_marker: Optional[Union[DataFrameReturnValue, SeriesReturnValue]] = None
             if pandas_type_checks_config.enable_type_checks:
-                for arg in args:
+                if timed:
+                    check_start_ns = time.perf_counter_ns()
+                bound_func_args = resolve_signature().bind(*func_args, **func_kwargs)
+                for arg in resolve_type_check_markers():
                     if isinstance(arg, (DataFrameArgument, SeriesArgument)):
-                        dataframe_arg_type_check_errors: List[PandasTypeCheckError] = check_pandas_arg(arg)
+                        dataframe_arg_type_check_errors: List[PandasTypeCheckError] = check_pandas_arg(
+                            arg, bound_func_args)
                         if dataframe_arg_type_check_errors:
                             arg_type_check_errors[arg.name] = dataframe_arg_type_check_errors
                     elif isinstance(arg, (DataFrameReturnValue, SeriesReturnValue)):
@@ -94,18 +218,52 @@ def pandas_type_check(*args, **kwargs):
                             f"'{SeriesArgument.__qualname__}', or '{SeriesReturnValue.__qualname__}' but "
                             f"found type '{type(arg).__qualname__}'."
                         )
+                if timed:
+                    check_time_ns += time.perf_counter_ns() - check_start_ns
 
             # Execute wrapped function
-            ret_value = func(*func_args, **func_kwargs)
+            if timed:
+                function_start_ns = time.perf_counter_ns()
+            if bound_func_args is not None:
+                ret_value = func(*bound_func_args.args, **bound_func_args.kwargs)
+            else:
+                ret_value = func(*func_args, **func_kwargs)
+            if timed:
+                function_time_ns = time.perf_counter_ns() - function_start_ns
+            if record_structures:
+                structure_recorder.record(qualified_name(func), RETURN_VALUE, ret_value)
 
             # Perform type checks for Pandas return value defined in decorator
             if pandas_type_checks_config.enable_type_checks:
+                if timed:
+                    check_start_ns = time.perf_counter_ns()
+
+                # Report structural in-place mutations of data frame arguments as type errors of the arguments
+                for arg_name, (func_arg, fingerprint) in mutation_fingerprints.items():
+                    mutation_type_check_errors = DataFrameArgument.check_mutation(func_arg, fingerprint)
+                    if mutation_type_check_errors:
+                        arg_type_check_errors.setdefault(arg_name, []).extend(mutation_type_check_errors)
+
                 ret_value_type_check_errors: List[PandasTypeCheckError] = []
                 if ret_value_type_marker:
-                    if isinstance(ret_value_type_marker, DataFrameReturnValue) and isinstance(ret_value, pd.DataFrame):
-                        # Compare DataFrame structure of return value with the
-                        # expected structure given in the type check marker
-                        ret_value_type_check_errors += ret_value_type_marker.type_check(ret_value, strict=strict)
+                    # Cast return value in coercion mode before handing it to the caller
+                    if ret_value_type_marker.coerce and isinstance(ret_value,
+                                                                   ret_value_type_marker.corresponding_pandas_type):
+                        ret_value = ret_value_type_marker.coerce_types(ret_value)
+                    if isinstance(ret_value_type_marker, DataFrameReturnValue) and is_data_frame(ret_value):
+                        # Compare DataFrame structure of return value with the expected structure given in the
+                        # type check marker, unless it has already been validated against a structure-only type
+                        # specification
+                        if ret_value_type_marker.checks_values or not is_validated(ret_value,
+                                                                                   ret_value_type_marker.spec):
+                            ret_value_type_check_errors += ret_value_type_marker.type_check(ret_value, strict=strict,
+                                                                                            time_budget=time_budget)
+                        else:
+                            ret_value_type_check_errors += ret_value_type_marker.check_index(ret_value)
+                        # Attach type check to each partition of Dask data frames in partition validation mode
+                        if ret_value_type_marker.validate_partitions and is_dask_frame(ret_value):
+                            ret_value = validate_partitions(ret_value, ret_value_type_marker, func_name,
+                                                            strict=strict)
                     elif isinstance(ret_value_type_marker, SeriesReturnValue) and isinstance(ret_value, pd.Series):
                         # Compare Series type of return value with the
                         # expected type given in the type check marker
@@ -118,17 +276,37 @@ def pandas_type_check(*args, **kwargs):
                             f"value of type '{type(ret_value).__qualname__}'."
                         )
 
+                if timed:
+                    check_time_ns += time.perf_counter_ns() - check_start_ns
+                    failed = any(not err.incomplete for errors in arg_type_check_errors.values() for err in errors) \
+                        or any(not err.incomplete for err in ret_value_type_check_errors)
+                    if shared_counters is not None:
+                        shared_counters.record(qualified_name(func), failed, check_time_ns)
+                    if call_statistics is not None:
+                        call_statistics.record(qualified_name(func), failed, check_time_ns, function_time_ns)
+
                 # Raise type error if any type check errors were found for any of the Pandas arguments or return value
                 if arg_type_check_errors or ret_value_type_check_errors:
-                    error_msg = build_exception_message(func_name, arg_type_check_errors, ret_value_type_check_errors)
-                    # Log type errors for Pandas values if the corresponding configuration flag is set
-                    if pandas_type_checks_config.log_type_errors:
-                        pandas_type_checks_config.logger.error(error_msg)
-                    else:
-                        raise TypeError(error_msg)
+                    # Pass type errors to the configured error sink, and log them instead of raising a type error if the
+                    # corresponding configuration flag is set
+                    report_function_type_errors(func_name, arg_type_check_errors, ret_value_type_check_errors)
 
             return ret_value
 
+        def explain(*sample_args, **sample_kwargs) -> CheckPlan:
+            """Explain the type checks of the decorated function on sample inputs, see ``explain_type_checks``.
+
+            Methods take the instance as first sample argument, e.g. ``Pipeline.run.explain(pipeline, data)``.
+            """
+            pandas_type_checks_config = current_config()
+            return explain_type_checks(func, qualified_name(func), resolve_type_check_markers(),
+                                       sample_args, sample_kwargs,
+                                       strict=kwargs.get('strict', pandas_type_checks_config.strict_type_checks),
+                                       time_budget=kwargs.get('time_budget',
+                                                              pandas_type_checks_config.validation_time_budget))
+
+        pandas_type_check_wrapper.explain = explain  # type: ignore[attr-defined]
+        decorated_functions[qualified_name(func)] = pandas_type_check_wrapper
         return pandas_type_check_wrapper
 
     return pandas_type_check_decorator
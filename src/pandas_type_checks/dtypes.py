@@ -0,0 +1,570 @@
+import datetime
+import decimal
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from typing import Any, Dict, FrozenSet, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from pandas.core.dtypes.base import ExtensionDtype
+
+# Arrow-backed extension dtype, available since Pandas 1.5
+ArrowDtype = getattr(pd, 'ArrowDtype', None)
+
+# Maximum number of distinct dtypes whose logical type and compatibility classes are cached, e.g. categorical dtypes
+# with different categories. The caches are cleared once this limit is exceeded.
+MAX_CACHED_DTYPES = 1024
+
+# Concrete dtype -> backend independent logical type
+_logical_types: Dict[Any, str] = {}
+
+
+def _arrow_logical_type(dtype: Any) -> str:
+    import pyarrow as pa
+
+    arrow_type = dtype.pyarrow_dtype
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return 'string'
+    try:
+        pandas_type = pd.api.types.pandas_dtype(arrow_type.to_pandas_dtype())
+    except (NotImplementedError, TypeError):
+        return str(dtype)
+    return str(dtype) if pandas_type == np.dtype('object') else str(pandas_type)
+
+
+def logical_type(dtype: Any) -> str:
+    """Get the backend independent logical type of a Pandas dtype.
+
+    NumPy dtypes, nullable extension dtypes and Arrow-backed dtypes holding the same kind of values are mapped to
+    the same logical type, e.g. ``int64``, ``Int64`` and ``int64[pyarrow]`` are all mapped to ``'int64'`` and
+    ``string``, ``string[pyarrow]`` and ``large_string[pyarrow]`` are mapped to ``'string'``. Only the dtype
+    metadata is inspected, for Arrow-backed dtypes the Arrow type of the column. Logical types are cached per dtype,
+    for at most ``MAX_CACHED_DTYPES`` dtypes.
+
+    Args:
+        dtype: Pandas dtype, or the name of a Pandas dtype
+
+    Returns:
+        The logical type of the given dtype.
+    """
+    try:
+        return _logical_types[dtype]
+    except (KeyError, TypeError):
+        pass
+
+    pandas_type = pd.api.types.pandas_dtype(dtype)
+    if ArrowDtype is not None and isinstance(pandas_type, ArrowDtype):
+        result = _arrow_logical_type(pandas_type)
+    elif isinstance(pandas_type, pd.StringDtype):
+        result = 'string'
+    elif (isinstance(pandas_type, ExtensionDtype) and pandas_type.kind in 'iufb'
+          and getattr(pandas_type, 'numpy_dtype', None) is not None):
+        # Nullable extension dtypes backed by NumPy arrays and a mask, e.g. 'Int64' or 'boolean'
+        result = str(pandas_type.numpy_dtype)
+    else:
+        result = str(pandas_type)
+
+    if len(_logical_types) >= MAX_CACHED_DTYPES:
+        _logical_types.clear()
+    _logical_types[pandas_type] = result
+    if isinstance(dtype, str):
+        _logical_types[dtype] = result
+    return result
+
+
+class DtypeClass(ABC):
+    """
+    Base class for abstract data types which match a class of concrete Pandas dtypes.
+
+    Instances of dtype classes can be used instead of concrete dtypes in the type specifications of data frame and
+    series type check markers. A column or series conforms to a dtype class if its dtype matches the class.
+    """
+
+    @abstractmethod
+    def matches(self, dtype: Any) -> bool:
+        """Check if the given concrete Pandas dtype belongs to this dtype class."""
+
+    @property
+    def concrete_type(self) -> Optional[Any]:
+        """Concrete Pandas dtype of this dtype class used when parsing data, or None if there is no such dtype."""
+        return None
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class AnyBackend(DtypeClass):
+    """
+    Data type matching a dtype in any storage backend, i.e. as NumPy dtype, nullable extension dtype or
+    Arrow-backed dtype. For example ``AnyBackend('int64')`` matches ``int64``, ``Int64`` and ``int64[pyarrow]``.
+
+    Attributes:
+        dtype: Pandas dtype, or the name of a Pandas dtype, in any backend
+    """
+
+    def __init__(self, dtype: Any):
+        self.dtype = dtype
+        self.logical_type = logical_type(dtype)
+
+    def matches(self, dtype: Any) -> bool:
+        return logical_type(dtype) == self.logical_type
+
+    @property
+    def concrete_type(self) -> Optional[Any]:
+        return pd.api.types.pandas_dtype(self.dtype)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, AnyBackend) and other.logical_type == self.logical_type
+
+    def __hash__(self) -> int:
+        return hash((AnyBackend, self.logical_type))
+
+    def __str__(self) -> str:
+        return f"{self.logical_type}[any backend]"
+
+
+# (id(categories), ordered) -> hash of the categories, cached for the lifetime of the categories index
+_category_hashes: Dict[Tuple[int, bool], Tuple[str, int, int]] = {}
+_category_hashes_lock = threading.Lock()
+
+
+def _forget_category_hashes(categories_id: int) -> None:
+    with _category_hashes_lock:
+        _category_hashes.pop((categories_id, False), None)
+        _category_hashes.pop((categories_id, True), None)
+
+
+def category_hash(categories: pd.Index, ordered: bool) -> Tuple[str, int, int]:
+    """Compute a hash of the categories of a categorical dtype.
+
+    Categories of unordered categoricals are hashed independent of their order. The hash is cached per categories
+    index, which is immutable and shared by all categoricals created from the same dtype, such that repeated checks
+    against the same categories take constant time.
+
+    Args:
+        categories: Categories of a categorical dtype
+        ordered: Flag indicating whether the categorical dtype is ordered
+
+    Returns:
+        A hashable tuple of the categories dtype name, the number of categories and the hash of the categories.
+    """
+    key = (id(categories), ordered)
+    cached_hash = _category_hashes.get(key)
+    if cached_hash is not None:
+        return cached_hash
+
+    hashes = pd.util.hash_array(np.asarray(categories))
+    combined_hash = hash(hashes.tobytes()) if ordered else int(np.bitwise_xor.reduce(hashes)) if len(hashes) else 0
+    result = (str(categories.dtype), len(categories), combined_hash)
+    with _category_hashes_lock:
+        if (id(categories), not ordered) not in _category_hashes:
+            weakref.finalize(categories, _forget_category_hashes, id(categories))
+        _category_hashes[key] = result
+    return result
+
+
+class Categorical(DtypeClass):
+    """
+    Data type matching categorical dtypes with a configurable strictness:
+
+    - ``'any'``: Any categorical dtype.
+    - ``'dtype'``: Categorical dtypes whose categories have the given dtype and with the given ordered flag.
+    - ``'exact'``: Categorical dtypes with the given categories and ordered flag. The order of the categories is only
+      relevant for ordered categoricals. Categories are compared by their hashes, which are cached per categories
+      index, such that repeated checks against the same categories take constant time.
+
+    Attributes:
+        categories: (Optional) Expected categories, required for strictness ``'exact'``
+        ordered: Expected ordered flag, ignored for strictness ``'any'``
+        categories_dtype: (Optional) Expected dtype of the categories for strictness ``'dtype'``. Defaults to the
+            dtype of the given categories.
+        strictness: One of ``'any'``, ``'dtype'`` or ``'exact'``. Defaults to ``'exact'`` if categories are given
+            and ``'any'`` otherwise.
+    """
+
+    def __init__(self, categories: Optional[Sequence[Any]] = None, ordered: bool = False,
+                 categories_dtype: Optional[Any] = None, strictness: Optional[str] = None):
+        if strictness is None:
+            strictness = 'any' if categories is None else 'exact'
+        if strictness not in ('any', 'dtype', 'exact'):
+            raise ValueError(f"Unsupported categorical strictness '{strictness}'. "
+                             f"Expected one of 'any', 'dtype' or 'exact'.")
+        if strictness == 'exact' and categories is None:
+            raise ValueError("Categories are required for categorical strictness 'exact'.")
+        if strictness == 'dtype' and categories is None and categories_dtype is None:
+            raise ValueError("Categories or categories dtype are required for categorical strictness 'dtype'.")
+
+        self.ordered = ordered
+        self.strictness = strictness
+        self.categories = None if categories is None else pd.CategoricalDtype(categories, ordered).categories
+        if categories_dtype is not None:
+            self.categories_dtype = pd.api.types.pandas_dtype(categories_dtype)
+        else:
+            self.categories_dtype = None if self.categories is None else self.categories.dtype
+        self._category_hash = None if self.categories is None else category_hash(self.categories, ordered)
+
+    @classmethod
+    def from_dtype(cls, dtype: Any) -> 'Categorical':
+        """Create a dtype class for a categorical dtype given as ``'category'`` or ``CategoricalDtype``.
+
+        Categorical dtypes without categories match any categorical dtype, categorical dtypes with categories only
+        match categorical dtypes with the same categories and ordered flag.
+        """
+        if isinstance(dtype, pd.CategoricalDtype) and dtype.categories is not None:
+            return cls(dtype.categories, dtype.ordered)
+        return cls()
+
+    def matches(self, dtype: Any) -> bool:
+        if not isinstance(dtype, pd.CategoricalDtype):
+            return False
+        if self.strictness == 'any':
+            return True
+        # Categorical dtypes without categories, e.g. mapped from Polars categoricals, only match any categorical
+        if dtype.categories is None or dtype.ordered != self.ordered:
+            return False
+        if self.strictness == 'dtype':
+            return dtype.categories.dtype == self.categories_dtype
+        return category_hash(dtype.categories, dtype.ordered) == self._category_hash
+
+    @property
+    def concrete_type(self) -> Optional[Any]:
+        if self.categories is None:
+            return pd.CategoricalDtype(ordered=self.ordered) if self.strictness == 'dtype' else 'category'
+        return pd.CategoricalDtype(self.categories, self.ordered)
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, Categorical) and other.strictness == self.strictness
+                and other.ordered == self.ordered and other.categories_dtype == self.categories_dtype
+                and other._category_hash == self._category_hash)
+
+    def __hash__(self) -> int:
+        return hash((Categorical, self.strictness, self.ordered, str(self.categories_dtype), self._category_hash))
+
+    def __str__(self) -> str:
+        if self.strictness == 'any':
+            return 'category'
+        if self.strictness == 'dtype':
+            return f"category[{self.categories_dtype}, ordered={self.ordered}]"
+        num_categories = 0 if self.categories is None else len(self.categories)
+        return f"category[{num_categories} categories, ordered={self.ordered}]"
+
+
+# Element type of object columns -> types inferred by 'pd.api.types.infer_dtype' for conforming columns. Columns holding
+# only missing values are inferred as 'empty'.
+_element_types: Dict[Any, FrozenSet[str]] = {
+    str: frozenset({'string', 'empty'}),
+    bytes: frozenset({'bytes', 'empty'}),
+    decimal.Decimal: frozenset({'decimal', 'empty'}),
+    datetime.datetime: frozenset({'datetime', 'empty'}),
+    datetime.date: frozenset({'date', 'empty'}),
+}
+
+# id(root array) -> (data address, length, stride, sample size) -> inferred element type, cached for the lifetime of
+# the root array owning the column buffers
+_inferred_element_types: Dict[int, Dict[Tuple[int, int, int, Optional[int]], str]] = {}
+_inferred_element_types_lock = threading.Lock()
+
+
+def _forget_inferred_element_types(root_id: int) -> None:
+    with _inferred_element_types_lock:
+        _inferred_element_types.pop(root_id, None)
+
+
+def _root_array(values: np.ndarray) -> np.ndarray:
+    # Array owning the memory of a view, e.g. the 2D block array of a data frame column
+    root = values
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    return root
+
+
+def inferred_element_type(values: np.ndarray, sample_size: Optional[int] = None,
+                          random_state: Optional[np.random.Generator] = None) -> str:
+    """Infer the type of the elements of an object array with ``pd.api.types.infer_dtype``, skipping missing values.
+
+    Only a random sample of ``sample_size`` elements, drawn with replacement, is inspected for larger arrays. The
+    inferred type is cached per column buffer, i.e. per memory address, length and stride of the array and the array
+    owning its memory, such that repeated checks of the same column take constant time. Elements changed in place are
+    not detected.
+
+    Args:
+        values: NumPy array of dtype ``object``, e.g. the values of a data frame column
+        sample_size: (Optional) Number of randomly chosen elements to inspect. Defaults to all elements.
+        random_state: (Optional) Random number generator choosing the sample
+
+    Returns:
+        The inferred type, e.g. ``'string'``, ``'bytes'``, ``'decimal'``, ``'datetime'``, ``'empty'`` or ``'mixed'``.
+    """
+    root = _root_array(values)
+    key = (values.__array_interface__['data'][0], len(values), values.strides[0], sample_size)
+    cached_types = _inferred_element_types.get(id(root))
+    cached_type = cached_types.get(key) if cached_types else None
+    if cached_type is not None:
+        return cached_type
+
+    if sample_size is not None and len(values) > sample_size:
+        generator = random_state if random_state is not None else np.random.default_rng()
+        values = values[generator.integers(0, len(values), size=sample_size)]
+    result = pd.api.types.infer_dtype(values, skipna=True)
+    with _inferred_element_types_lock:
+        if id(root) not in _inferred_element_types:
+            _inferred_element_types[id(root)] = {}
+            weakref.finalize(root, _forget_inferred_element_types, id(root))
+        _inferred_element_types[id(root)][key] = result
+    return result
+
+
+class ObjectOf(DtypeClass):
+    """
+    Data type matching columns and series of dtype ``object`` whose elements have a given type, e.g. ``ObjectOf(str)``
+    for strings stored in ``object`` columns. Missing values are allowed.
+
+    The dtype is checked first. The element type is then inferred with ``pd.api.types.infer_dtype`` from a random
+    sample of ``sample_size`` elements, or from all elements if ``sample_size`` is None, and cached per column buffer
+    (see ``inferred_element_type``). The element type ``'mixed'`` allows elements of any types.
+
+    Attributes:
+        element_type: Expected element type, one of ``str``, ``bytes``, ``decimal.Decimal``, ``datetime.datetime``,
+            ``datetime.date`` or ``'mixed'``
+        sample_size: (Optional) Number of randomly chosen elements to inspect. Defaults to 1,000, None inspects all
+            elements.
+        seed: (Optional) Seed of the random number generator choosing the samples
+    """
+
+    def __init__(self, element_type: Union[type, str], sample_size: Optional[int] = 1000, seed: Optional[int] = None):
+        if element_type != 'mixed' and element_type not in _element_types:
+            raise ValueError(f"Unsupported element type '{element_type}'. Expected one of str, bytes, "
+                             f"decimal.Decimal, datetime.datetime, datetime.date or 'mixed'.")
+        self.element_type = element_type
+        self.sample_size = sample_size
+        self.seed = seed
+        self._random_state = np.random.default_rng(seed)
+
+    def matches(self, dtype: Any) -> bool:
+        return dtype == np.dtype('object')
+
+    def element_type_error(self, values: Any) -> Optional[str]:
+        """Check the elements of the given object array or series, whose dtype matches this dtype class.
+
+        Returns:
+            The inferred element type if it does not conform to the expected element type, None otherwise.
+        """
+        if self.element_type == 'mixed':
+            return None
+        inferred_type = inferred_element_type(np.asarray(values), self.sample_size, self._random_state)
+        return None if inferred_type in _element_types[self.element_type] else inferred_type
+
+    @property
+    def element_type_name(self) -> str:
+        return self.element_type if isinstance(self.element_type, str) else self.element_type.__name__
+
+    @property
+    def concrete_type(self) -> Optional[Any]:
+        return np.dtype('object')
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, ObjectOf) and other.element_type == self.element_type
+                and other.sample_size == self.sample_size and other.seed == self.seed)
+
+    def __hash__(self) -> int:
+        return hash((ObjectOf, self.element_type, self.sample_size, self.seed))
+
+    def __str__(self) -> str:
+        return f"object[{self.element_type_name}]"
+
+
+# NumPy dtypes of numeric logical types, in order of their size
+_numeric_dtypes = [np.dtype(name) for name in [
+    'bool', 'int8', 'int16', 'int32', 'int64', 'uint8', 'uint16', 'uint32', 'uint64', 'float16', 'float32', 'float64'
+]]
+
+
+def _logical_type_compatibility_classes(logical_type_name: str) -> FrozenSet[str]:
+    """Get the names of the compatibility classes a logical type belongs to."""
+    if logical_type_name == 'string':
+        return frozenset({'string'})
+    try:
+        numpy_type = np.dtype(logical_type_name)
+    except TypeError:
+        return frozenset()
+    if numpy_type not in _numeric_dtypes:
+        return frozenset()
+
+    classes = {f"widenable to {target_type}" for target_type in _numeric_dtypes
+               if np.can_cast(numpy_type, target_type, casting='safe')}
+    if numpy_type.kind in 'iu':
+        classes.update({'integer', 'numeric', 'signed integer' if numpy_type.kind == 'i' else 'unsigned integer'})
+    elif numpy_type.kind == 'f':
+        classes.update({'float', 'numeric'})
+    return frozenset(classes)
+
+
+# Concrete dtype -> names of the compatibility classes it belongs to. The table is precomputed for NumPy dtypes,
+# nullable extension dtypes and string dtypes, and extended by other dtypes, e.g. Arrow-backed dtypes, on first use.
+_compatibility_classes: Dict[Any, FrozenSet[str]] = {}
+
+
+def _precompute_compatibility_classes() -> None:
+    nullable_dtypes = [pd.BooleanDtype(), pd.Int8Dtype(), pd.Int16Dtype(), pd.Int32Dtype(), pd.Int64Dtype(),
+                       pd.UInt8Dtype(), pd.UInt16Dtype(), pd.UInt32Dtype(), pd.UInt64Dtype(),
+                       pd.Float32Dtype(), pd.Float64Dtype()]
+    for dtype in [*_numeric_dtypes, *nullable_dtypes, pd.StringDtype(), 'string']:
+        classes = _logical_type_compatibility_classes(logical_type(dtype))
+        _compatibility_classes[dtype] = classes
+        _compatibility_classes[str(dtype)] = classes
+
+
+def compatibility_classes(dtype: Any) -> FrozenSet[str]:
+    """Get the names of the compatibility classes of a concrete Pandas dtype, e.g. ``'integer'`` or ``'numeric'``.
+
+    Compatibility classes are looked up in a precomputed table, such that dtype class checks are constant-time
+    dictionary lookups. Dtypes missing from the table are classified by their logical type and added to the table.
+    The table is reset to the precomputed dtypes once it holds ``MAX_CACHED_DTYPES`` dtypes.
+
+    Args:
+        dtype: Pandas dtype, or the name of a Pandas dtype
+
+    Returns:
+        The names of the compatibility classes the given dtype belongs to.
+    """
+    try:
+        return _compatibility_classes[dtype]
+    except (KeyError, TypeError):
+        pass
+
+    classes = _logical_type_compatibility_classes(logical_type(dtype))
+    if len(_compatibility_classes) >= MAX_CACHED_DTYPES:
+        _compatibility_classes.clear()
+        _precompute_compatibility_classes()
+    try:
+        _compatibility_classes[dtype] = classes
+    except TypeError:
+        pass
+    return classes
+
+
+_precompute_compatibility_classes()
+
+
+class CompatibilityClass(DtypeClass):
+    """
+    Base class for dtype classes matching all dtypes of a compatibility class, e.g. all integer dtypes.
+
+    Dtypes are matched independent of their storage backend, i.e. NumPy dtypes, nullable extension dtypes and
+    Arrow-backed dtypes of the same kind belong to the same compatibility classes.
+
+    Attributes:
+        name: Name of the compatibility class
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def matches(self, dtype: Any) -> bool:
+        return self.name in compatibility_classes(dtype)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, CompatibilityClass) and other.name == self.name
+
+    def __hash__(self) -> int:
+        return hash((CompatibilityClass, self.name))
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class AnyInteger(CompatibilityClass):
+    """
+    Data type matching integer dtypes of any size, nullable or not.
+
+    Attributes:
+        signed: (Optional) Set to True to match only signed, or to False to match only unsigned integer dtypes.
+            Defaults to matching both.
+    """
+
+    def __init__(self, signed: Optional[bool] = None):
+        super().__init__('integer' if signed is None else 'signed integer' if signed else 'unsigned integer')
+        self.signed = signed
+
+
+class AnyFloat(CompatibilityClass):
+    """
+    Data type matching floating point dtypes of any size, nullable or not.
+    """
+
+    def __init__(self):
+        super().__init__('float')
+
+
+class Numeric(CompatibilityClass):
+    """
+    Data type matching integer and floating point dtypes of any size, nullable or not. Boolean dtypes do not match.
+    """
+
+    def __init__(self):
+        super().__init__('numeric')
+
+
+class AnyString(CompatibilityClass):
+    """
+    Data type matching string dtypes of any storage, i.e. ``string``, ``string[pyarrow]`` and Arrow-backed strings.
+    Columns of dtype ``object`` do not match, even if they hold strings.
+    """
+
+    def __init__(self):
+        super().__init__('string')
+
+
+class WidenableTo(CompatibilityClass):
+    """
+    Data type matching numeric dtypes which can be widened to a target dtype according to NumPy's safe casting rules.
+    For example ``WidenableTo('int64')`` matches ``int8``, ``uint32`` and ``Int64``, but neither ``uint64`` nor
+    ``float32``.
+
+    Attributes:
+        dtype: Numeric target dtype, or the name of a numeric target dtype, in any backend
+    """
+
+    def __init__(self, dtype: Any):
+        target_type = logical_type(dtype)
+        if f"widenable to {target_type}" not in compatibility_classes(target_type):
+            raise ValueError(f"Unsupported target dtype '{dtype}'. Expected a numeric dtype.")
+        super().__init__(f"widenable to {target_type}")
+        self.dtype = dtype
+
+    @property
+    def concrete_type(self) -> Optional[Any]:
+        return pd.api.types.pandas_dtype(self.dtype)
+
+
+def as_dtype_class(dtype: Any) -> Any:
+    """Replace categorical dtypes in type specifications by the corresponding ``Categorical`` dtype class.
+
+    Args:
+        dtype: Expected dtype of a data frame column or series as given in a type specification
+
+    Returns:
+        A ``Categorical`` dtype class for ``'category'`` and ``CategoricalDtype``, the given dtype otherwise.
+    """
+    if isinstance(dtype, pd.CategoricalDtype) or (isinstance(dtype, str) and dtype == 'category'):
+        return Categorical.from_dtype(dtype)
+    return dtype
+
+
+def dtype_matches(given_type: Any, expected_type: Any, any_backend: bool = False) -> bool:
+    """Check if a given concrete Pandas dtype conforms to an expected dtype or dtype class.
+
+    Args:
+        given_type: Actual dtype of a data frame column or series
+        expected_type: Expected dtype, or an instance of a dtype class
+        any_backend: Flag for comparing concrete dtypes by their logical types, i.e. independent of their backend
+
+    Returns:
+        True if the given dtype conforms to the expected dtype, False otherwise.
+    """
+    if isinstance(expected_type, DtypeClass):
+        return expected_type.matches(given_type)
+    if any_backend:
+        return logical_type(given_type) == logical_type(expected_type)
+    return given_type == expected_type
@@ -0,0 +1,166 @@
+import atexit
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pandas_type_checks.errors import ERROR_RECORD_FIELDS, ErrorSink
+
+# Arrow schema of the files written by the Arrow error sink
+ERROR_RECORD_SCHEMA = pa.schema([
+    pa.field('timestamp', pa.timestamp('us', tz='UTC')),
+    pa.field('function', pa.string()),
+    pa.field('argument', pa.string()),
+    pa.field('kind', pa.string()),
+    pa.field('column', pa.string()),
+    pa.field('expected_type', pa.string()),
+    pa.field('given_type', pa.string()),
+    pa.field('message', pa.string()),
+    pa.field('incomplete', pa.bool_())
+])
+
+# File suffix for each supported file format
+FILE_SUFFIXES = {'parquet': '.parquet', 'ipc': '.arrow'}
+
+logger = logging.getLogger('pandas_type_checks')
+
+
+def _empty_buffer() -> Dict[str, List[Any]]:
+    return {field: [] for field in ERROR_RECORD_FIELDS}
+
+
+class ArrowErrorSink(ErrorSink):
+    """
+    Error sink buffering type check errors as structured records in columnar batches and writing them to Arrow IPC or
+    Parquet files on a background thread.
+
+    Reporting a type error only appends its fields to in-memory columns. Buffered records are written as a single
+    record batch once ``batch_size`` records have been buffered, or every ``flush_interval`` seconds. At most
+    ``max_buffered_records`` records are buffered, further records are dropped and counted in ``dropped_records``
+    until the buffer has been written. A new file is started once the current file holds ``max_file_records``
+    records. Files are named '<file_prefix>-<creation time>-<sequence number>' with the suffix '.parquet' or '.arrow'.
+
+    Parquet files are only complete once they have been closed, i.e. after rotation or after closing the sink. The
+    sink is closed when the interpreter exits.
+
+    Attributes:
+        directory: Directory of the written files
+        file_format: File format, either 'parquet' or 'ipc' (Arrow IPC file format)
+        batch_size: Number of buffered records triggering a write. Defaults to 10,000.
+        flush_interval: Maximum number of seconds between writes of buffered records. Defaults to 10 seconds.
+        max_buffered_records: Maximum number of buffered records. Defaults to 1,000,000.
+        max_file_records: Number of records per file after which a new file is started. Defaults to 1,000,000.
+        file_prefix: Prefix of the file names. Defaults to 'type_check_errors'.
+        dropped_records: Number of records dropped because the buffer was full or the sink had been closed
+        files: Paths of all files written by the sink
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike],
+                 file_format: str = 'parquet',
+                 batch_size: int = 10_000,
+                 flush_interval: float = 10.0,
+                 max_buffered_records: int = 1_000_000,
+                 max_file_records: int = 1_000_000,
+                 file_prefix: str = 'type_check_errors'):
+        if file_format not in FILE_SUFFIXES:
+            raise ValueError(f"Unsupported error sink file format '{file_format}'. Expected 'parquet' or 'ipc'.")
+        self.directory = Path(directory)
+        self.file_format = file_format
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffered_records = max_buffered_records
+        self.max_file_records = max_file_records
+        self.file_prefix = file_prefix
+        self.dropped_records = 0
+        self.files: List[Path] = []
+
+        # Buffer of records not written yet, guarded by the buffer lock
+        self._buffer = _empty_buffer()
+        self._num_buffered_records = 0
+        self._closed = False
+        self._buffer_lock = threading.Lock()
+
+        # Writer of the current file, guarded by the write lock
+        self._writer: Optional[Any] = None
+        self._num_file_records = 0
+        self._write_lock = threading.Lock()
+
+        self._flush_requested = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self, records: Dict[str, List[Any]]) -> None:
+        num_records = len(records['message'])
+        with self._buffer_lock:
+            if self._closed or self._num_buffered_records + num_records > self.max_buffered_records:
+                self.dropped_records += num_records
+                return
+            for field, values in records.items():
+                self._buffer[field].extend(values)
+            self._num_buffered_records += num_records
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='pandas-type-checks-error-sink', daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+            if self._num_buffered_records >= self.batch_size:
+                self._flush_requested.set()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to write type check error records")
+
+    def flush(self) -> None:
+        with self._write_lock:
+            with self._buffer_lock:
+                if self._num_buffered_records == 0:
+                    return
+                buffer, self._buffer = self._buffer, _empty_buffer()
+                num_records, self._num_buffered_records = self._num_buffered_records, 0
+
+            writer = self._writer
+            if writer is None or self._num_file_records >= self.max_file_records:
+                writer = self._open_next_file()
+            # Parquet and Arrow IPC file writers both write tables as record batches
+            writer.write_table(pa.Table.from_pydict(buffer, schema=ERROR_RECORD_SCHEMA))
+            self._num_file_records += num_records
+
+    def _open_next_file(self) -> Any:
+        self._close_writer()
+        created_at = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')
+        file_name = f"{self.file_prefix}-{created_at}-{len(self.files):05d}{FILE_SUFFIXES[self.file_format]}"
+        path = self.directory / file_name
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self.file_format == 'parquet':
+            self._writer = pq.ParquetWriter(path, ERROR_RECORD_SCHEMA)
+        else:
+            self._writer = pa.ipc.new_file(path, ERROR_RECORD_SCHEMA)
+        self._num_file_records = 0
+        self.files.append(path)
+        return self._writer
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def close(self) -> None:
+        with self._buffer_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._flush_requested.set()
+        if self._thread is not None:
+            self._thread.join()
+            atexit.unregister(self.close)
+        self.flush()
+        with self._write_lock:
+            self._close_writer()
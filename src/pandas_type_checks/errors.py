@@ -1,4 +1,6 @@
-from typing import List, Dict, Optional, Any
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import List, Dict, Optional, Any, Tuple
 
 import pandas as pd
 
@@ -17,18 +19,23 @@ class PandasTypeCheckError(object):
                                by the Pandera data frame or series validation.
                                This attribute effectively contains the 'failure_cases'
                                property of a
+        incomplete: Flag marking that the type check has not been completed, e.g. because its value-level
+                    validation exceeded its time budget. Incomplete markers are reported together with the
+                    type errors found, but they are not type errors themselves.
     """
 
     def __init__(self, error_msg: str,
                  expected_type: Optional[Any] = None,
                  given_type: Optional[Any] = None,
                  column_name: Optional[str] = None,
-                 pandera_failure_cases: Optional[pd.DataFrame] = None):
+                 pandera_failure_cases: Optional[pd.DataFrame] = None,
+                 incomplete: bool = False):
         self.error_msg = error_msg
         self.expected_type = expected_type
         self.given_type = given_type
         self.column_name = column_name
         self.pandera_failure_cases = pandera_failure_cases
+        self.incomplete = incomplete
 
 
 def build_exception_message(func_name: str,
@@ -60,3 +67,76 @@ def build_exception_message(func_name: str,
         exec_msg.append("Type error in return value:\n" + "\n".join(type_check_error_msgs))
 
     return "\n".join(exec_msg)
+
+
+# Fields of the structured records of type check errors passed to error sinks
+ERROR_RECORD_FIELDS = ('timestamp', 'function', 'argument', 'kind', 'column', 'expected_type', 'given_type', 'message',
+                       'incomplete')
+
+
+def build_error_records(func_name: str,
+                        arg_type_check_errors: Dict[str, List[PandasTypeCheckError]],
+                        ret_value_type_check_errors: List[PandasTypeCheckError],
+                        timestamp: Optional[datetime] = None) -> Dict[str, List[Any]]:
+    """
+    Build structured records for all the given type check errors, in columnar layout.
+
+    Args:
+        func_name: Name of the function in which the type errors occurred
+        arg_type_check_errors: Dictionary containing the type check errors found for all
+          arguments of an annotated function
+        ret_value_type_check_errors: list containing the type check errors found for the
+          return value of an annotated function
+        timestamp: (Optional) Time at which the type errors occurred. Defaults to the current UTC time.
+
+    Returns:
+        A dict of record field -> list of values, with one value per type check error for each of the fields in
+        ``ERROR_RECORD_FIELDS``. The kind of an error is either 'argument' or 'return_value', the argument is None
+        for return values. Column names and types are given as strings, or None if not applicable. The flag
+        'incomplete' marks markers of incomplete type checks, which are not type errors themselves.
+    """
+    timestamp = timestamp if timestamp is not None else datetime.now(timezone.utc)
+    records: Dict[str, List[Any]] = {field: [] for field in ERROR_RECORD_FIELDS}
+    errors: List[Tuple[Optional[str], str, PandasTypeCheckError]] = [
+        (arg_name, 'argument', err) for arg_name, type_check_errors in arg_type_check_errors.items()
+        for err in type_check_errors
+    ]
+    errors += [(None, 'return_value', err) for err in ret_value_type_check_errors]
+    for arg_name, kind, err in errors:
+        records['timestamp'].append(timestamp)
+        records['function'].append(func_name)
+        records['argument'].append(arg_name)
+        records['kind'].append(kind)
+        records['column'].append(str(err.column_name) if err.column_name is not None else None)
+        records['expected_type'].append(str(err.expected_type) if err.expected_type is not None else None)
+        records['given_type'].append(str(err.given_type) if err.given_type is not None else None)
+        records['message'].append(err.error_msg)
+        records['incomplete'].append(err.incomplete)
+    return records
+
+
+class ErrorSink(ABC):
+    """
+    Base class for sinks receiving all type check errors as structured records, see
+    ``PandasTypeCheckConfiguration.error_sink``.
+
+    Subclasses implement ``write`` for the records of the type errors found in a single function call.
+    """
+
+    def report(self, func_name: str,
+               arg_type_check_errors: Dict[str, List[PandasTypeCheckError]],
+               ret_value_type_check_errors: List[PandasTypeCheckError]) -> None:
+        """Report the type check errors found for the arguments and return value of a function."""
+        self.write(build_error_records(func_name, arg_type_check_errors, ret_value_type_check_errors))
+
+    @abstractmethod
+    def write(self, records: Dict[str, List[Any]]) -> None:
+        """Write the given error records in columnar layout, i.e. as dict of record field -> list of values."""
+
+    def flush(self) -> None:
+        """Write all buffered error records."""
+        pass
+
+    def close(self) -> None:
+        """Write all buffered error records and release all resources of the sink."""
+        pass
@@ -0,0 +1,242 @@
+import inspect
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from pandas_type_checks.core import DataFrameArgument, DataFrameReturnValue, SeriesArgument, SeriesReturnValue
+from pandas_type_checks.core import pandera_support
+from pandas_type_checks.dask_support import is_dask_frame
+from pandas_type_checks.errors import PandasTypeCheckError
+from pandas_type_checks.polars_support import is_polars_frame
+from pandas_type_checks.type_hints import TypeCheckMarker
+from pandas_type_checks.validated import is_validated
+if pandera_support:
+    import pandera as pa
+    from pandas_type_checks.pandera_support import pandera_schema_errors_to_type_check_errors
+    from pandas_type_checks.pandera_support import validate_before_deadline
+
+
+class ExplainedMarker(object):
+    """
+    Check plan of a single type check marker and the measured cost of each phase on a sample input.
+
+    Attributes:
+        target: Checked value, i.e. ``'argument <name>'`` or ``'return value'``
+        marker: Type check marker
+        engine: Engine running the type check, e.g. ``'dict structural'``, ``'pandera'`` or ``'cached'``
+        details: Size of the type specification, e.g. the number of columns or Pandera checks
+        phases: List of (phase name, measured seconds) in the order the phases run
+        num_errors: Number of type errors found on the sample input
+    """
+
+    def __init__(self, target: str, marker: TypeCheckMarker, engine: str, details: str = ''):
+        self.target = target
+        self.marker = marker
+        self.engine = engine
+        self.details = details
+        self.phases: List[Tuple[str, float]] = []
+        self.num_errors = 0
+
+    @property
+    def check_time(self) -> float:
+        """Total measured seconds of all phases."""
+        return sum(seconds for _, seconds in self.phases)
+
+    def measure(self, phase: str, func: Callable[[], Any]) -> Any:
+        """Run and time a phase, counting the type errors it returns."""
+        start = time.perf_counter()
+        result = func()
+        self.phases.append((phase, time.perf_counter() - start))
+        if isinstance(result, list) and all(isinstance(err, PandasTypeCheckError) for err in result):
+            self.num_errors += len(result)
+        return result
+
+
+class CheckPlan(object):
+    """
+    Check plan of a function decorated with ``pandas_type_check`` and the measured cost of each phase on sample
+    inputs, created by ``explain`` of the decorated function.
+
+    Attributes:
+        function_name: Qualified name of the decorated function
+        markers: Explained type check markers in the order they run
+        function_time: Measured seconds of the call of the undecorated function
+    """
+
+    def __init__(self, function_name: str):
+        self.function_name = function_name
+        self.markers: List[ExplainedMarker] = []
+        self.function_time = 0.0
+
+    @property
+    def check_time(self) -> float:
+        """Total measured seconds of all type check phases."""
+        return sum(marker.check_time for marker in self.markers)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'function': self.function_name,
+            'function_time': self.function_time,
+            'check_time': self.check_time,
+            'markers': [{'target': marker.target, 'marker': type(marker.marker).__name__, 'engine': marker.engine,
+                         'details': marker.details, 'phases': dict(marker.phases), 'num_errors': marker.num_errors}
+                        for marker in self.markers]
+        }
+
+    def __str__(self) -> str:
+        lines = [f"Check plan of '{self.function_name}': check time {1000 * self.check_time:.3f} ms, "
+                 f"function time {1000 * self.function_time:.3f} ms"]
+        for marker in self.markers:
+            details = f" ({marker.details})" if marker.details else ''
+            lines.append(f"  {marker.target}: {type(marker.marker).__name__}, {marker.engine}{details}, "
+                         f"{marker.num_errors} type errors")
+            for phase, seconds in marker.phases:
+                lines.append(f"    {phase:<30} {1000 * seconds:10.3f} ms")
+        return '\n'.join(lines)
+
+
+def _data_frame_engine(marker: DataFrameReturnValue, data_frame: Any) -> Tuple[str, str]:
+    # Engine and specification size of the type check of a data frame
+    if is_polars_frame(data_frame):
+        return 'polars schema', f"{len(marker.expected_column_types)} columns"
+    if is_dask_frame(data_frame):
+        return 'dask metadata', f"{len(marker.expected_column_types)} columns"
+    spec = marker.spec
+    if pandera_support and isinstance(spec, pa.DataFrameSchema):
+        num_checks = len(spec.checks) + sum(len(column.checks) for column in spec.columns.values())
+        details = f"{len(spec.columns)} columns, {num_checks} checks"
+        return 'pandera', details
+    details = f"{len(marker.expected_column_types)} columns"
+    if marker.column_patterns:
+        details += f", {len(marker.column_patterns)} column patterns"
+    return ('cached' if is_validated(data_frame, spec) else 'dict structural'), details
+
+
+def _validate_pandera_schema(schema: Any, data_frame: pd.DataFrame) -> List[PandasTypeCheckError]:
+    try:
+        schema.validate(data_frame, lazy=True)
+    except pa.errors.SchemaErrors as err:
+        return pandera_schema_errors_to_type_check_errors(err)
+    return []
+
+
+def _explain_data_frame(explained: ExplainedMarker, marker: DataFrameReturnValue, data_frame: Any, strict: bool,
+                        time_budget: Optional[float]) -> Any:
+    # Time each phase of the type check of a data frame and return the data frame passed on, i.e. the coerced frame
+    if marker.coerce:
+        data_frame = explained.measure('coerce', lambda: marker.coerce_types(data_frame))
+    if explained.engine in ('polars schema', 'dask metadata'):
+        explained.measure('schema', lambda: marker.type_check(data_frame, strict=strict))
+        if marker.validate_partitions and is_dask_frame(data_frame):
+            explained.phases.append(('partitions (deferred)', 0.0))
+        return data_frame
+    if explained.engine == 'cached':
+        explained.measure('index', lambda: marker.check_index(data_frame))
+        return data_frame
+
+    column_types = explained.measure('dtypes', lambda: data_frame.dtypes)
+    if strict:
+        explained.measure('strict column scan', lambda: marker.unspecified_column_errors(column_types))
+    if explained.engine == 'pandera':
+        spec = marker.spec
+        if time_budget is None:
+            explained.measure('pandera validation', lambda: _validate_pandera_schema(spec, data_frame))
+        else:
+            base_schema, check_schemas = marker._split_schema(spec)
+            validation_errors, skipped_checks = explained.measure(
+                'pandera validation', lambda: validate_before_deadline(base_schema, check_schemas, data_frame,
+                                                                       time.monotonic() + time_budget))
+            explained.num_errors += len(validation_errors)
+            if skipped_checks:
+                explained.details += f", {len(skipped_checks)} checks skipped by time budget"
+    else:
+        explained.measure('column types', lambda: marker.check_column_types(column_types, strict=False))
+        explained.measure('element types', lambda: marker.check_element_types(data_frame))
+    explained.measure('index', lambda: marker.check_index(data_frame))
+    return data_frame
+
+
+def _explain_series(explained: ExplainedMarker, marker: SeriesReturnValue, series: pd.Series) -> pd.Series:
+    # Time each phase of the type check of a series and return the series passed on, i.e. the coerced series
+    if marker.coerce:
+        series = explained.measure('coerce', lambda: marker.coerce_types(series))
+    explained.measure('series type', lambda: marker.type_check(series))
+    return series
+
+
+def _series_engine(marker: SeriesReturnValue) -> str:
+    if pandera_support and isinstance(marker.dtype, pa.SeriesSchema):
+        return 'pandera'
+    return 'dtype'
+
+
+def explain_type_checks(func: Callable, function_name: str, markers: Sequence[TypeCheckMarker],
+                        args: Sequence[Any], kwargs: Dict[str, Any], strict: bool,
+                        time_budget: Optional[float]) -> CheckPlan:
+    """Explain the type checks of a decorated function by running each phase once on sample inputs.
+
+    The undecorated function is called once with the sample inputs, after coercion, to obtain the return value. Each
+    phase is measured once, i.e. including the cost of cache misses on first use.
+
+    Args:
+        func: Undecorated function
+        function_name: Qualified name of the function
+        markers: Resolved type check markers of the function
+        args: Sample positional arguments
+        kwargs: Sample keyword arguments
+        strict: Flag for strict type check mode
+        time_budget: (Optional) Time budget in seconds for the value checks of Pandera schemas
+
+    Returns:
+        The check plan of the function with the measured cost of each phase.
+    """
+    plan = CheckPlan(function_name)
+    bound_args = inspect.signature(func).bind(*args, **kwargs)
+
+    ret_value_marker: Optional[TypeCheckMarker] = None
+    mutation_fingerprints = []
+    for marker in markers:
+        if not isinstance(marker, (DataFrameArgument, SeriesArgument)):
+            ret_value_marker = marker
+            continue
+        value = bound_args.arguments.get(marker.name)
+        if not isinstance(value, marker.corresponding_pandas_type) and not (
+                isinstance(marker, DataFrameArgument) and (is_polars_frame(value) or is_dask_frame(value))):
+            explained = ExplainedMarker(f"argument {marker.name}", marker, 'not applicable',
+                                        f"value of type '{type(value).__qualname__}'")
+        elif isinstance(marker, DataFrameArgument):
+            engine, details = _data_frame_engine(marker, value)
+            explained = ExplainedMarker(f"argument {marker.name}", marker, engine, details)
+            fingerprint = explained.measure('mutation fingerprint', lambda: marker.mutation_fingerprint(value)) \
+                if marker.detect_mutation is not None else None
+            bound_args.arguments[marker.name] = _explain_data_frame(explained, marker, value, strict, time_budget)
+            if fingerprint is not None:
+                mutation_fingerprints.append((explained, value, fingerprint))
+        else:
+            explained = ExplainedMarker(f"argument {marker.name}", marker, _series_engine(marker))
+            bound_args.arguments[marker.name] = _explain_series(explained, marker, value)
+        plan.markers.append(explained)
+
+    start = time.perf_counter()
+    ret_value = func(*bound_args.args, **bound_args.kwargs)
+    plan.function_time = time.perf_counter() - start
+
+    for explained, value, fingerprint in mutation_fingerprints:
+        explained.measure('mutation check', lambda: DataFrameArgument.check_mutation(value, fingerprint))
+
+    if ret_value_marker is not None and not isinstance(ret_value, ret_value_marker.corresponding_pandas_type) and \
+            not (is_polars_frame(ret_value) or is_dask_frame(ret_value)):
+        plan.markers.append(ExplainedMarker('return value', ret_value_marker, 'not applicable',
+                                            f"value of type '{type(ret_value).__qualname__}'"))
+    elif isinstance(ret_value_marker, DataFrameReturnValue):
+        engine, details = _data_frame_engine(ret_value_marker, ret_value)
+        explained = ExplainedMarker('return value', ret_value_marker, engine, details)
+        _explain_data_frame(explained, ret_value_marker, ret_value, strict, time_budget)
+        plan.markers.append(explained)
+    elif isinstance(ret_value_marker, SeriesReturnValue):
+        explained = ExplainedMarker('return value', ret_value_marker, _series_engine(ret_value_marker))
+        _explain_series(explained, ret_value_marker, ret_value)
+        plan.markers.append(explained)
+
+    return plan
@@ -0,0 +1,107 @@
+from typing import Any, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+StructuralFingerprint = Tuple[Tuple[Any, ...], Tuple[Any, ...]]
+
+# Extension array wrapping NumPy arrays, named 'PandasArray' before Pandas 2.1
+_NumpyExtensionArray = getattr(pd.arrays, 'NumpyExtensionArray', None) or getattr(pd.arrays, 'PandasArray')
+
+
+def structural_fingerprint(data_frame: pd.DataFrame) -> StructuralFingerprint:
+    """Compute a hashable fingerprint of the structure of a data frame.
+
+    The fingerprint consists of the column labels and the column dtypes of the data frame.
+    It is computed from metadata only, no column data is accessed or copied.
+
+    Args:
+        data_frame: Pandas data frame to compute the fingerprint for
+
+    Returns:
+        A tuple containing the tuple of column labels and the tuple of column dtypes.
+    """
+    return tuple(data_frame.columns.tolist()), tuple(data_frame.dtypes.tolist())
+
+
+class MutationFingerprint(object):
+    """
+    Fingerprint of the structure of a data frame for detecting in-place mutations, e.g. by a function it is passed to.
+
+    The fingerprint holds a reference to the (immutable) column index of the data frame, its column dtypes and shape,
+    and optionally the addresses of the buffers backing its columns. It is computed from metadata only, no column data
+    is accessed or copied.
+
+    Attributes:
+        columns: Column index of the data frame
+        column_types: Tuple of column dtypes
+        shape: Shape of the data frame
+        buffers: (Optional) Tuple of buffer addresses, or array identities for arrays not backed by a NumPy array,
+            of the columns
+    """
+
+    def __init__(self, data_frame: pd.DataFrame, buffers: bool = False):
+        self.columns = data_frame.columns
+        self.column_types = tuple(data_frame.dtypes.tolist())
+        self.shape = data_frame.shape
+        self.buffers = _buffer_addresses(data_frame) if buffers else None
+
+
+def _column_arrays(data_frame: pd.DataFrame) -> Iterable[Any]:
+    # Iterate over the column arrays directly if supported by Pandas, which avoids creating a series for each column
+    iter_column_arrays = getattr(data_frame, '_iter_column_arrays', None)
+    if iter_column_arrays is not None:
+        return iter_column_arrays()
+    return (column.array for _, column in data_frame.items())
+
+
+def _buffer_addresses(data_frame: pd.DataFrame) -> Tuple[int, ...]:
+    buffer_addresses = []
+    for array in _column_arrays(data_frame):
+        if isinstance(array, _NumpyExtensionArray):
+            array = array.to_numpy(copy=False)
+        if isinstance(array, np.ndarray):
+            # Views of NumPy arrays are created on every access, only their buffer addresses are stable
+            buffer_addresses.append(array.__array_interface__['data'][0])
+        else:
+            buffer_addresses.append(id(array))
+    return tuple(buffer_addresses)
+
+
+def mutation_errors(before: MutationFingerprint, data_frame: pd.DataFrame) -> List[str]:
+    """Compare a data frame against a fingerprint taken earlier and describe its in-place structural mutations.
+
+    Args:
+        before: Fingerprint of the data frame taken before a possible mutation
+        data_frame: The same data frame, possibly mutated in place
+
+    Returns:
+        A message for each added, dropped or retyped column, a changed number of rows and, if the fingerprint holds
+        buffer addresses, replaced columns. The list is empty if the structure has not been mutated.
+    """
+    after = MutationFingerprint(data_frame, buffers=before.buffers is not None)
+    if (after.columns is before.columns and after.column_types == before.column_types and after.shape == before.shape
+            and after.buffers == before.buffers):
+        return []
+
+    error_msgs: List[str] = []
+    before_columns = dict(zip(before.columns.tolist(), before.column_types))
+    after_columns = dict(zip(after.columns.tolist(), after.column_types))
+    for column_name in after_columns:
+        if column_name not in before_columns:
+            error_msgs.append(f"Column '{column_name}' was added in place")
+    for column_name, column_type in before_columns.items():
+        if column_name not in after_columns:
+            error_msgs.append(f"Column '{column_name}' was dropped in place")
+        elif after_columns[column_name] != column_type:
+            error_msgs.append(f"Type of column '{column_name}' was changed in place "
+                              f"from '{column_type}' to '{after_columns[column_name]}'")
+    if not error_msgs and before.columns.tolist() != after.columns.tolist():
+        error_msgs.append("Columns were reordered in place")
+    if after.shape[0] != before.shape[0]:
+        error_msgs.append(f"Number of rows was changed in place from {before.shape[0]} to {after.shape[0]}")
+    if not error_msgs and before.buffers is not None and after.buffers is not None:
+        for column_name, before_buffer, after_buffer in zip(after.columns.tolist(), before.buffers, after.buffers):
+            if before_buffer != after_buffer:
+                error_msgs.append(f"Column '{column_name}' was replaced in place")
+    return error_msgs
@@ -0,0 +1,216 @@
+import threading
+import weakref
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from pandas_type_checks.dtypes import DtypeClass, as_dtype_class, dtype_matches
+from pandas_type_checks.errors import PandasTypeCheckError
+
+# id(index) -> id(index specification) -> (index specification, index names when checked, type check errors)
+_index_check_results: Dict[int, Dict[int, Tuple[Any, Tuple[Any, ...], List[PandasTypeCheckError]]]] = {}
+_lock = threading.Lock()
+
+
+def _forget(index_id: int) -> None:
+    with _lock:
+        _index_check_results.pop(index_id, None)
+
+
+def _resolve_dtype(dtype: Any) -> Any:
+    dtype = as_dtype_class(dtype)
+    if dtype is None or isinstance(dtype, DtypeClass):
+        return dtype
+    return pd.api.types.pandas_dtype(dtype)
+
+
+class IndexSpec(object):
+    """
+    Expected structure of the index of a Pandas DataFrame or Series.
+
+    Index specifications are evaluated from index metadata only, i.e. the dtype of the index, the levels of a
+    ``MultiIndex`` and the 'is_unique' and 'is_monotonic_*' properties, which Pandas caches on the index. Level values
+    are never materialized and the index is never copied. Type check results are cached per index object, such that
+    repeated checks of the same index are dictionary lookups. Since the values of an index are immutable, cached
+    results are only invalidated when the index is renamed in place.
+
+    Attributes:
+        dtype: (Optional) Expected data type, or dtype class, of a single-level index
+        levels: (Optional) Expected data types, or dtype classes, of the levels of a ``MultiIndex``, either as
+            sequence of types in level order or as dict of level name -> data type. The index must have exactly the
+            given number of levels.
+        names: (Optional) Expected names of the index levels, in level order
+        unique: Flag indicating that the index must not contain duplicate values. Defaults to False.
+        monotonic: (Optional) Expected ordering of the index values, either 'increasing' or 'decreasing'
+    """
+
+    def __init__(self, dtype: Optional[Any] = None,
+                 levels: Optional[Union[Sequence[Any], Mapping[Any, Any]]] = None,
+                 names: Optional[Sequence[Any]] = None,
+                 unique: bool = False,
+                 monotonic: Optional[str] = None):
+        if monotonic not in (None, 'increasing', 'decreasing'):
+            raise ValueError(f"Unsupported index monotonicity '{monotonic}'. Expected 'increasing' or 'decreasing'.")
+        # Part of this index specification checked from index metadata only, created on first use
+        self._metadata_spec: Optional[IndexSpec] = None
+        self.dtype = dtype
+        self.levels = levels
+        self.names = names
+        self.unique = unique
+        self.monotonic = monotonic
+
+    @property
+    def dtype(self) -> Optional[Any]:
+        """Expected data type, or dtype class, of a single-level index. Assigning a new data type resets the cached
+        metadata specification."""
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, dtype: Optional[Any]):
+        self._dtype = _resolve_dtype(dtype)
+        self._metadata_spec = None
+
+    @property
+    def levels(self) -> Optional[Union[List[Any], Dict[Any, Any]]]:
+        """Expected data types, or dtype classes, of the levels of a ``MultiIndex``. Assigning new levels resets the
+        cached metadata specification."""
+        return self._levels
+
+    @levels.setter
+    def levels(self, levels: Optional[Union[Sequence[Any], Mapping[Any, Any]]]):
+        if isinstance(levels, Mapping):
+            self._levels: Optional[Union[List[Any], Dict[Any, Any]]] = {
+                level_name: _resolve_dtype(level_type) for level_name, level_type in levels.items()
+            }
+        elif levels is not None:
+            self._levels = [_resolve_dtype(level_type) for level_type in levels]
+        else:
+            self._levels = None
+        self._metadata_spec = None
+
+    @property
+    def names(self) -> Optional[List[Any]]:
+        """Expected names of the index levels. Assigning new names resets the cached metadata specification."""
+        return self._names
+
+    @names.setter
+    def names(self, names: Optional[Sequence[Any]]):
+        self._names = list(names) if names is not None else None
+        self._metadata_spec = None
+
+    @property
+    def checks_values(self) -> bool:
+        """Flag if this index specification checks the values of an index, i.e. its uniqueness or monotonicity."""
+        return self.unique or self.monotonic is not None
+
+    def metadata_spec(self) -> 'IndexSpec':
+        """Get the part of this index specification which is checked from the dtypes and names of an index only."""
+        if not self.checks_values:
+            return self
+        metadata_spec = self._metadata_spec
+        if metadata_spec is None:
+            metadata_spec = self._metadata_spec = IndexSpec(dtype=self.dtype, levels=self.levels, names=self.names)
+        return metadata_spec
+
+    def type_check(self, index: pd.Index) -> List[PandasTypeCheckError]:
+        """Type check the given index against this index specification.
+
+        Args:
+            index: Index of a Pandas DataFrame or Series
+
+        Returns:
+            A list of errors which occurred when type checking the given index.
+            If and only if no type errors are found, this method returns an empty list.
+        """
+        index_id = id(index)
+        index_names = tuple(index.names)
+        results = _index_check_results.get(index_id)
+        result = results.get(id(self)) if results else None
+        if result is not None and result[0] is self and result[1] == index_names:
+            return list(result[2])
+
+        type_check_errors = self._check_index(index)
+        with _lock:
+            if index_id not in _index_check_results:
+                _index_check_results[index_id] = {}
+                weakref.finalize(index, _forget, index_id)
+            _index_check_results[index_id][id(self)] = (self, index_names, type_check_errors)
+        return list(type_check_errors)
+
+    def _check_index(self, index: pd.Index) -> List[PandasTypeCheckError]:
+        type_check_errors: List[PandasTypeCheckError] = []
+        is_multi_index = isinstance(index, pd.MultiIndex)
+
+        if self.dtype is not None:
+            if is_multi_index:
+                type_check_errors.append(PandasTypeCheckError(
+                    error_msg=f"Expected single-level index but found MultiIndex with {index.nlevels} levels",
+                    expected_type=self.dtype
+                ))
+            elif not dtype_matches(index.dtype, self.dtype):
+                type_check_errors.append(PandasTypeCheckError(
+                    error_msg=f"Expected index of type '{self.dtype}' but found type '{index.dtype}'",
+                    expected_type=self.dtype,
+                    given_type=index.dtype
+                ))
+
+        if self.levels is not None:
+            type_check_errors.extend(self._check_levels(index, self.levels))
+
+        if self.names is not None and list(index.names) != self.names:
+            type_check_errors.append(PandasTypeCheckError(
+                error_msg=f"Expected index names {self.names} but found {list(index.names)}"
+            ))
+
+        if self.unique and not index.is_unique:
+            type_check_errors.append(PandasTypeCheckError(error_msg="Expected unique index but found duplicate values"))
+
+        if self.monotonic == 'increasing' and not index.is_monotonic_increasing:
+            type_check_errors.append(PandasTypeCheckError(error_msg="Expected monotonic increasing index"))
+        elif self.monotonic == 'decreasing' and not index.is_monotonic_decreasing:
+            type_check_errors.append(PandasTypeCheckError(error_msg="Expected monotonic decreasing index"))
+
+        return type_check_errors
+
+    @staticmethod
+    def _check_levels(index: pd.Index, levels: Union[List[Any], Dict[Any, Any]]) -> List[PandasTypeCheckError]:
+        # Level dtypes are taken from the (cached) levels of a MultiIndex, not from its level values
+        level_names = list(index.names)
+        if isinstance(index, pd.MultiIndex):
+            level_types = [level.dtype for level in index.levels]
+        else:
+            level_types = [index.dtype]
+
+        if len(levels) != len(level_types):
+            return [PandasTypeCheckError(
+                error_msg=f"Expected {len(levels)} index levels but found {len(level_types)}"
+            )]
+
+        if isinstance(levels, dict):
+            expected_level_types = levels
+            given_level_types = dict(zip(level_names, level_types))
+        else:
+            expected_level_types = dict(enumerate(levels))
+            given_level_types = dict(enumerate(level_types))
+
+        type_check_errors: List[PandasTypeCheckError] = []
+        for level, expected_level_type in expected_level_types.items():
+            if level not in given_level_types:
+                type_check_errors.append(PandasTypeCheckError(error_msg=f"Missing index level: '{level}'",
+                                                              expected_type=expected_level_type))
+            elif expected_level_type is not None and not dtype_matches(given_level_types[level], expected_level_type):
+                error_msg = (f"Expected type '{expected_level_type}' for index level '{level}' "
+                             f"but found type '{given_level_types[level]}'")
+                type_check_errors.append(PandasTypeCheckError(error_msg=error_msg,
+                                                              expected_type=expected_level_type,
+                                                              given_type=given_level_types[level]))
+        return type_check_errors
+
+    def __str__(self) -> str:
+        properties = {'dtype': self.dtype, 'levels': self.levels, 'names': self.names,
+                      'unique': self.unique or None, 'monotonic': self.monotonic}
+        return "IndexSpec(" + ", ".join(f"{key}={value!r}" for key, value in properties.items()
+                                        if value is not None) + ")"
+
+    def __repr__(self) -> str:
+        return str(self)
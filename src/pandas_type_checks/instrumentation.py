@@ -0,0 +1,263 @@
+import importlib.abc
+import inspect
+import logging
+import sys
+import threading
+import time
+import types
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union, cast
+
+from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.type_hints import TypeCheckMarker
+
+logger = logging.getLogger('pandas_type_checks')
+
+# Type check markers of an instrumented function, i.e. the positional arguments of 'pandas_type_check'. An empty
+# sequence type checks the 'Annotated' type hints of the function only.
+FunctionSpecs = Union[TypeCheckMarker, Sequence[TypeCheckMarker]]
+
+
+def _as_markers(specs: FunctionSpecs) -> Tuple[TypeCheckMarker, ...]:
+    return tuple(specs) if isinstance(specs, (list, tuple)) else (cast(TypeCheckMarker, specs),)
+
+
+class Instrumentation(object):
+    """
+    Type checks applied to existing functions of modules and classes from a mapping of qualified function names to
+    type check markers, without decorating the functions in their source code.
+
+    Functions are replaced by their ``pandas_type_check`` wrappers in the module or class defining them. Methods,
+    static methods and class methods are supported. Instrumenting a function only wraps it, its type check markers are
+    resolved once, on its first call, such that the setup time is independent of the size of the type specifications.
+    Removing the instrumentation restores the original attributes, i.e. no overhead remains.
+
+    Instrumented attributes are tracked per module or class and attribute name. Functions replaced after being
+    instrumented, e.g. by reloading their module with ``importlib.reload``, are instrumented again by the next
+    ``instrument`` call, and removing the instrumentation keeps attributes which have been replaced in the meantime.
+
+    Functions are looked up by their qualified name, i.e. ``'<module>.<qualname>'``, e.g. ``'my_module.process'`` or
+    ``'my_module.Pipeline.run'``, only in the module or class defining them. References to the original functions
+    taken before instrumentation, e.g. by ``from my_module import process`` in another module, are not replaced.
+
+    Attributes:
+        specs: Qualified function name -> type check markers
+        decorator_kwargs: Keyword arguments of ``pandas_type_check`` applied to all functions, e.g. ``strict``
+        instrumented_names: Qualified names of the instrumented functions
+        unresolved_names: Qualified names of the instrumented modules and classes which could not be resolved to a
+            function, static method or class method
+        setup_time: Total time in seconds spent instrumenting functions
+    """
+
+    def __init__(self, specs: Mapping[str, FunctionSpecs], **decorator_kwargs: Any):
+        self.specs = dict(specs)
+        self.decorator_kwargs = decorator_kwargs
+        self.instrumented_names: List[str] = []
+        self.unresolved_names: List[str] = []
+        self.setup_time = 0.0
+        # (owner, attribute name) -> (original attribute, instrumented attribute) of each replaced attribute, in the
+        # order of replacement
+        self._replaced_attributes: Dict[Tuple[Any, str], Tuple[Any, Any]] = {}
+        self._instrumented_name_set: Set[str] = set()
+        self._lock = threading.RLock()
+
+    def instrument(self, target: Union[types.ModuleType, type], report_unresolved: bool = True) -> List[str]:
+        """Instrument all functions of the given module or class with a type specification.
+
+        Args:
+            target: Module or class
+            report_unresolved: Flag for logging a warning for the functions which cannot be resolved
+
+        Returns:
+            The qualified names of the instrumented functions.
+        """
+        start = time.perf_counter()
+        if isinstance(target, types.ModuleType):
+            prefix = target.__name__
+        else:
+            prefix = f"{target.__module__}.{target.__qualname__}"
+        instrumented_names: List[str] = []
+        with self._lock:
+            for name in [name for name in self.specs if name.startswith(prefix + '.')]:
+                resolved = self._resolve_function(target, name, name[len(prefix) + 1:].split('.'))
+                if resolved is None:
+                    if report_unresolved:
+                        self.unresolved_names.append(name)
+                        logger.warning(f"Cannot instrument '{name}': no function with this qualified name found")
+                    continue
+                owner, attribute_name, attribute, func = resolved
+                replaced_attribute = self._replaced_attributes.get((owner, attribute_name))
+                if replaced_attribute is not None and replaced_attribute[1] is attribute:
+                    # Function has already been instrumented
+                    continue
+                self._instrument_function(owner, attribute_name, attribute, func, name)
+                instrumented_names.append(name)
+                if name not in self._instrumented_name_set:
+                    self._instrumented_name_set.add(name)
+                    self.instrumented_names.append(name)
+            self.setup_time += time.perf_counter() - start
+        return instrumented_names
+
+    def _resolve_function(self, owner: Any, name: str,
+                          path: List[str]) -> Optional[Tuple[Any, str, Any, Callable]]:
+        # Resolve the attribute path in the namespaces of the module and the nested classes
+        for part in path[:-1]:
+            owner = vars(owner).get(part)
+            if not inspect.isclass(owner):
+                return None
+        attribute = vars(owner).get(path[-1])
+
+        if isinstance(attribute, (staticmethod, classmethod)):
+            func = attribute.__func__
+        elif inspect.isfunction(attribute):
+            func = attribute
+        else:
+            return None
+        # Skip aliases of functions defined elsewhere
+        if f"{func.__module__}.{func.__qualname__}" != name:
+            return None
+        return owner, path[-1], attribute, func
+
+    def _instrument_function(self, owner: Any, attribute_name: str, attribute: Any, func: Callable,
+                             name: str) -> None:
+        wrapper = pandas_type_check(*_as_markers(self.specs[name]), **self.decorator_kwargs)(func)
+        instrumented_attribute = type(attribute)(wrapper) if isinstance(attribute, (staticmethod, classmethod)) \
+            else wrapper
+        setattr(owner, attribute_name, instrumented_attribute)
+        self._replaced_attributes.pop((owner, attribute_name), None)
+        self._replaced_attributes[(owner, attribute_name)] = (attribute, instrumented_attribute)
+
+    def remove(self) -> None:
+        """Restore the original functions of all instrumented modules and classes.
+
+        Attributes which have been replaced since they were instrumented, e.g. by reloading their module, are kept.
+        """
+        with self._lock:
+            for (owner, attribute_name), (original, instrumented) in reversed(self._replaced_attributes.items()):
+                if vars(owner).get(attribute_name) is instrumented:
+                    setattr(owner, attribute_name, original)
+            self._replaced_attributes.clear()
+            self._instrumented_name_set.clear()
+            self.instrumented_names.clear()
+
+
+def instrument(targets: Union[types.ModuleType, type, Sequence[Union[types.ModuleType, type]]],
+               specs: Mapping[str, FunctionSpecs], **decorator_kwargs: Any) -> Instrumentation:
+    """Apply type checks to the functions of modules or classes from a mapping of qualified function names to markers.
+
+    Example::
+
+        instrumentation = instrument(my_module, {
+            'my_module.process': [DataFrameArgument('data', 'orders'), DataFrameReturnValue('orders')],
+            'my_module.Pipeline.run': DataFrameArgument('data', {'id': 'int64'})
+        }, strict=True)
+        ...
+        instrumentation.remove()
+
+    Args:
+        targets: Module or class, or sequence of modules and classes, whose functions are instrumented
+        specs: Qualified function name -> type check marker, or sequence of type check markers
+        **decorator_kwargs: Keyword arguments of ``pandas_type_check`` applied to all functions, e.g. ``strict``
+
+    Returns:
+        The instrumentation, which can be removed to restore the original functions.
+    """
+    instrumentation = Instrumentation(specs, **decorator_kwargs)
+    for target in (targets if isinstance(targets, (list, tuple)) else [targets]):
+        instrumentation.instrument(cast(Union[types.ModuleType, type], target))
+    return instrumentation
+
+
+class _InstrumentingLoader(importlib.abc.Loader):
+    # Loader delegating to the original loader of a module and instrumenting the module after executing it
+
+    def __init__(self, loader: Any, hook: 'ImportHook'):
+        self._loader = loader
+        self._hook = hook
+
+    def create_module(self, spec: Any) -> Optional[types.ModuleType]:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        self._loader.exec_module(module)
+        self._hook.instrument_module(module)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class ImportHook(importlib.abc.MetaPathFinder):
+    """
+    Import hook instrumenting modules with type checks as they are loaded (see ``Instrumentation``).
+
+    The hook only intercepts the imports of modules which may contain one of the specified functions, i.e. modules
+    whose name is a prefix of a qualified function name. All other imports are not affected.
+
+    Attributes:
+        instrumentation: Instrumentation of the loaded modules
+    """
+
+    def __init__(self, specs: Mapping[str, FunctionSpecs], **decorator_kwargs: Any):
+        self.instrumentation = Instrumentation(specs, **decorator_kwargs)
+        self._module_names: Set[str] = set()
+        for name in specs:
+            parts = name.split('.')
+            self._module_names.update('.'.join(parts[:length]) for length in range(1, len(parts)))
+        self._installed = False
+
+    def find_spec(self, fullname: str, path: Any, target: Any = None) -> Any:
+        if fullname not in self._module_names:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _InstrumentingLoader(spec.loader, self)
+                return spec
+        return None
+
+    def instrument_module(self, module: types.ModuleType) -> None:
+        """Instrument the specified functions of the given module which can be resolved in it."""
+        self.instrumentation.instrument(module, report_unresolved=False)
+
+    def install(self, instrument_loaded: bool = True) -> 'ImportHook':
+        """Install the import hook.
+
+        Args:
+            instrument_loaded: Flag for instrumenting the specified functions of already loaded modules
+
+        Returns:
+            The installed import hook.
+        """
+        if not self._installed:
+            sys.meta_path.insert(0, self)
+            self._installed = True
+        if instrument_loaded:
+            for module_name in sorted(self._module_names):
+                module = sys.modules.get(module_name)
+                if module is not None:
+                    self.instrument_module(module)
+        return self
+
+    def remove(self) -> None:
+        """Uninstall the import hook and restore the original functions of all instrumented modules."""
+        if self._installed:
+            sys.meta_path.remove(self)
+            self._installed = False
+        self.instrumentation.remove()
+
+
+def install_import_hook(specs: Mapping[str, FunctionSpecs], instrument_loaded: bool = True,
+                        **decorator_kwargs: Any) -> ImportHook:
+    """Install an import hook instrumenting the specified functions of modules as they are loaded.
+
+    Args:
+        specs: Qualified function name -> type check marker, or sequence of type check markers
+        instrument_loaded: Flag for instrumenting the specified functions of already loaded modules
+        **decorator_kwargs: Keyword arguments of ``pandas_type_check`` applied to all functions, e.g. ``strict``
+
+    Returns:
+        The installed import hook, which can be removed to restore the original functions.
+    """
+    return ImportHook(specs, **decorator_kwargs).install(instrument_loaded=instrument_loaded)
@@ -1,5 +1,8 @@
-from typing import List, Optional
+import time
+from typing import Any, List, Optional, Tuple
 
+import pandas as pd
+import pandera as pa
 from pandera.errors import SchemaErrors
 
 from pandas_type_checks.errors import PandasTypeCheckError
@@ -27,3 +30,101 @@ def pandera_schema_errors_to_type_check_errors(schema_errors: SchemaErrors) -> L
         type_check_errors.append(type_check_error)
 
     return type_check_errors
+
+
+# Names of the built-in Pandera checks whose outcome for a row only depends on the values of that row
+ROW_WISE_CHECKS = frozenset({
+    'equal_to', 'not_equal_to', 'greater_than', 'greater_than_or_equal_to', 'less_than', 'less_than_or_equal_to',
+    'in_range', 'isin', 'notin', 'str_matches', 'str_contains', 'str_startswith', 'str_endswith', 'str_length'
+})
+
+
+def _is_row_wise(check: Any) -> bool:
+    return check.groupby is None and (check.element_wise or check.name in ROW_WISE_CHECKS)
+
+
+def has_row_wise_checks_only(schema: pa.DataFrameSchema) -> bool:
+    """
+    Check if the outcome of validating a Pandera ``DataFrameSchema`` is determined row by row.
+
+    This holds if all value checks of the schema are element-wise or built-in row-wise checks (e.g. ``Check.ge``),
+    and neither the schema nor its columns require unique values, and the schema has no index. Only then failure cases
+    of validating a concatenation of data frames are exactly the failure cases of validating each data frame.
+    Aggregate checks (e.g. of the mean of a column), uniqueness and custom vectorized checks are not row-wise.
+
+    Args:
+        schema: Pandera ``DataFrameSchema`` to inspect
+
+    Returns:
+        True if the schema only contains row-wise checks, False otherwise.
+    """
+    if schema.unique or schema.index is not None or not all(_is_row_wise(check) for check in schema.checks):
+        return False
+    return all(not column.unique and all(_is_row_wise(check) for check in column.checks)
+               for column in schema.columns.values())
+
+
+def _check_label(check: pa.Check) -> str:
+    # Checks are labelled by their name, falling back to their error message for checks without a name
+    return check.name or check.error or 'unnamed check'
+
+
+def split_data_frame_schema(schema: pa.DataFrameSchema) -> Tuple[pa.DataFrameSchema, List[Tuple[str, Any]]]:
+    """
+    Split a Pandera ``DataFrameSchema`` into a base schema and a schema for each of its value checks.
+
+    The base schema holds everything but the value checks, i.e. the columns with their dtypes, nullability and
+    uniqueness, the index and the strictness. Each value check of a column or of the data frame as a whole is moved
+    into a schema of its own, such that it can be validated as separate step.
+
+    Args:
+        schema: Pandera ``DataFrameSchema`` to split
+
+    Returns:
+        The base schema and a list of (step description, schema) for each value check.
+    """
+    base_schema = schema.update_columns({column_name: {'checks': []} for column_name in schema.columns})
+    base_schema.checks = []
+
+    check_schemas: List[Tuple[str, Any]] = []
+    for column_name, column in schema.columns.items():
+        for check in column.checks:
+            check_column = pa.Column(checks=[check], nullable=True, required=False, regex=column.regex)
+            check_schemas.append((f"{_check_label(check)} of column '{column_name}'",
+                                  pa.DataFrameSchema({column_name: check_column})))
+    for check in schema.checks:
+        check_schemas.append((f"{_check_label(check)} of data frame", pa.DataFrameSchema(checks=[check])))
+    return base_schema, check_schemas
+
+
+def validate_before_deadline(base_schema: pa.DataFrameSchema, check_schemas: List[Tuple[str, Any]],
+                             data_frame: pd.DataFrame, deadline: float) -> Tuple[List[PandasTypeCheckError], List[str]]:
+    """
+    Validate a data frame against a Pandera schema split by ``split_data_frame_schema`` until a deadline passes.
+
+    The base schema is always validated. The value checks are validated one after another as long as the deadline
+    has not passed, i.e. validation is cut off between checks. The value checks run on the data frame returned by the
+    base schema, i.e. after coercion if the schema coerces dtypes, or on the given data frame if the base schema fails.
+
+    Args:
+        base_schema: Base schema, validated unconditionally
+        check_schemas: List of (step description, schema) for each value check
+        data_frame: Data frame to validate
+        deadline: Deadline as value of ``time.monotonic()``
+
+    Returns:
+        The type check errors found and the descriptions of the value checks skipped because the deadline passed.
+    """
+    type_check_errors: List[PandasTypeCheckError] = []
+    try:
+        data_frame = base_schema.validate(data_frame, lazy=True)
+    except SchemaErrors as err:
+        type_check_errors.extend(pandera_schema_errors_to_type_check_errors(err))
+    for position, (_, schema) in enumerate(check_schemas):
+        if time.monotonic() >= deadline:
+            return type_check_errors, [description for description, _ in check_schemas[position:]]
+        try:
+            schema.validate(data_frame, lazy=True)
+        except SchemaErrors as err:
+            type_check_errors.extend(pandera_schema_errors_to_type_check_errors(err))
+    return type_check_errors, []
@@ -0,0 +1,180 @@
+import fnmatch
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+# Maximum number of distinct column layouts whose pattern resolution is cached per type specification
+MAX_CACHED_LAYOUTS = 128
+
+
+class ColumnPattern(ABC):
+    """
+    Base class for patterns matching column names, used as keys in data frame type specifications.
+
+    All columns of a data frame whose names match a pattern are expected to have the data type specified for the
+    pattern. Columns which are specified by name are only checked against the type specified for their name.
+
+    Attributes:
+        pattern: Pattern matched against column names
+        min_count: Minimum number of columns matching the pattern. Defaults to 0.
+        max_count: (Optional) Maximum number of columns matching the pattern. Defaults to no limit.
+    """
+
+    kind = 'pattern'
+
+    def __init__(self, pattern: str, min_count: int = 0, max_count: Optional[int] = None):
+        if min_count < 0 or (max_count is not None and max_count < min_count):
+            raise ValueError(f"Invalid match counts for column {self.kind} '{pattern}': "
+                             f"min_count={min_count}, max_count={max_count}")
+        self.pattern = pattern
+        self.min_count = min_count
+        self.max_count = max_count
+        self._hash = hash((type(self), pattern, min_count, max_count))
+
+    @abstractmethod
+    def matches(self, column_name: Any) -> bool:
+        """Check if the given column name matches this pattern. Only string column names can match."""
+
+    def count_error_msg(self, num_matches: int) -> Optional[str]:
+        """Get the error message for the given number of matching columns, or None if the number is valid."""
+        if num_matches >= self.min_count and (self.max_count is None or num_matches <= self.max_count):
+            return None
+        if self.max_count is None:
+            expected_count = f"at least {self.min_count}"
+        elif self.min_count == 0:
+            expected_count = f"at most {self.max_count}"
+        elif self.min_count == self.max_count:
+            expected_count = f"exactly {self.min_count}"
+        else:
+            expected_count = f"between {self.min_count} and {self.max_count}"
+        return f"Expected {expected_count} columns matching {self} but found {num_matches}"
+
+    def __eq__(self, other: Any) -> bool:
+        return (type(other) is type(self) and other.pattern == self.pattern
+                and other.min_count == self.min_count and other.max_count == self.max_count)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __str__(self) -> str:
+        return f"{self.kind} '{self.pattern}'"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class Regex(ColumnPattern):
+    """
+    Column pattern matching column names which fully match a regular expression, e.g. ``Regex(r'feat_\\d{4}')``.
+    """
+
+    kind = 'regex'
+
+    def __init__(self, pattern: str, min_count: int = 0, max_count: Optional[int] = None):
+        super().__init__(pattern, min_count, max_count)
+        self._regex = re.compile(pattern)
+
+    def matches(self, column_name: Any) -> bool:
+        return isinstance(column_name, str) and self._regex.fullmatch(column_name) is not None
+
+
+class Prefix(ColumnPattern):
+    """
+    Column pattern matching column names starting with a prefix, e.g. ``Prefix('feat_')``.
+    """
+
+    kind = 'prefix'
+
+    def matches(self, column_name: Any) -> bool:
+        return isinstance(column_name, str) and column_name.startswith(self.pattern)
+
+
+class Glob(ColumnPattern):
+    """
+    Column pattern matching column names against a case-sensitive shell-style wildcard pattern, e.g. ``Glob('feat_*')``.
+    """
+
+    kind = 'glob'
+
+    def __init__(self, pattern: str, min_count: int = 0, max_count: Optional[int] = None):
+        super().__init__(pattern, min_count, max_count)
+        self._regex = re.compile(fnmatch.translate(pattern))
+
+    def matches(self, column_name: Any) -> bool:
+        return isinstance(column_name, str) and self._regex.match(column_name) is not None
+
+
+class PatternResolution(object):
+    """
+    Resolution of the column patterns of a type specification for a column layout.
+
+    Attributes:
+        matched_columns: Pattern -> columns for which it is the first pattern of the type specification matching
+            them, excluding columns specified by name
+        unspecified_columns: Columns neither specified by name nor matching any pattern
+        count_errors: Pattern -> error message for each pattern with an invalid number of matching columns
+    """
+
+    def __init__(self, matched_columns: Dict[ColumnPattern, List[Any]], unspecified_columns: List[Any],
+                 count_errors: Dict[ColumnPattern, str]):
+        self.matched_columns = matched_columns
+        self.unspecified_columns = unspecified_columns
+        self.count_errors = count_errors
+
+
+class PatternResolver(object):
+    """
+    Resolve column names to the column patterns of a type specification, cached per distinct column layout.
+
+    Repeated resolutions for the same column layout are dictionary lookups, i.e. no pattern is matched again.
+    At most ``MAX_CACHED_LAYOUTS`` layouts are cached, the cache is cleared once this limit is exceeded.
+
+    Attributes:
+        named_columns: Columns specified by name, which are not matched against patterns
+        patterns: Column patterns in the order of the type specification
+    """
+
+    def __init__(self, named_columns: Set[Any], patterns: Sequence[ColumnPattern]):
+        self.named_columns = named_columns
+        self.patterns = list(patterns)
+        self._resolutions: Dict[Tuple[Any, ...], PatternResolution] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, columns: Sequence[Any]) -> PatternResolution:
+        """Resolve the given column names to the column patterns of the type specification.
+
+        Args:
+            columns: Column names of a data frame
+
+        Returns:
+            The columns matching each pattern, the unspecified columns and invalid pattern match counts.
+        """
+        layout = tuple(columns)
+        resolution = self._resolutions.get(layout)
+        if resolution is not None:
+            return resolution
+
+        matched_columns: Dict[ColumnPattern, List[Any]] = {pattern: [] for pattern in self.patterns}
+        unspecified_columns: List[Any] = []
+        for column_name in layout:
+            if column_name in self.named_columns:
+                continue
+            matching_pattern = next((pattern for pattern in self.patterns if pattern.matches(column_name)), None)
+            if matching_pattern is None:
+                unspecified_columns.append(column_name)
+            else:
+                matched_columns[matching_pattern].append(column_name)
+
+        count_errors: Dict[ColumnPattern, str] = {}
+        for pattern, pattern_columns in matched_columns.items():
+            count_error_msg = pattern.count_error_msg(len(pattern_columns))
+            if count_error_msg is not None:
+                count_errors[pattern] = count_error_msg
+        resolution = PatternResolution(matched_columns, unspecified_columns, count_errors)
+
+        with self._lock:
+            if len(self._resolutions) >= MAX_CACHED_LAYOUTS:
+                self._resolutions.clear()
+            self._resolutions[layout] = resolution
+        return resolution
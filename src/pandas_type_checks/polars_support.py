@@ -0,0 +1,68 @@
+import sys
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+# Polars dtype name -> Pandas dtype of the corresponding data frame column
+_polars_to_pandas_dtypes: Dict[str, Any] = {
+    **{name: np.dtype(name.lower()) for name in ['Int8', 'Int16', 'Int32', 'Int64',
+                                                 'UInt8', 'UInt16', 'UInt32', 'UInt64',
+                                                 'Float32', 'Float64']},
+    'Boolean': np.dtype('bool'),
+    'String': pd.StringDtype(),
+    'Utf8': pd.StringDtype(),
+    'Categorical': pd.CategoricalDtype(),
+    'Enum': pd.CategoricalDtype(),
+    'Date': np.dtype('datetime64[ms]')
+}
+
+
+def is_polars_frame(value: Any) -> bool:
+    """Check if the given value is a Polars ``DataFrame`` or ``LazyFrame``.
+
+    Polars is not imported by this check. If Polars has not been imported yet, the value cannot be a Polars frame.
+    """
+    polars = sys.modules.get('polars')
+    return polars is not None and isinstance(value, (polars.DataFrame, polars.LazyFrame))
+
+
+def polars_to_pandas_dtype(dtype: Any) -> Any:
+    """Map a Polars dtype to the Pandas dtype used for the corresponding column in type specifications.
+
+    Args:
+        dtype: Polars data type
+
+    Returns:
+        The corresponding Pandas dtype. Nested and other types without a Pandas counterpart are mapped to ``object``.
+    """
+    name = dtype.base_type().__name__
+    if name in _polars_to_pandas_dtypes:
+        return _polars_to_pandas_dtypes[name]
+    if name == 'Datetime':
+        if dtype.time_zone is not None:
+            return pd.DatetimeTZDtype(unit=dtype.time_unit, tz=dtype.time_zone)
+        return np.dtype(f'datetime64[{dtype.time_unit}]')
+    if name == 'Duration':
+        return np.dtype(f'timedelta64[{dtype.time_unit}]')
+    return np.dtype('object')
+
+
+def polars_column_types(frame: Any) -> Dict[str, Any]:
+    """Get the Pandas dtypes of the columns of a Polars ``DataFrame`` or ``LazyFrame``.
+
+    The column types are derived from the schema of the frame. The schema of a ``LazyFrame`` is resolved without
+    executing its query plan.
+
+    Args:
+        frame: Polars ``DataFrame`` or ``LazyFrame``
+
+    Returns:
+        Column name -> Pandas dtype of the columns of the given frame.
+    """
+    polars = sys.modules['polars']
+    if isinstance(frame, polars.LazyFrame) and hasattr(frame, 'collect_schema'):
+        schema = frame.collect_schema()
+    else:
+        schema = frame.schema
+    return {column_name: polars_to_pandas_dtype(dtype) for column_name, dtype in schema.items()}
@@ -0,0 +1,161 @@
+"""
+Pytest plugin reporting the overhead of the type checks of all functions decorated with ``pandas_type_check`` per test
+session, and the decorated functions which have never been called. Coverage is tracked per decorated function, not per
+type check marker, i.e. a function counts as exercised once it has been called with type checks enabled.
+
+The plugin is registered automatically when the package is installed and is enabled by any of its options, e.g.
+``pytest --type-check-stats``. Thresholds and the report path can also be set in the pytest configuration file. The
+type check modules are only imported once the plugin is enabled.
+"""
+import json
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+
+def pytest_addoption(parser: Any) -> None:
+    group = parser.getgroup('pandas-type-checks', "Pandas type check overhead")
+    group.addoption('--type-check-stats', action='store_true', default=None,
+                    help="Report calls and check time of all functions decorated with 'pandas_type_check'.")
+    group.addoption('--type-check-report', default=None, metavar='PATH',
+                    help="Write the type check statistics as JSON report to the given path.")
+    group.addoption('--type-check-max-overhead', type=float, default=None, metavar='RATIO',
+                    help="Fail if the ratio of check time to function time of a decorated function exceeds RATIO.")
+    group.addoption('--type-check-max-time-per-call', type=float, default=None, metavar='SECONDS',
+                    help="Fail if the mean check time per call of a decorated function exceeds SECONDS.")
+    parser.addini('type_check_stats', type='bool', default=False,
+                  help="Report calls and check time of all functions decorated with 'pandas_type_check'.")
+    parser.addini('type_check_report', default=None, help="Path of the JSON report of the type check statistics.")
+    parser.addini('type_check_max_overhead', default=None,
+                  help="Maximum ratio of check time to function time of a decorated function.")
+    parser.addini('type_check_max_time_per_call', default=None,
+                  help="Maximum mean check time in seconds per call of a decorated function.")
+
+
+def _option(config: Any, name: str) -> Any:
+    # Command line options take precedence over the pytest configuration file
+    value = config.getoption(name)
+    return value if value is not None else config.getini(name) or None
+
+
+class TypeCheckStatisticsPlugin(object):
+    """
+    Pytest plugin collecting the call statistics of all decorated functions during a test session.
+
+    Attributes:
+        report_path: (Optional) Path of the JSON report
+        max_overhead: (Optional) Maximum ratio of check time to function time of a decorated function
+        max_time_per_call: (Optional) Maximum mean check time in seconds per call of a decorated function
+        call_statistics: Statistics of the calls of all decorated functions
+        violations: Threshold violations found at the end of the test session
+    """
+
+    def __init__(self, report_path: Optional[str] = None, max_overhead: Optional[float] = None,
+                 max_time_per_call: Optional[float] = None):
+        from pandas_type_checks.call_statistics import CallStatistics
+
+        self.report_path = report_path
+        self.max_overhead = max_overhead
+        self.max_time_per_call = max_time_per_call
+        self.call_statistics = CallStatistics()
+        self.violations: List[str] = []
+        self._previous_call_statistics: Optional[CallStatistics] = None
+        self._started = False
+
+    def start(self) -> None:
+        """Collect the call statistics of all decorated functions, until the plugin is stopped."""
+        from pandas_type_checks import core
+
+        if not self._started:
+            self._previous_call_statistics = core.config.call_statistics
+            core.config.call_statistics = self.call_statistics
+            self._started = True
+
+    def stop(self) -> None:
+        """Restore the call statistics configured before the plugin was started. Stopping twice has no effect."""
+        from pandas_type_checks import core
+
+        if self._started:
+            core.config.call_statistics = self._previous_call_statistics
+            self._previous_call_statistics = None
+            self._started = False
+
+    def unexercised_functions(self) -> List[str]:
+        """Get the qualified names of all decorated functions which have not been called during the test session."""
+        from pandas_type_checks.decorator import decorated_functions
+
+        return sorted(name for name in list(decorated_functions.keys())
+                      if name not in self.call_statistics.functions)
+
+    def find_violations(self) -> List[str]:
+        """Find the decorated functions exceeding the configured overhead thresholds."""
+        violations: List[str] = []
+        for name, statistics in sorted(self.call_statistics.functions.items()):
+            overhead = statistics.overhead
+            if self.max_overhead is not None and overhead is not None and overhead > self.max_overhead:
+                violations.append(f"Type check overhead of '{name}' is {overhead:.2f}, "
+                                  f"exceeding the maximum of {self.max_overhead:g}")
+            if self.max_time_per_call is not None and statistics.check_time_per_call > self.max_time_per_call:
+                violations.append(f"Type check time per call of '{name}' is {statistics.check_time_per_call:.6f}s, "
+                                  f"exceeding the maximum of {self.max_time_per_call:g}s")
+        return violations
+
+    def report(self) -> Dict[str, Any]:
+        """Create the machine-readable report of the type check statistics."""
+        return {
+            'functions': {name: statistics.to_dict()
+                          for name, statistics in sorted(self.call_statistics.functions.items())},
+            'unexercised_functions': self.unexercised_functions(),
+            'thresholds': {'max_overhead': self.max_overhead, 'max_time_per_call': self.max_time_per_call},
+            'violations': self.violations
+        }
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session: Any) -> None:
+        self.stop()
+        self.violations = self.find_violations()
+        if self.violations and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+        if self.report_path is not None:
+            with open(self.report_path, 'w') as report_file:
+                json.dump(self.report(), report_file, indent=2)
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        terminalreporter.section("pandas type check statistics")
+        terminalreporter.write_line(f"{'function':<60} {'calls':>8} {'failures':>8} {'check time (s)':>14} "
+                                    f"{'overhead':>9}")
+        for name, statistics in sorted(self.call_statistics.functions.items(),
+                                       key=lambda item: item[1].check_time, reverse=True):
+            overhead = statistics.overhead
+            terminalreporter.write_line(f"{name:<60} {statistics.calls:>8} {statistics.failures:>8} "
+                                        f"{statistics.check_time:>14.6f} "
+                                        f"{'-' if overhead is None else format(overhead, '.2f'):>9}")
+        unexercised_functions = self.unexercised_functions()
+        if unexercised_functions:
+            terminalreporter.write_line(f"Decorated functions never called: {', '.join(unexercised_functions)}")
+        for violation in self.violations:
+            terminalreporter.write_line(violation, red=True)
+
+
+def pytest_configure(config: Any) -> None:
+    report_path = _option(config, 'type_check_report')
+    max_overhead = _option(config, 'type_check_max_overhead')
+    max_time_per_call = _option(config, 'type_check_max_time_per_call')
+    enabled = _option(config, 'type_check_stats')
+    if not (enabled or report_path or max_overhead is not None or max_time_per_call is not None):
+        return
+
+    plugin = TypeCheckStatisticsPlugin(
+        report_path=report_path,
+        max_overhead=None if max_overhead is None else float(max_overhead),
+        max_time_per_call=None if max_time_per_call is None else float(max_time_per_call)
+    )
+    plugin.start()
+    config.pluginmanager.register(plugin, 'pandas-type-check-statistics')
+
+
+def pytest_unconfigure(config: Any) -> None:
+    plugin = config.pluginmanager.get_plugin('pandas-type-check-statistics')
+    if plugin is not None:
+        plugin.stop()
+        config.pluginmanager.unregister(plugin)
@@ -0,0 +1,173 @@
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import pandas as pd
+
+from pandas_type_checks.coercion import astype_without_copy, is_safe_cast
+from pandas_type_checks.core import DataFrameReturnValue, DataFrameType, current_config
+from pandas_type_checks.dtypes import DtypeClass, dtype_matches
+from pandas_type_checks.validated import mark_validated
+
+ReaderSpec = Union[DataFrameReturnValue, DataFrameType]
+
+# Reader arguments changing the columns or types of the loaded data frame, which therefore is type checked before being
+# marked as validated if they are passed explicitly
+_CSV_OVERRIDING_KWARGS = ('usecols', 'dtype', 'parse_dates', 'index_col', 'names', 'header', 'converters',
+                          'dtype_backend')
+_PARQUET_OVERRIDING_KWARGS = ('columns', 'dtype_backend')
+
+
+def _as_type_check_marker(spec: ReaderSpec) -> DataFrameReturnValue:
+    if isinstance(spec, DataFrameReturnValue):
+        return spec
+    return DataFrameReturnValue(spec)
+
+
+def _parsing_type(expected_column_type: Any) -> Any:
+    """Get the concrete dtype used for parsing a column of the given expected type, or None if it is inferred."""
+    if isinstance(expected_column_type, DtypeClass):
+        return expected_column_type.concrete_type
+    return expected_column_type
+
+
+def _parsing_types(marker: DataFrameReturnValue) -> Dict[Any, Any]:
+    """Get the concrete dtypes used for parsing the columns of the type specification of the given marker."""
+    return {
+        column_name: _parsing_type(expected_column_type)
+        for column_name, expected_column_type in marker.expected_column_types.items()
+        if expected_column_type is not None
+    }
+
+
+def _specified_columns(marker: DataFrameReturnValue) -> Union[List[Any], Callable[[Any], bool]]:
+    """Get the columns of the type specification of the given marker, or a predicate if it has column patterns."""
+    expected_column_types = marker.expected_column_types
+    column_patterns = list(marker.column_patterns.keys())
+    if not column_patterns:
+        return list(expected_column_types.keys())
+    return lambda column_name: (column_name in expected_column_types
+                                or any(pattern.matches(column_name) for pattern in column_patterns))
+
+
+def _cast_to_expected_types(data_frame: pd.DataFrame, marker: DataFrameReturnValue,
+                            parsed_from_text: bool = False) -> Tuple[pd.DataFrame, bool]:
+    """Cast the columns which could not be typed while parsing, e.g. date time columns, in a single batch.
+
+    Only casts on the allow-list of safe casts (see ``PandasTypeCheckConfiguration.safe_casts``) are applied, columns
+    whose stored types cannot be cast without loss keep their types and are reported by the type check. Float columns
+    parsed from text are also cast to narrower float types, which rounds the values as parsing them with the narrower
+    type would.
+
+    Returns:
+        The cast data frame, and a flag if any column still differs from its expected type.
+    """
+    safe_casts = current_config().safe_casts
+    column_casts: Dict[Any, Any] = {}
+    mismatched = False
+    for column_name, expected_column_type in marker.expected_types_of_columns(data_frame.columns).items():
+        parsing_type = _parsing_type(expected_column_type)
+        given_type = data_frame[column_name].dtype
+        if parsing_type is None or dtype_matches(given_type, expected_column_type):
+            continue
+        if is_safe_cast(given_type, parsing_type, safe_casts) or (
+                parsed_from_text and pd.api.types.is_float_dtype(given_type)
+                and pd.api.types.is_float_dtype(parsing_type)):
+            column_casts[column_name] = parsing_type
+        else:
+            mismatched = True
+    if column_casts:
+        data_frame = astype_without_copy(data_frame, column_casts)
+    return data_frame, mismatched
+
+
+def _mark_if_valid(data_frame: pd.DataFrame, marker: DataFrameReturnValue, verify: bool) -> None:
+    """Mark the data frame as validated against the type specification of the given marker.
+
+    Data frames read with the derived columns and types conform to a dict specification by construction.
+    They are only checked before being marked if the derived reader arguments have been overridden, if the
+    specification contains dtype classes without a concrete type, whose types are inferred while parsing, or if the
+    specification contains column patterns, whose columns are only known after parsing. Otherwise only the elements
+    of columns specified by an ``ObjectOf`` dtype class are checked, as parsing does not constrain them. Data frames
+    read with a Pandera schema are not marked, since the value checks of the schema would be skipped even after
+    in-place changes of the values.
+    """
+    if marker.checks_values:
+        return
+    if (verify or marker.column_patterns
+            or any(parsing_type is None for parsing_type in _parsing_types(marker).values())):
+        if marker.type_check(data_frame, strict=True):
+            return
+    elif marker.check_element_types(data_frame):
+        return
+    mark_validated(data_frame, marker.spec)
+
+
+def read_csv(filepath_or_buffer: Any, spec: ReaderSpec, **kwargs) -> pd.DataFrame:
+    """Read a CSV file into a data frame conforming to the given type specification.
+
+    The columns and types of the type specification are passed to ``pd.read_csv`` as 'usecols' and 'dtype'
+    arguments, such that only the specified columns are parsed and no type inference takes place. Date time columns
+    are passed as 'parse_dates' argument. Columns matching column patterns of the type specification are parsed as
+    well, their types are inferred and cast to the specified types afterwards if the casts are safe (see
+    ``PandasTypeCheckConfiguration.safe_casts``), other columns keep their inferred types. The returned data frame is
+    marked as validated against the type specification, such that the type check decorator skips checking it again,
+    unless the type specification is a Pandera schema. Arguments changing the columns or types of the data frame, e.g.
+    'index_col', 'names', 'header' or 'converters', and columns which could not be cast cause a type check before
+    marking it.
+
+    Args:
+        filepath_or_buffer: Path or file-like object passed to ``pd.read_csv``
+        spec: Data frame type check marker, dict of column name -> data type, or Pandera ``DataFrameSchema``
+        **kwargs: Additional keyword arguments passed to ``pd.read_csv``, overriding the derived arguments
+
+    Returns:
+        The data frame read from the given CSV file.
+    """
+    marker = _as_type_check_marker(spec)
+    parsing_types = _parsing_types(marker)
+
+    parse_dates = [column_name for column_name, parsing_type in parsing_types.items()
+                   if parsing_type is not None and pd.api.types.is_datetime64_any_dtype(parsing_type)]
+    dtype: Dict[Any, Any] = {column_name: parsing_type for column_name, parsing_type in parsing_types.items()
+                             if parsing_type is not None and column_name not in parse_dates}
+    derived_kwargs: Dict[str, Any] = {'usecols': _specified_columns(marker), 'dtype': dtype}
+    if parse_dates:
+        derived_kwargs['parse_dates'] = parse_dates
+
+    data_frame = pd.read_csv(filepath_or_buffer, **{**derived_kwargs, **kwargs})
+    data_frame, mismatched = _cast_to_expected_types(data_frame, marker, parsed_from_text=True)
+    _mark_if_valid(data_frame, marker, verify=mismatched or any(key in kwargs for key in _CSV_OVERRIDING_KWARGS))
+
+    return data_frame
+
+
+def read_parquet(path: Any, spec: ReaderSpec, **kwargs) -> pd.DataFrame:
+    """Read a Parquet file into a data frame conforming to the given type specification.
+
+    Only the columns of the type specification are read by passing them to ``pd.read_parquet`` as 'columns'
+    argument, or selecting them after reading if the type specification contains column patterns. Columns whose
+    stored types differ from the specified types are cast in a single batch if the casts are safe (see
+    ``PandasTypeCheckConfiguration.safe_casts``). Columns which cannot be cast without loss, e.g. float columns
+    specified as integers, keep their stored types and are reported by the type check. The returned data frame is
+    marked as validated against the type specification if it conforms to it, such that the type check decorator skips
+    checking it again, unless the type specification is a Pandera schema.
+
+    Args:
+        path: Path or file-like object passed to ``pd.read_parquet``
+        spec: Data frame type check marker, dict of column name -> data type, or Pandera ``DataFrameSchema``
+        **kwargs: Additional keyword arguments passed to ``pd.read_parquet``, overriding the derived arguments
+
+    Returns:
+        The data frame read from the given Parquet file.
+    """
+    marker = _as_type_check_marker(spec)
+
+    specified_columns = _specified_columns(marker)
+    derived_kwargs: Dict[str, Any] = {'columns': specified_columns} if isinstance(specified_columns, list) else {}
+    data_frame = pd.read_parquet(path, **{**derived_kwargs, **kwargs})
+    if callable(specified_columns) and 'columns' not in kwargs:
+        data_frame = data_frame[[column_name for column_name in data_frame.columns if specified_columns(column_name)]]
+    data_frame, mismatched = _cast_to_expected_types(data_frame, marker)
+    _mark_if_valid(data_frame, marker,
+                   verify=mismatched or any(key in kwargs for key in _PARQUET_OVERRIDING_KWARGS))
+
+    return data_frame
@@ -0,0 +1,323 @@
+import inspect
+import json
+import os
+import threading
+import weakref
+from collections import Counter
+from functools import wraps
+from typing import Any, Callable, Dict, List, MutableMapping, Optional, Tuple, Union
+
+import pandas as pd
+
+from pandas_type_checks.fingerprint import structural_fingerprint
+
+# Name of the recorded target for the return value of a function
+RETURN_VALUE = 'return'
+
+# Structural fingerprint of a recorded data frame or series:
+# (kind, column labels, column dtypes, index names, index level dtypes)
+RecordedFingerprint = Tuple[str, Tuple[Any, ...], Tuple[Any, ...], Tuple[Any, ...], Tuple[Any, ...]]
+
+
+def _index_fingerprint(index: pd.Index) -> Tuple[Tuple[Any, ...], Tuple[Any, ...]]:
+    if isinstance(index, pd.MultiIndex):
+        return tuple(index.names), tuple(level.dtype for level in index.levels)
+    return tuple(index.names), (index.dtype,)
+
+
+def recorded_fingerprint(value: Union[pd.DataFrame, pd.Series]) -> RecordedFingerprint:
+    """Compute the fingerprint of the structure of a data frame or series, including the structure of its index.
+
+    The fingerprint is computed from metadata only, no column data is accessed or copied.
+    """
+    index_names, index_types = _index_fingerprint(value.index)
+    if isinstance(value, pd.DataFrame):
+        columns, column_types = structural_fingerprint(value)
+        return 'DataFrame', columns, column_types, index_names, index_types
+    return 'Series', (), (value.dtype,), index_names, index_types
+
+
+class RecordedStructure(object):
+    """
+    Structures observed for an argument or the return value of a function in recording mode.
+
+    Observations are deduplicated by their structural fingerprint, i.e. each distinct structure (layout) is stored
+    once together with the number of times it has been observed. If both data frames and series are recorded for the
+    same target, the observations of both kinds are kept and the varying kind is reported. Column and dtype variance
+    is reported for the observations of the first recorded kind only.
+
+    Attributes:
+        kind: Kind of the first recorded value, either 'DataFrame' or 'Series'
+        observations: Structural fingerprint -> number of observations
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.observations: Dict[RecordedFingerprint, int] = {}
+
+    @property
+    def num_observations(self) -> int:
+        """Number of recorded values."""
+        return sum(self.observations.values())
+
+    @property
+    def num_layouts(self) -> int:
+        """Number of distinct structures among the recorded values."""
+        return len(self.observations)
+
+    @property
+    def varying_kinds(self) -> Dict[str, int]:
+        """Kind -> number of observations, if both data frames and series have been recorded. Empty otherwise."""
+        kind_counts: Counter = Counter()
+        for fingerprint, count in self.observations.items():
+            kind_counts[fingerprint[0]] += count
+        return dict(kind_counts.most_common()) if len(kind_counts) > 1 else {}
+
+    def _kind_observations(self) -> Dict[RecordedFingerprint, int]:
+        # Observations of the first recorded kind
+        return {fingerprint: count for fingerprint, count in self.observations.items() if fingerprint[0] == self.kind}
+
+    def _column_type_counts(self) -> Dict[Any, Counter]:
+        # Column name -> dtype name -> number of observations, in the order the columns were first observed
+        column_type_counts: Dict[Any, Counter] = {}
+        for (_, columns, column_types, _, _), count in self._kind_observations().items():
+            for column_name, column_type in zip(columns, column_types):
+                column_type_counts.setdefault(column_name, Counter())[str(column_type)] += count
+        return column_type_counts
+
+    @property
+    def missing_columns(self) -> Dict[Any, int]:
+        """Column name -> number of observations without the column, for data frame columns which are sometimes
+        missing."""
+        num_observations = sum(self._kind_observations().values())
+        return {column_name: num_observations - sum(type_counts.values())
+                for column_name, type_counts in self._column_type_counts().items()
+                if sum(type_counts.values()) < num_observations}
+
+    @property
+    def varying_dtypes(self) -> Dict[Any, Dict[str, int]]:
+        """Column name -> dtype name -> number of observations, for data frame columns whose dtype varies.
+        For series the column name is None."""
+        varying_dtypes: Dict[Any, Dict[str, int]] = {}
+        if self.kind == 'Series':
+            dtype_counts: Counter = Counter()
+            for (_, _, (dtype,), _, _), count in self._kind_observations().items():
+                dtype_counts[str(dtype)] += count
+            if len(dtype_counts) > 1:
+                varying_dtypes[None] = dict(dtype_counts.most_common())
+            return varying_dtypes
+        for column_name, type_counts in self._column_type_counts().items():
+            if len(type_counts) > 1:
+                varying_dtypes[column_name] = dict(type_counts.most_common())
+        return varying_dtypes
+
+    def inferred_spec(self) -> Optional[Union[str, Dict[Any, str]]]:
+        """Infer a type specification from the recorded structures.
+
+        For data frames the inferred specification contains all columns which are present in every observation with
+        a single dtype. Columns which are sometimes missing or whose dtype varies are left out, they are listed in
+        ``missing_columns`` and ``varying_dtypes``. For series the inferred specification is the dtype name, or None
+        if the dtype varies. If both data frames and series have been recorded, no specification is inferred.
+        """
+        if self.varying_kinds:
+            return None
+        if self.kind == 'Series':
+            dtype_names = {str(column_types[0]) for (_, _, column_types, _, _) in self.observations}
+            return dtype_names.pop() if len(dtype_names) == 1 else None
+        num_observations = self.num_observations
+        return {column_name: next(iter(type_counts))
+                for column_name, type_counts in self._column_type_counts().items()
+                if len(type_counts) == 1 and sum(type_counts.values()) == num_observations}
+
+    def inferred_index(self) -> Optional[Dict[str, List[Any]]]:
+        """Infer the names and level dtype names of the index, if the index structure is the same for all
+        observations and the index is named or a ``MultiIndex``. Returns None otherwise."""
+        index_structures = {(index_names, tuple(str(index_type) for index_type in index_types))
+                            for (_, _, _, index_names, index_types) in self.observations}
+        if len(index_structures) != 1:
+            return None
+        index_names, index_types = index_structures.pop()
+        if len(index_names) == 1 and index_names[0] is None:
+            return None
+        return {'names': list(index_names), 'levels': list(index_types)}
+
+    def report(self) -> Dict[str, Any]:
+        """Summary of the recorded structures, i.e. the inferred type specification and the variance report."""
+        return {
+            'kind': self.kind,
+            'observations': self.num_observations,
+            'layouts': self.num_layouts,
+            'spec': self.inferred_spec(),
+            'index': self.inferred_index(),
+            'missing_columns': self.missing_columns,
+            'varying_dtypes': self.varying_dtypes,
+            'varying_kinds': self.varying_kinds
+        }
+
+
+def _json_keys(value: Any) -> Any:
+    # JSON objects only support string keys, other column names are converted to their string representation
+    if isinstance(value, dict):
+        return {key if isinstance(key, str) else str(key): _json_keys(item) for key, item in value.items()}
+    return value
+
+
+class StructureRecorder(object):
+    """
+    Recorder for the structures (i.e. columns, dtypes and index) of Pandas data frame and series arguments and return
+    values of functions.
+
+    Recorded values are deduplicated by their structural fingerprint. Once a structure has been seen, recording it
+    again costs the computation of its fingerprint and one dictionary lookup. The recorded structures are turned into
+    inferred type specifications and variance reports, which can be dumped to a JSON file or rendered as type check
+    decorators.
+    """
+
+    def __init__(self):
+        # Function name -> argument name or 'return' -> recorded structures
+        self._structures: Dict[str, Dict[str, RecordedStructure]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, function_name: str, target: str, value: Any) -> None:
+        """Record the structure of a Pandas data frame or series passed to or returned from a function.
+        Other values are ignored.
+
+        Args:
+            function_name: Qualified name of the function
+            target: Name of the argument, or 'return' for the return value
+            value: Value of the argument or return value
+        """
+        if not isinstance(value, (pd.DataFrame, pd.Series)):
+            return
+        fingerprint = recorded_fingerprint(value)
+        with self._lock:
+            function_structures = self._structures.setdefault(function_name, {})
+            structure = function_structures.get(target)
+            if structure is None:
+                structure = function_structures[target] = RecordedStructure(fingerprint[0])
+            structure.observations[fingerprint] = structure.observations.get(fingerprint, 0) + 1
+
+    def record_arguments(self, func: Callable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        """Record the structures of all Pandas data frame and series arguments of a call of the given function."""
+        function_name = qualified_name(func)
+        for arg_name, arg in zip(_positional_parameters(func), args):
+            self.record(function_name, arg_name, arg)
+        for arg_name, arg in kwargs.items():
+            self.record(function_name, arg_name, arg)
+
+    @property
+    def structures(self) -> Dict[str, Dict[str, RecordedStructure]]:
+        """Function name -> argument name or 'return' -> recorded structures."""
+        with self._lock:
+            return {function_name: dict(function_structures)
+                    for function_name, function_structures in self._structures.items()}
+
+    def report(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Inferred type specifications and variance reports for all recorded functions.
+
+        Returns:
+            Function name -> argument name or 'return' -> report with the kind of the recorded values, the number of
+            observations and distinct layouts, the inferred type specification and index, the columns which are
+            sometimes missing, the columns whose dtypes vary and the number of observations per kind if both data
+            frames and series have been recorded.
+        """
+        return {function_name: {target: structure.report() for target, structure in function_structures.items()}
+                for function_name, function_structures in self.structures.items()}
+
+    def dump(self, path: Union[str, os.PathLike]) -> None:
+        """Write the report of all recorded functions to a JSON file."""
+        with open(path, 'w') as file:
+            json.dump(_json_keys(self.report()), file, indent=2)
+
+    def to_decorator(self, function_name: str) -> str:
+        """Render the inferred type specifications of a recorded function as ``pandas_type_check`` decorator.
+
+        Arguments and return values without an inferred type specification, i.e. series with varying dtypes or targets
+        recorded as both data frames and series, are left out.
+
+        Raises:
+            KeyError: If no values have been recorded for the given function.
+        """
+        function_structures = self.structures.get(function_name)
+        if function_structures is None:
+            raise KeyError(f"No recorded structures for function '{function_name}'.")
+
+        markers: List[str] = []
+        return_marker: Optional[str] = None
+        for target, structure in function_structures.items():
+            spec = structure.inferred_spec()
+            if spec is None:
+                continue
+            index = structure.inferred_index()
+            marker_args = [repr(spec)]
+            if target != RETURN_VALUE:
+                marker_args.insert(0, repr(target))
+            if index is not None:
+                marker_args.append(f"index=IndexSpec(levels={index['levels']!r}, names={index['names']!r})")
+            marker_type = f"{structure.kind}{'ReturnValue' if target == RETURN_VALUE else 'Argument'}"
+            marker = f"    {marker_type}({', '.join(marker_args)})"
+            if target == RETURN_VALUE:
+                return_marker = marker
+            else:
+                markers.append(marker)
+        if return_marker is not None:
+            markers.append(return_marker)
+        return "@pandas_type_check(\n" + ",\n".join(markers) + "\n)"
+
+    def clear(self) -> None:
+        """Remove all recorded structures."""
+        with self._lock:
+            self._structures.clear()
+
+
+structure_recorder = StructureRecorder()
+
+
+def qualified_name(func: Callable) -> str:
+    """Get the qualified name of a function, including its module, under which its structures are recorded."""
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+# Function -> names of its positional parameters, as long as the function is alive
+_positional_parameter_names: MutableMapping[Callable, List[str]] = weakref.WeakKeyDictionary()
+
+
+def _positional_parameters(func: Callable) -> List[str]:
+    try:
+        return _positional_parameter_names[func]
+    except (KeyError, TypeError):
+        pass
+    parameter_names = [parameter.name for parameter in inspect.signature(func).parameters.values()
+                       if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY,
+                                             inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    try:
+        _positional_parameter_names[func] = parameter_names
+    except TypeError:
+        # Callables which cannot be referenced weakly are not cached
+        pass
+    return parameter_names
+
+
+def observe(func: Optional[Callable] = None):
+    """A decorator recording the structures of the Pandas data frame and series arguments and return value of a
+    function, without type checking them.
+
+    The recorded structures are available from ``structure_recorder`` as inferred type specifications and variance
+    reports. The decorator can be applied with or without parentheses, i.e. ``@observe`` or ``@observe()``.
+    """
+
+    def observe_decorator(wrapped_func: Callable) -> Callable:
+        function_name = qualified_name(wrapped_func)
+
+        @wraps(wrapped_func)
+        def observe_wrapper(*func_args, **func_kwargs):
+            structure_recorder.record_arguments(wrapped_func, func_args, func_kwargs)
+            ret_value = wrapped_func(*func_args, **func_kwargs)
+            structure_recorder.record(function_name, RETURN_VALUE, ret_value)
+            return ret_value
+
+        return observe_wrapper
+
+    if func is not None:
+        return observe_decorator(func)
+    return observe_decorator
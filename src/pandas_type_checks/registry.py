@@ -0,0 +1,265 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+import pandas as pd
+
+# Version of the on-disk format of compiled schema files, part of the cache key
+CACHE_FORMAT_VERSION = 2
+
+
+def default_cache_dir() -> Path:
+    """Get the default directory for compiled schema files.
+
+    The directory is taken from the 'PANDAS_TYPE_CHECKS_CACHE_DIR' environment variable, and defaults to
+    'pandas_type_checks' in the user's cache directory ('XDG_CACHE_HOME' or '~/.cache').
+    """
+    if 'PANDAS_TYPE_CHECKS_CACHE_DIR' in os.environ:
+        return Path(os.environ['PANDAS_TYPE_CHECKS_CACHE_DIR'])
+    return Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'pandas_type_checks'
+
+
+class CompiledSchema(object):
+    """
+    Compiled, immutable form of a named data frame type specification.
+
+    Compiled schemas hold the resolved dtypes of a type specification. They are interned by the schema registry,
+    i.e. all type check markers referencing a schema by name share a single compiled schema.
+
+    Attributes:
+        name: Name of the schema
+        spec: Type specification, i.e. dict of column name or column pattern -> data type, or Pandera
+            ``DataFrameSchema``
+        column_types: Read-only mapping of column name -> resolved dtype for the columns specified by name
+        column_patterns: Read-only mapping of column pattern -> resolved dtype
+    """
+
+    __slots__ = ('name', 'spec', 'column_types', 'column_patterns')
+    name: str
+    spec: Any
+    column_types: Mapping[Any, Any]
+    column_patterns: Mapping[Any, Any]
+
+    def __init__(self, name: str, spec: Any, column_types: Mapping[Any, Any], column_patterns: Mapping[Any, Any]):
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'spec', spec)
+        object.__setattr__(self, 'column_types', MappingProxyType(dict(column_types)))
+        object.__setattr__(self, 'column_patterns', MappingProxyType(dict(column_patterns)))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Compiled schema '{self.name}' is immutable")
+
+    def __reduce__(self):
+        return CompiledSchema, (self.name, self.spec, dict(self.column_types), dict(self.column_patterns))
+
+    def __repr__(self) -> str:
+        return f"CompiledSchema('{self.name}', {len(self.column_types)} columns)"
+
+
+def compile_schema(name: str, spec: Any) -> CompiledSchema:
+    """Compile a data frame type specification, resolving the dtypes of its columns and column patterns.
+
+    Args:
+        name: Name of the schema
+        spec: Dict of column name or column pattern -> data type, or Pandera ``DataFrameSchema``
+
+    Returns:
+        The compiled schema.
+    """
+    from pandas_type_checks.core import resolve_column_types
+
+    column_types, column_patterns = resolve_column_types(spec)
+    return CompiledSchema(name, spec, column_types, column_patterns)
+
+
+def _resolve_dtype_name(dtype_name: str) -> Any:
+    # Resolve the name of a resolved dtype, as stored in compiled schema files, back to the dtype
+    from pandas_type_checks.dtypes import DtypeClass, as_dtype_class
+
+    dtype = as_dtype_class(dtype_name)
+    return dtype if isinstance(dtype, DtypeClass) else pd.api.types.pandas_dtype(dtype)
+
+
+def _compiled_schemas_to_json(compiled_schemas: Dict[str, CompiledSchema]) -> Optional[str]:
+    """Serialize compiled schemas as the type specifications and the names of their resolved column dtypes.
+
+    Returns:
+        The JSON document, or None if a schema cannot be restored from it exactly, e.g. because a dtype name does not
+        resolve to the same dtype again.
+    """
+    data = {
+        name: {'spec': compiled_schema.spec,
+               'column_types': {column_name: str(column_type)
+                                for column_name, column_type in compiled_schema.column_types.items()}}
+        for name, compiled_schema in compiled_schemas.items()
+    }
+    try:
+        document = json.dumps(data)
+    except (TypeError, ValueError):
+        return None
+    if json.loads(document) != data or any(
+            compiled_schema.column_patterns
+            or any(_resolve_dtype_name(str(column_type)) != column_type
+                   for column_type in compiled_schema.column_types.values())
+            for compiled_schema in compiled_schemas.values()):
+        return None
+    return document
+
+
+def _compiled_schemas_from_json(document: str) -> Dict[str, CompiledSchema]:
+    data = json.loads(document)
+    return {
+        name: CompiledSchema(name, schema['spec'],
+                             {column_name: _resolve_dtype_name(dtype_name)
+                              for column_name, dtype_name in schema['column_types'].items()}, {})
+        for name, schema in data.items()
+    }
+
+
+def _parse_schema_file(path: Path, content: bytes) -> Dict[str, Dict[str, str]]:
+    if path.suffix in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError as err:
+            raise ImportError(f"Loading schema file '{path}' requires PyYAML. "
+                              f"Install it with 'pip install pandas-type-checks[yaml]'.") from err
+        schemas = yaml.safe_load(content)
+    else:
+        schemas = json.loads(content)
+
+    if not isinstance(schemas, dict) or not all(isinstance(spec, dict) for spec in schemas.values()):
+        raise ValueError(f"Invalid schema file '{path}'. Expected a mapping of schema name -> "
+                         f"mapping of column name -> data type.")
+    return schemas
+
+
+class SchemaRegistry(object):
+    """
+    Registry of named data frame type specifications.
+
+    Type specifications are declared once by name, either in Python or in JSON or YAML schema files, and referenced
+    by name from data frame type check markers. Each schema is compiled once on first use into an immutable
+    ``CompiledSchema`` shared by all markers referencing it.
+
+    Schema files are compiled as a whole and cached on disk, keyed by the hash of the file content and the Pandas
+    version, such that processes loading the same file, e.g. worker processes, load the precompiled schemas instead
+    of parsing and resolving them again. Compiled schema files are JSON documents holding the names of the resolved
+    dtypes, i.e. no code is executed when loading them.
+    """
+
+    def __init__(self):
+        self._specs: Dict[str, Any] = {}
+        self._compiled_schemas: Dict[str, CompiledSchema] = {}
+        self._loaded_files: Dict[str, List[str]] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, spec: Any) -> None:
+        """Register a data frame type specification under the given name.
+
+        Args:
+            name: Name of the schema
+            spec: Dict of column name or column pattern -> data type, or Pandera ``DataFrameSchema``
+
+        Raises:
+            ValueError: If a schema with the given name has already been registered.
+        """
+        with self._lock:
+            if name in self._specs:
+                raise ValueError(f"Schema '{name}' is already registered.")
+            self._specs[name] = spec
+
+    def get(self, name: str) -> CompiledSchema:
+        """Get the compiled schema registered under the given name, compiling it on first use.
+
+        Raises:
+            KeyError: If no schema has been registered under the given name.
+        """
+        compiled_schema = self._compiled_schemas.get(name)
+        if compiled_schema is not None:
+            return compiled_schema
+
+        with self._lock:
+            if name not in self._specs:
+                raise KeyError(f"Unknown schema '{name}'. Register it with 'schema_registry.register' or load it "
+                               f"from a schema file with 'schema_registry.load'.")
+            if name not in self._compiled_schemas:
+                self._compiled_schemas[name] = compile_schema(name, self._specs[name])
+            return self._compiled_schemas[name]
+
+    def load(self, path: Union[str, os.PathLike], cache_dir: Optional[Union[str, os.PathLike]] = None,
+             use_cache: bool = True) -> List[str]:
+        """Load and register the schemas declared in a JSON or YAML schema file.
+
+        Schema files contain a mapping of schema name -> mapping of column name -> data type name, e.g.
+        ``{"orders": {"order_id": "int64", "amount": "float64"}}``. Files with the suffix '.yaml' or '.yml' are
+        parsed as YAML, all other files as JSON. Loading the same file content again has no effect.
+
+        Args:
+            path: Path of the schema file
+            cache_dir: (Optional) Directory for compiled schema files. Defaults to ``default_cache_dir()``.
+            use_cache: Flag for loading and storing compiled schemas from and in the cache directory
+
+        Returns:
+            The names of the schemas declared in the schema file.
+        """
+        path = Path(path)
+        content = path.read_bytes()
+        key = hashlib.sha256(content + f'|{pd.__version__}|{CACHE_FORMAT_VERSION}'.encode()).hexdigest()
+
+        with self._lock:
+            if key in self._loaded_files:
+                return list(self._loaded_files[key])
+
+            cache_file = Path(cache_dir if cache_dir is not None else default_cache_dir()) / f'{key}.json'
+            compiled_schemas = self._read_cache_file(cache_file) if use_cache else None
+            if compiled_schemas is None:
+                compiled_schemas = {name: compile_schema(name, spec)
+                                    for name, spec in _parse_schema_file(path, content).items()}
+                if use_cache:
+                    self._write_cache_file(cache_file, compiled_schemas)
+
+            for name in compiled_schemas:
+                if name in self._specs:
+                    raise ValueError(f"Schema '{name}' declared in schema file '{path}' is already registered.")
+            for name, compiled_schema in compiled_schemas.items():
+                self._specs[name] = compiled_schema.spec
+                self._compiled_schemas[name] = compiled_schema
+            self._loaded_files[key] = list(compiled_schemas)
+            return list(compiled_schemas)
+
+    @staticmethod
+    def _read_cache_file(cache_file: Path) -> Optional[Dict[str, CompiledSchema]]:
+        try:
+            return _compiled_schemas_from_json(cache_file.read_text())
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    @staticmethod
+    def _write_cache_file(cache_file: Path, compiled_schemas: Dict[str, CompiledSchema]) -> None:
+        document = _compiled_schemas_to_json(compiled_schemas)
+        if document is None:
+            return
+        # Write to a temporary file first, such that concurrent readers never see partially written cache files
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=cache_file.parent, delete=False) as file:
+                file.write(document)
+            os.replace(file.name, cache_file)
+        except OSError:
+            pass
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    @property
+    def names(self) -> List[str]:
+        """Names of all registered schemas."""
+        return list(self._specs)
+
+
+schema_registry = SchemaRegistry()
@@ -0,0 +1,295 @@
+"""
+Type check statistics shared by all processes of a pre-fork deployment through a memory-mapped counter file.
+
+Usage: python -m pandas_type_checks.shared_counters <counter file> [--json]
+"""
+import argparse
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import weakref
+from typing import Dict, List, MutableMapping, Optional, Tuple, Union
+
+# File layout: header (magic, version, number of slots) followed by fixed-size slots. Each slot holds the key digest of
+# a decorated function, its qualified name, and the counters calls, failures and check time in nanoseconds.
+MAGIC = b'PDTCCNT\x00'
+VERSION = 1
+HEADER = struct.Struct('<8sII')
+HEADER_SIZE = 64
+SLOT_KEY = struct.Struct('<Q88s')
+SLOT_COUNTERS = struct.Struct('<QQQ')
+SLOT_SIZE = 128
+MAX_NAME_LENGTH = 88
+
+# Number of locks striping the slots within a process, POSIX record locks do not exclude threads of the same process
+NUM_THREAD_LOCKS = 64
+
+
+def _key_digest(name: str) -> int:
+    # Non-zero 64 bit digest of a qualified function name, zero marks free slots
+    return int.from_bytes(hashlib.blake2b(name.encode('utf-8'), digest_size=8).digest(), 'little') or 1
+
+
+def _slot_name(name: str) -> bytes:
+    # Encoded qualified function name stored in a slot. Names longer than the slot's name field are shortened to a
+    # prefix and a hash of the full name, such that long names sharing a prefix stay distinct.
+    encoded_name = name.encode('utf-8')
+    if len(encoded_name) <= MAX_NAME_LENGTH:
+        return encoded_name
+    name_hash = hashlib.blake2b(encoded_name, digest_size=8).hexdigest().encode('ascii')
+    return encoded_name[:MAX_NAME_LENGTH - len(name_hash) - 1] + b'#' + name_hash
+
+
+class _CounterFile(object):
+    # Descriptor, memory map and thread locks of a counter file, shared by all SharedCounters instances of a process
+    # which opened the file. POSIX record locks are held per process and file, i.e. closing any descriptor of the file
+    # releases all locks of the process on it and the locks of one descriptor do not exclude another one. Each process
+    # therefore keeps a single descriptor per counter file.
+
+    def __init__(self, fd: int, num_slots: int):
+        self.fd = fd
+        stat = os.fstat(fd)
+        self.key = (stat.st_dev, stat.st_ino)
+        self.num_slots = num_slots
+        self.mmap = mmap.mmap(fd, HEADER_SIZE + num_slots * SLOT_SIZE)
+        self.num_users = 0
+        self.reset_thread_locks()
+        self._finalizer = weakref.finalize(self, _close_counter_file, self.mmap, fd)
+
+    def reset_thread_locks(self) -> None:
+        self.thread_locks = [threading.Lock() for _ in range(NUM_THREAD_LOCKS)]
+
+    def close(self) -> None:
+        self._finalizer()
+
+
+def _close_counter_file(file_mmap: mmap.mmap, fd: int) -> None:
+    file_mmap.close()
+    os.close(fd)
+
+
+# (device, inode) -> counter file opened by the current process, as long as it is used by a SharedCounters instance
+_counter_files: MutableMapping[Tuple[int, int], _CounterFile] = weakref.WeakValueDictionary()
+_counter_files_lock = threading.Lock()
+
+
+def _reset_thread_locks() -> None:
+    # Locks held by other threads while forking are never released in the child process
+    global _counter_files_lock
+    _counter_files_lock = threading.Lock()
+    for counter_file in list(_counter_files.values()):
+        counter_file.reset_thread_locks()
+
+
+os.register_at_fork(after_in_child=_reset_thread_locks)
+
+
+def _open_counter_file(path: str, num_slots: int) -> _CounterFile:
+    # Open the counter file at the given path, or share the descriptor of the current process if it is already open
+    with _counter_files_lock:
+        try:
+            stat = os.stat(path)
+            counter_file = _counter_files.get((stat.st_dev, stat.st_ino))
+        except FileNotFoundError:
+            counter_file = None
+        if counter_file is None:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.lockf(fd, fcntl.LOCK_EX, HEADER_SIZE, 0)
+                try:
+                    if os.fstat(fd).st_size == 0:
+                        os.ftruncate(fd, HEADER_SIZE + num_slots * SLOT_SIZE)
+                        os.pwrite(fd, HEADER.pack(MAGIC, VERSION, num_slots), 0)
+                    magic, version, num_slots = HEADER.unpack(os.pread(fd, HEADER.size, 0))
+                    if magic != MAGIC or version != VERSION:
+                        raise ValueError(f"File '{path}' is not a type check counter file of version {VERSION}.")
+                finally:
+                    fcntl.lockf(fd, fcntl.LOCK_UN, HEADER_SIZE, 0)
+                counter_file = _CounterFile(fd, num_slots)
+            except BaseException:
+                os.close(fd)
+                raise
+            _counter_files[counter_file.key] = counter_file
+        counter_file.num_users += 1
+        return counter_file
+
+
+class FunctionCounters(object):
+    """
+    Snapshot of the type check statistics of a decorated function, aggregated over all processes.
+
+    Attributes:
+        calls: Number of type checked calls
+        failures: Number of calls with type errors
+        check_time: Total time in seconds spent type checking arguments and return values
+    """
+
+    def __init__(self, calls: int, failures: int, check_time: float):
+        self.calls = calls
+        self.failures = failures
+        self.check_time = check_time
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        return {'calls': self.calls, 'failures': self.failures, 'check_time': self.check_time}
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FunctionCounters) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"FunctionCounters(calls={self.calls}, failures={self.failures}, check_time={self.check_time})"
+
+
+class SharedCounters(object):
+    """
+    Counters of type checked calls, failures and check time per decorated function in a memory-mapped file, shared by
+    all processes opening the file or inheriting it from a parent process, e.g. the workers of a pre-fork server.
+
+    Functions are assigned to fixed-size slots of the file by a hash of their qualified name. Increments of a slot are
+    guarded by a POSIX record lock on the slot's byte range, i.e. locks are striped by function, and by a process-local
+    thread lock. The file is created with ``num_slots`` slots if it does not exist, otherwise its existing layout is
+    used. Counts of functions which do not fit into the file anymore are dropped and counted in ``dropped_updates``.
+    Instances opening the same file within a process share its descriptor, memory map and thread locks.
+
+    Set ``PandasTypeCheckConfiguration.shared_counters`` to count the calls of all decorated functions, e.g. in the
+    master process before forking the workers. Read the aggregated counters of all processes with ``snapshot``, or with
+    ``python -m pandas_type_checks.shared_counters <counter file>``.
+
+    Attributes:
+        path: Path of the counter file
+        num_slots: Number of slots of the counter file, i.e. maximum number of counted functions
+        dropped_updates: Number of updates of the current process dropped because all slots were taken
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], num_slots: int = 4096):
+        self.path = os.fspath(path)
+        self.dropped_updates = 0
+        self._file: Optional[_CounterFile] = _open_counter_file(self.path, num_slots)
+        self.num_slots = self._file.num_slots
+        self._mmap = self._file.mmap
+
+        # Qualified function name -> slot offset, cached per process
+        self._slot_offsets: Dict[str, Optional[int]] = {}
+
+    def _lock_slot(self, offset: int) -> threading.Lock:
+        counter_file = self._counter_file()
+        thread_lock = counter_file.thread_locks[(offset // SLOT_SIZE) % NUM_THREAD_LOCKS]
+        thread_lock.acquire()
+        fcntl.lockf(counter_file.fd, fcntl.LOCK_EX, SLOT_SIZE, offset)
+        return thread_lock
+
+    def _unlock_slot(self, offset: int, thread_lock: threading.Lock) -> None:
+        fcntl.lockf(self._counter_file().fd, fcntl.LOCK_UN, SLOT_SIZE, offset)
+        thread_lock.release()
+
+    def _counter_file(self) -> _CounterFile:
+        if self._file is None:
+            raise ValueError(f"Counter file '{self.path}' has been closed.")
+        return self._file
+
+    def _find_slot(self, name: str) -> Optional[int]:
+        # Linear probing from the slot given by the key digest, claiming the first free slot for new functions. Slots
+        # are probed under their lock, as other processes may be claiming them concurrently.
+        digest = _key_digest(name)
+        encoded_name = _slot_name(name)
+        for probe in range(self.num_slots):
+            offset = HEADER_SIZE + ((digest + probe) % self.num_slots) * SLOT_SIZE
+            thread_lock = self._lock_slot(offset)
+            try:
+                slot_digest, slot_name = SLOT_KEY.unpack_from(self._mmap, offset)
+                if slot_digest == 0:
+                    SLOT_KEY.pack_into(self._mmap, offset, digest, encoded_name)
+                    return offset
+                if slot_digest == digest and slot_name.rstrip(b'\x00') == encoded_name:
+                    return offset
+            finally:
+                self._unlock_slot(offset, thread_lock)
+        return None
+
+    def record(self, name: str, failed: bool, check_time_ns: int) -> None:
+        """Count a type checked call of the function with the given qualified name.
+
+        Args:
+            name: Qualified name of the decorated function
+            failed: Flag if type errors were found
+            check_time_ns: Time in nanoseconds spent type checking arguments and return value
+        """
+        try:
+            offset = self._slot_offsets[name]
+        except KeyError:
+            offset = self._slot_offsets[name] = self._find_slot(name)
+        if offset is None:
+            self.dropped_updates += 1
+            return
+        thread_lock = self._lock_slot(offset)
+        try:
+            calls, failures, check_time = SLOT_COUNTERS.unpack_from(self._mmap, offset + SLOT_KEY.size)
+            SLOT_COUNTERS.pack_into(self._mmap, offset + SLOT_KEY.size, calls + 1, failures + failed,
+                                    check_time + check_time_ns)
+        finally:
+            self._unlock_slot(offset, thread_lock)
+
+    def snapshot(self) -> Dict[str, FunctionCounters]:
+        """Read the counters of all functions, aggregated over all processes.
+
+        Returns:
+            Qualified function name -> counters, names longer than 88 bytes are shortened to a prefix and a hash
+        """
+        snapshot: Dict[str, FunctionCounters] = {}
+        for slot in range(self.num_slots):
+            offset = HEADER_SIZE + slot * SLOT_SIZE
+            if SLOT_KEY.unpack_from(self._mmap, offset)[0] == 0:
+                continue
+            thread_lock = self._lock_slot(offset)
+            try:
+                _, name = SLOT_KEY.unpack_from(self._mmap, offset)
+                calls, failures, check_time = SLOT_COUNTERS.unpack_from(self._mmap, offset + SLOT_KEY.size)
+            finally:
+                self._unlock_slot(offset, thread_lock)
+            snapshot[name.rstrip(b'\x00').decode('utf-8', errors='replace')] = \
+                FunctionCounters(calls, failures, check_time / 1e9)
+        return snapshot
+
+    def close(self) -> None:
+        """Unmap and close the counter file, unless other instances of the current process still use it."""
+        if self._file is None:
+            return
+        with _counter_files_lock:
+            self._file.num_users -= 1
+            if self._file.num_users == 0:
+                del _counter_files[self._file.key]
+                self._file.close()
+        self._file = None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m pandas_type_checks.shared_counters',
+                                     description="Print the type check counters of all processes sharing a file.")
+    parser.add_argument('path', help="Counter file")
+    parser.add_argument('--json', action='store_true', help="Print counters as JSON")
+    options = parser.parse_args(argv)
+    if not os.path.exists(options.path):
+        parser.error(f"Counter file '{options.path}' does not exist.")
+
+    counters = SharedCounters(options.path)
+    try:
+        snapshot = counters.snapshot()
+    finally:
+        counters.close()
+    if options.json:
+        json.dump({name: function_counters.to_dict() for name, function_counters in snapshot.items()}, sys.stdout,
+                  indent=2)
+        print()
+        return
+    print(f"{'function':<60} {'calls':>12} {'failures':>12} {'check time (s)':>16}")
+    for name, function_counters in sorted(snapshot.items()):
+        print(f"{name:<60} {function_counters.calls:>12} {function_counters.failures:>12} "
+              f"{function_counters.check_time:>16.6f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import threading
+from typing import List
+
+from pandas_type_checks.errors import PandasTypeCheckError
+
+
+class TimeBudgetCounters(object):
+    """
+    Counters of type checks whose value-level validation has been cut off because it exceeded its time budget.
+
+    Attributes:
+        timed_out_checks: Number of type checks which exceeded their time budget
+        skipped_steps: Total number of validation steps, e.g. Pandera value checks, skipped by these type checks
+    """
+
+    def __init__(self):
+        self.timed_out_checks = 0
+        self.skipped_steps = 0
+        self._lock = threading.Lock()
+
+    def record(self, num_skipped_steps: int) -> None:
+        """Record a type check which exceeded its time budget and skipped the given number of validation steps."""
+        with self._lock:
+            self.timed_out_checks += 1
+            self.skipped_steps += num_skipped_steps
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self.timed_out_checks = 0
+            self.skipped_steps = 0
+
+
+time_budget_counters = TimeBudgetCounters()
+
+
+def incomplete_validation_error(time_budget: float, skipped_steps: List[str]) -> PandasTypeCheckError:
+    """
+    Create the marker for a type check whose value-level validation exceeded its time budget.
+
+    The marker is reported together with the type errors found before the deadline, but it is not a type error
+    itself, i.e. a type check with only this marker does not fail.
+
+    Args:
+        time_budget: Time budget of the type check in seconds
+        skipped_steps: Descriptions of the skipped validation steps
+    """
+    time_budget_counters.record(len(skipped_steps))
+    error_msg = (f"Validation incomplete: time budget of {time_budget:g}s exceeded, "
+                 f"skipped {len(skipped_steps)} checks: {', '.join(skipped_steps)}")
+    return PandasTypeCheckError(error_msg=error_msg, incomplete=True)
@@ -0,0 +1,119 @@
+import inspect
+import types
+from typing import Any, Callable, Dict, List, Union
+
+import numpy as np
+import pandas as pd
+from pandas.core.dtypes.base import ExtensionDtype
+
+from pandas_type_checks.core import DataFrameArgument, DataFrameReturnValue, SeriesArgument, SeriesReturnValue
+from pandas_type_checks.core import pandera_support
+from pandas_type_checks.dtypes import DtypeClass
+from pandas_type_checks.index_spec import IndexSpec
+
+if pandera_support:
+    import pandera as pa
+
+# Import 'Annotated' from the typing module, or from the typing_extensions backport on Python 3.8
+try:
+    from typing import Annotated, get_args, get_origin, get_type_hints
+    annotated_support = True
+except ImportError:  # pragma: no cover
+    try:
+        from typing_extensions import Annotated, get_args, get_origin, get_type_hints  # type: ignore
+        annotated_support = True
+    except ImportError:
+        annotated_support = False
+
+TypeCheckMarker = Union[DataFrameArgument, DataFrameReturnValue, SeriesArgument, SeriesReturnValue]
+
+# Name of the return value annotation in '__annotations__'
+RETURN_ANNOTATION = 'return'
+
+
+def _is_data_frame_spec(item: Any) -> bool:
+    # Dict of column name -> data type, schema name or Pandera data frame schema
+    return isinstance(item, (dict, str)) or (bool(pandera_support) and isinstance(item, pa.DataFrameSchema))
+
+
+def _is_series_spec(item: Any) -> bool:
+    # Data type, dtype class or Pandera series schema
+    return isinstance(item, (str, type, np.dtype, ExtensionDtype, DtypeClass)) or (
+        bool(pandera_support) and isinstance(item, pa.SeriesSchema))
+
+
+def _marker_from_hint(name: str, hint: Any) -> Any:
+    base_type, *metadata = get_args(hint)
+    index = next((item for item in metadata if isinstance(item, IndexSpec)), None)
+    if base_type is pd.DataFrame:
+        spec = next((item for item in metadata if _is_data_frame_spec(item)), None)
+        if spec is None:
+            return None
+        if name == RETURN_ANNOTATION:
+            return DataFrameReturnValue(spec, index=index)
+        return DataFrameArgument(name, spec, index=index)
+    if base_type is pd.Series:
+        spec = next((item for item in metadata if _is_series_spec(item)), None)
+        if spec is None:
+            return None
+        if name == RETURN_ANNOTATION:
+            return SeriesReturnValue(spec, index=index)
+        return SeriesArgument(name, spec, index=index)
+    return None
+
+
+def _resolve_type_hints(func: Callable) -> Dict[str, Any]:
+    # The annotations are resolved on a namespace holding them rather than on the function itself, because
+    # 'get_type_hints' wraps the hints of parameters defaulting to None in 'Optional' before Python 3.11
+    global_namespace = inspect.unwrap(func).__globals__
+    annotations: Dict[str, Any] = getattr(func, '__annotations__', {})
+    try:
+        return get_type_hints(types.SimpleNamespace(__annotations__=annotations), globalns=global_namespace,
+                              include_extras=True)
+    except Exception:
+        pass
+    # Resolve the annotations one by one, ignoring those which cannot be resolved unless they refer to 'Annotated'
+    hints: Dict[str, Any] = {}
+    for name, annotation in annotations.items():
+        try:
+            hints.update(get_type_hints(types.SimpleNamespace(__annotations__={name: annotation}),
+                                        globalns=global_namespace, include_extras=True))
+        except Exception:
+            if isinstance(annotation, str) and 'Annotated' in annotation:
+                raise
+    return hints
+
+
+def markers_from_type_hints(func: Callable) -> List[TypeCheckMarker]:
+    """Create type check markers from the ``Annotated`` type hints of the parameters and return value of a function.
+
+    Parameters and return values annotated with ``Annotated[pd.DataFrame, spec]`` or ``Annotated[pd.Series, dtype]``
+    are turned into the corresponding data frame and series type check markers. The type specification is the first
+    metadata item which is a type specification, i.e. a dict of column name -> data type, a schema name or a Pandera
+    schema for data frames, and a data type, dtype class or Pandera ``SeriesSchema`` for series. An ``IndexSpec``
+    metadata item specifies the expected index. All other metadata items and annotations are ignored.
+
+    Type hints are resolved with ``typing.get_type_hints``, i.e. string annotations, e.g. from
+    ``from __future__ import annotations``, are evaluated in the global namespace of the function. String annotations
+    which cannot be evaluated are ignored unless they refer to ``Annotated``.
+
+    Args:
+        func: Function whose type hints are turned into type check markers
+
+    Returns:
+        The type check markers for the annotated parameters and return value, in the order of the annotations.
+
+    Raises:
+        Exception: The error raised when evaluating a string annotation referring to ``Annotated``, e.g. a
+            ``NameError`` for an undefined name.
+    """
+    if not annotated_support:
+        return []
+
+    markers: List[TypeCheckMarker] = []
+    for name, hint in _resolve_type_hints(func).items():
+        if get_origin(hint) is Annotated:
+            marker = _marker_from_hint(name, hint)
+            if marker is not None:
+                markers.append(marker)
+    return markers
@@ -0,0 +1,54 @@
+import threading
+import weakref
+from typing import Any, Dict, Tuple
+
+import pandas as pd
+
+from pandas_type_checks.fingerprint import StructuralFingerprint, structural_fingerprint
+
+# id(data frame) -> id(type specification) -> (type specification, structural fingerprint when marked)
+_validated_data_frames: Dict[int, Dict[int, Tuple[Any, StructuralFingerprint]]] = {}
+_lock = threading.Lock()
+
+
+def _forget(data_frame_id: int) -> None:
+    with _lock:
+        _validated_data_frames.pop(data_frame_id, None)
+
+
+def mark_validated(data_frame: pd.DataFrame, spec: Any) -> None:
+    """Mark a data frame as validated against the given type specification.
+
+    The type check decorator skips type checking data frames which have been marked as validated against the
+    type specification of a type check marker, as long as the structure (i.e. columns and their types) of the
+    data frame has not changed since it has been marked. Marks are dropped when the data frame is garbage
+    collected.
+
+    Args:
+        data_frame: Pandas data frame which conforms to the given type specification
+        spec: Type specification, i.e. the 'dtype' attribute of a data frame type check marker
+    """
+    data_frame_id = id(data_frame)
+    with _lock:
+        if data_frame_id not in _validated_data_frames:
+            _validated_data_frames[data_frame_id] = {}
+            weakref.finalize(data_frame, _forget, data_frame_id)
+        _validated_data_frames[data_frame_id][id(spec)] = (spec, structural_fingerprint(data_frame))
+
+
+def is_validated(data_frame: pd.DataFrame, spec: Any) -> bool:
+    """Check if a data frame has been marked as validated against the given type specification.
+
+    Args:
+        data_frame: Pandas data frame to look up
+        spec: Type specification, i.e. the 'dtype' attribute of a data frame type check marker
+
+    Returns:
+        True if the data frame has been marked as validated against the given type specification and its
+        structure has not changed since, False otherwise.
+    """
+    marks = _validated_data_frames.get(id(data_frame))
+    if not marks:
+        return False
+    mark = marks.get(id(spec))
+    return mark is not None and mark[0] is spec and mark[1] == structural_fingerprint(data_frame)
@@ -4,8 +4,12 @@ import pytest
 import pandas as pd
 import numpy as np
 
+from pandas_type_checks.coercion import DEFAULT_SAFE_CASTS
 from pandas_type_checks.core import config as pandas_type_checks_config
 
+# Fixture 'pytester' for testing the pytest plugin
+pytest_plugins = ['pytester']
+
 
 @pytest.fixture(autouse=True)
 def before_all():
@@ -19,6 +23,12 @@ def before_all():
     # Raise exceptions for type errors as default for each test
     pandas_type_checks_config.log_type_errors = False
 
+    # Use the default allow-list of safe casts for coercion for each test
+    pandas_type_checks_config.safe_casts = set(DEFAULT_SAFE_CASTS)
+
+    # Disable recording mode as default for each test
+    pandas_type_checks_config.record_structures = False
+
     yield  # run test function
 
 
@@ -0,0 +1,120 @@
+from unittest import mock
+
+import pytest
+import numpy as np
+import pandas as pd
+import pandera
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pandas_type_checks.arrow_support import type_check_arrow_schema, arrow_schema_to_pandas_dtypes
+from pandas_type_checks.core import DataFrameReturnValue
+from pandas_type_checks.dtypes import AnyBackend
+
+
+@pytest.fixture(scope='module')
+def arrow_table(data_frame) -> pa.Table:
+    return pa.Table.from_pandas(data_frame, preserve_index=False)
+
+
+@pytest.fixture(scope='module')
+def parquet_file(arrow_table, tmp_path_factory) -> str:
+    path = tmp_path_factory.mktemp('data') / 'data.parquet'
+    pq.write_table(arrow_table, path)
+    return str(path)
+
+
+def test_arrow_schema_to_pandas_dtypes(data_frame, arrow_table):
+    assert arrow_schema_to_pandas_dtypes(arrow_table.schema) == data_frame.dtypes.to_dict()
+
+
+def test_type_check_arrow_sources(data_frame_type, arrow_table, parquet_file):
+    for source in [arrow_table, arrow_table.schema, arrow_table.to_batches()[0], parquet_file]:
+        assert type_check_arrow_schema(source, data_frame_type) == []
+        assert type_check_arrow_schema(source, DataFrameReturnValue(data_frame_type)) == []
+
+
+def test_type_check_parquet_file_reads_only_metadata(data_frame_type, parquet_file):
+    with mock.patch.object(pq, 'read_table') as read_table:
+        assert type_check_arrow_schema(parquet_file, data_frame_type) == []
+        read_table.assert_not_called()
+
+
+def test_type_error_for_arrow_schema(data_frame_type, wrong_data_frame):
+    schema = pa.Schema.from_pandas(wrong_data_frame, preserve_index=False)
+
+    type_check_errors = type_check_arrow_schema(schema, data_frame_type)
+
+    assert [err.error_msg for err in type_check_errors] == [
+        "Expected type 'float64' for column A' but found type 'int64'",
+        "Missing column in DataFrame: 'B'"
+    ]
+    assert type_check_errors[0].expected_type == np.dtype('float64')
+    assert type_check_errors[0].given_type == np.dtype('int64')
+    assert type_check_errors[0].column_name == 'A'
+
+
+def test_strict_type_check_for_arrow_schema(data_frame_type, extended_data_frame):
+    schema = pa.Schema.from_pandas(extended_data_frame, preserve_index=False)
+
+    assert type_check_arrow_schema(schema, data_frame_type) == []
+    assert [err.error_msg for err in type_check_arrow_schema(schema, data_frame_type, strict=True)] == [
+        "Found unspecified column in data frame: 'D'"
+    ]
+
+
+def test_type_check_arrow_schema_with_index(data_frame_type, data_frame):
+    schema = pa.Schema.from_pandas(data_frame.set_index('B'))
+
+    # Index columns stored in the Pandas metadata are not part of the data frame columns
+    assert [err.error_msg for err in type_check_arrow_schema(schema, data_frame_type)] == [
+        "Missing column in DataFrame: 'B'"
+    ]
+
+
+def test_type_check_arrow_schema_against_pandera_schema(arrow_table):
+    schema = pandera.DataFrameSchema({
+        'A': pandera.Column(np.dtype('float64'), checks=pandera.Check.le(10.0)),
+        'B': pandera.Column(np.dtype('int32')),
+        'C': pandera.Column()
+    })
+
+    # Only the structure is checked against the Pandera schema, value checks are not evaluated
+    assert [err.error_msg for err in type_check_arrow_schema(arrow_table, schema)] == [
+        "Expected type 'int32' for column B' but found type 'int64'"
+    ]
+
+
+def test_type_check_arrow_backed_data_frame(data_frame, data_frame_type, arrow_table):
+    arrow_data_frame = arrow_table.to_pandas(types_mapper=pd.ArrowDtype)
+    assert arrow_data_frame['B'].dtype == pd.ArrowDtype(pa.int64())
+
+    # Concrete NumPy dtypes do not match Arrow-backed dtypes
+    assert len(DataFrameReturnValue(data_frame_type).type_check(arrow_data_frame, strict=False)) == 3
+
+    any_backend_type = {'A': AnyBackend('float64'), 'B': AnyBackend('int64'), 'C': AnyBackend('string')}
+    assert DataFrameReturnValue(any_backend_type).type_check(arrow_data_frame, strict=False) == []
+    assert DataFrameReturnValue(any_backend_type).type_check(data_frame, strict=False) == []
+
+    # Specific Arrow-backed dtypes
+    arrow_type = {'A': 'double[pyarrow]', 'B': pd.ArrowDtype(pa.int64()), 'C': arrow_data_frame['C'].dtype}
+    assert DataFrameReturnValue(arrow_type).type_check(arrow_data_frame, strict=False) == []
+    assert [err.column_name for err in DataFrameReturnValue(arrow_type).type_check(data_frame, strict=False)] == [
+        'A', 'B', 'C'
+    ]
+
+
+def test_any_backend_matches_arrow_dtypes():
+    assert AnyBackend('int64').matches(pd.ArrowDtype(pa.int64()))
+    assert AnyBackend('int64[pyarrow]').matches(np.dtype('int64'))
+    assert AnyBackend('string').matches(pd.ArrowDtype(pa.large_string()))
+    assert AnyBackend('datetime64[ns]').matches(pd.ArrowDtype(pa.timestamp('ns')))
+    assert not AnyBackend('int64').matches(pd.ArrowDtype(pa.int32()))
+    assert not AnyBackend('int64').matches(pd.ArrowDtype(pa.list_(pa.int64())))
+
+
+def test_type_check_arrow_schema_with_arrow_dtype_backend(arrow_table):
+    arrow_type = {'A': 'double[pyarrow]', 'B': 'int64[pyarrow]', 'C': AnyBackend('string')}
+
+    assert type_check_arrow_schema(arrow_table, arrow_type, dtype_backend='pyarrow') == []
+    assert len(type_check_arrow_schema(arrow_table, arrow_type)) == 2
@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import numpy as np
+
+from pandas_type_checks.batch import check_many
+from pandas_type_checks.core import DataFrameReturnValue
+from pandas_type_checks.dtypes import ObjectOf
+
+
+def test_check_many(data_frame, data_frame_type, wrong_data_frame, extended_data_frame):
+    result = check_many([data_frame, wrong_data_frame, data_frame.copy(), extended_data_frame], data_frame_type)
+
+    assert result.num_frames == 4
+    assert result.num_layouts == 3
+    assert result.failed_frames == [1]
+    assert result.type_check_errors[0] == []
+    assert [err.error_msg for err in result.type_check_errors[1]] == [
+        "Expected type 'float64' for column A' but found type 'int64'",
+        "Missing column in DataFrame: 'B'"
+    ]
+    assert result.error_summary == {
+        "Expected type 'float64' for column A' but found type 'int64'": 1,
+        "Missing column in DataFrame: 'B'": 1
+    }
+
+
+def test_check_many_in_strict_mode(data_frame, data_frame_type, extended_data_frame):
+    result = check_many([data_frame, extended_data_frame, extended_data_frame],
+                        DataFrameReturnValue(data_frame_type), strict=True)
+
+    assert result.failed_frames == [1, 2]
+    assert result.error_summary == {"Found unspecified column in data frame: 'D'": 2}
+
+
+def test_check_many_matches_individual_type_checks(data_frame_type):
+    data_frames = [
+        pd.DataFrame({'A': np.arange(3, dtype=dtype), 'B': np.arange(3), 'C': ['x'] * 3}).astype({'C': 'string'})
+        for dtype in ['float64', 'int64', 'float32'] * 10
+    ]
+    marker = DataFrameReturnValue(data_frame_type)
+
+    result = check_many(data_frames, marker, strict=False, executor=ThreadPoolExecutor(max_workers=2))
+
+    assert result.num_layouts == 3
+    assert ([[err.error_msg for err in errors] for errors in result.type_check_errors]
+            == [[err.error_msg for err in marker.type_check(data_frame, strict=False)] for data_frame in data_frames])
+
+
+def test_check_many_with_object_columns():
+    data_frames = [pd.DataFrame({'A': values}, dtype='object') for values in [['x', 'y'], [b'x', b'y'], ['z']]]
+
+    result = check_many(data_frames, {'A': ObjectOf(str)})
+
+    assert result.num_layouts == 1
+    assert result.failed_frames == [1]
+    assert result.error_summary == {"Expected elements of type 'str' in column 'A' but found inferred type 'bytes'": 1}
@@ -0,0 +1,122 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from pandas_type_checks import config
+from pandas_type_checks.coercion import is_safe_cast, DEFAULT_SAFE_CASTS
+from pandas_type_checks.core import SeriesReturnValue, SeriesArgument, DataFrameReturnValue, DataFrameArgument
+from pandas_type_checks.decorator import pandas_type_check
+
+
+@pytest.fixture(scope='module')
+def narrow_data_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        'A': np.array([1.0, 2.0], dtype='float32'),
+        'B': np.array([1, 2], dtype='int32'),
+        'C': np.array(['foo', 'bar'], dtype='object')
+    })
+
+
+def test_default_safe_casts():
+    assert is_safe_cast(np.dtype('int32'), np.dtype('int64'), DEFAULT_SAFE_CASTS)
+    assert is_safe_cast(np.dtype('uint16'), np.dtype('int32'), DEFAULT_SAFE_CASTS)
+    assert is_safe_cast(np.dtype('int32'), np.dtype('float64'), DEFAULT_SAFE_CASTS)
+    assert is_safe_cast(np.dtype('int64'), pd.Int64Dtype(), DEFAULT_SAFE_CASTS)
+    assert is_safe_cast(np.dtype('object'), 'string', DEFAULT_SAFE_CASTS)
+    assert is_safe_cast(np.dtype('datetime64[us]'), np.dtype('datetime64[ns]'), DEFAULT_SAFE_CASTS)
+
+    # Narrowing casts and casts which may lose precision are not safe
+    assert not is_safe_cast(np.dtype('int64'), np.dtype('int32'), DEFAULT_SAFE_CASTS)
+    assert not is_safe_cast(np.dtype('int64'), np.dtype('float64'), DEFAULT_SAFE_CASTS)
+    assert not is_safe_cast(np.dtype('float64'), np.dtype('int64'), DEFAULT_SAFE_CASTS)
+    assert not is_safe_cast(np.dtype('datetime64[ns]'), np.dtype('datetime64[s]'), DEFAULT_SAFE_CASTS)
+
+
+def test_coerce_data_frame_argument(data_frame_type, narrow_data_frame):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameArgument('arg', data_frame_type, coerce=True))
+    def test_function(arg: pd.DataFrame) -> pd.DataFrame:
+        return arg
+
+    result = test_function(narrow_data_frame)
+    assert result.dtypes.to_dict() == {'A': np.dtype('float64'), 'B': np.dtype('int64'), 'C': pd.StringDtype()}
+
+    # Data frame of the caller is left untouched
+    assert narrow_data_frame['B'].dtype == np.dtype('int32')
+
+
+def test_coerce_data_frame_return_value(data_frame_type, narrow_data_frame):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameReturnValue(data_frame_type, coerce=True))
+    def test_function() -> pd.DataFrame:
+        return narrow_data_frame
+
+    result = test_function()
+    assert result.dtypes.to_dict() == {'A': np.dtype('float64'), 'B': np.dtype('int64'), 'C': pd.StringDtype()}
+
+
+def test_coerce_data_frame_keeps_unaffected_columns(data_frame, data_frame_type):
+    coerced_data_frame = DataFrameReturnValue(data_frame_type, coerce=True).coerce_types(data_frame)
+    assert coerced_data_frame is data_frame
+
+    wider_data_frame = data_frame.astype({'B': 'int32'})
+    coerced_data_frame = DataFrameReturnValue(data_frame_type, coerce=True).coerce_types(wider_data_frame)
+    assert coerced_data_frame['B'].dtype == np.dtype('int64')
+    assert np.shares_memory(coerced_data_frame['A'].to_numpy(), wider_data_frame['A'].to_numpy())
+
+
+def test_type_error_for_unsafe_cast_in_coercion_mode(data_frame_type):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameArgument('arg', data_frame_type, coerce=True))
+    def test_function(arg: pd.DataFrame) -> pd.DataFrame:
+        return arg
+
+    # Casting 'float64' to 'int64' is not on the allow-list of safe casts
+    with pytest.raises(TypeError,
+                       match=f"Pandas type error in function '{test_function.__name__}'\n"
+                             f"Type error in argument 'arg':\n"
+                             f"\tExpected type 'int64' for column B' but found type 'float64'"):
+        test_function(pd.DataFrame({'A': [1.0], 'B': [1.0], 'C': ['foo']}).astype({'C': 'string'}))
+
+    # Extend allow-list of safe casts through configuration
+    config.safe_casts.add(('float64', 'int64'))
+    result = test_function(pd.DataFrame({'A': [1.0], 'B': [1.0], 'C': ['foo']}).astype({'C': 'string'}))
+    assert result['B'].dtype == np.dtype('int64')
+
+
+def test_coerce_series_argument(series_type):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(SeriesArgument('arg', series_type, coerce=True))
+    def test_function(arg: pd.Series) -> pd.Series:
+        return arg
+
+    result = test_function(pd.Series([1, 2, 3], dtype='int16'))
+    assert result.dtype == series_type
+
+
+def test_coerce_series_return_value(series_type, wrong_series):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(SeriesReturnValue(series_type, coerce=True))
+    def test_function() -> pd.Series:
+        return wrong_series
+
+    with pytest.raises(TypeError,
+                       match=f"Pandas type error in function '{test_function.__name__}'\n"
+                             f"Type error in return value:\n"
+                             f"\tExpected Series of type 'int64' but found type 'float64'"):
+        test_function()
@@ -0,0 +1,93 @@
+import asyncio
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import pandas as pd
+
+from pandas_type_checks import config
+from pandas_type_checks.core import DataFrameArgument, config_scope, current_config
+from pandas_type_checks.decorator import pandas_type_check
+
+
+def test_config_scope():
+    assert current_config() is config
+
+    with config_scope(strict_type_checks=True) as scoped_config:
+        assert current_config() is scoped_config
+        assert scoped_config.strict_type_checks is True
+        assert scoped_config.enable_type_checks is True
+
+        with config_scope(enable_type_checks=False):
+            assert current_config().strict_type_checks is True
+            assert current_config().enable_type_checks is False
+
+        assert current_config() is scoped_config
+
+    assert current_config() is config
+    assert config.strict_type_checks is False
+
+
+def test_config_scope_does_not_modify_safe_casts():
+    with config_scope() as scoped_config:
+        scoped_config.safe_casts.add(('float64', 'int64'))
+
+    assert ('float64', 'int64') not in config.safe_casts
+
+
+def test_config_scope_with_unknown_option():
+    with pytest.raises(ValueError, match="Unknown configuration options: strict"):
+        config_scope(strict=True)
+
+
+def test_config_scope_decorator(data_frame, data_frame_type):
+    @pandas_type_check(DataFrameArgument('data', data_frame_type))
+    def test_function(data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+    @config_scope(strict_type_checks=True)
+    def handle_request(data: pd.DataFrame) -> pd.DataFrame:
+        return test_function(data)
+
+    data_frame_with_extra_column = data_frame.assign(D=1)
+    pd.testing.assert_frame_equal(test_function(data_frame_with_extra_column), data_frame_with_extra_column)
+
+    with pytest.raises(TypeError, match=re.escape("Found unspecified column in data frame: 'D'")):
+        handle_request(data_frame_with_extra_column)
+
+    assert current_config() is config
+
+
+def test_config_scope_is_local_to_thread():
+    strict_scope = config_scope(strict_type_checks=True)
+    barrier = threading.Barrier(4)
+
+    def check_scope(strict: bool) -> bool:
+        if strict:
+            with strict_scope:
+                barrier.wait()
+                return current_config().strict_type_checks
+        barrier.wait()
+        return current_config().strict_type_checks
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(check_scope, [True, False, True, False]))
+
+    assert results == [True, False, True, False]
+
+
+def test_config_scope_is_local_to_asyncio_task():
+    @config_scope(log_type_errors=True)
+    async def scoped_task() -> bool:
+        await asyncio.sleep(0)
+        return current_config().log_type_errors
+
+    async def unscoped_task() -> bool:
+        await asyncio.sleep(0)
+        return current_config().log_type_errors
+
+    async def main():
+        return await asyncio.gather(scoped_task(), unscoped_task())
+
+    assert asyncio.run(main()) == [True, False]
@@ -0,0 +1,154 @@
+import re
+from unittest import mock
+
+import dask
+import dask.dataframe as dd
+import pytest
+import numpy as np
+import pandas as pd
+import pandera as pa
+
+from pandas_type_checks import config
+from pandas_type_checks.core import DataFrameReturnValue, DataFrameArgument, config_scope
+from pandas_type_checks.dask_support import validate_partitions
+from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.index_spec import IndexSpec
+
+
+@pytest.fixture(autouse=True)
+def local_scheduler():
+    with dask.config.set(scheduler='synchronous'):
+        yield
+
+
+@pytest.fixture(scope='module')
+def dask_data_frame(data_frame) -> dd.DataFrame:
+    return dd.from_pandas(data_frame, npartitions=2)
+
+
+@pytest.fixture(scope='module')
+def data_frame_schema_with_checks() -> pa.DataFrameSchema:
+    return pa.DataFrameSchema({
+        'A': pa.Column(np.dtype('float64')),
+        'B': pa.Column(np.dtype('int64'), checks=pa.Check.lt(2)),
+        'C': pa.Column('string')
+    })
+
+
+def test_data_frame_argument_with_dask_data_frame(data_frame_type, dask_data_frame):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameArgument('arg', data_frame_type), strict=True)
+    def test_function(arg: dd.DataFrame) -> dd.DataFrame:
+        return arg
+
+    with mock.patch.object(dd.DataFrame, 'compute') as compute:
+        assert test_function(dask_data_frame) is dask_data_frame
+        compute.assert_not_called()
+
+
+def test_type_error_for_dask_data_frame_return_value(data_frame_type, wrong_data_frame):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameReturnValue(data_frame_type))
+    def test_function() -> dd.DataFrame:
+        return dd.from_pandas(wrong_data_frame, npartitions=1)
+
+    with pytest.raises(TypeError,
+                       match=f"Pandas type error in function '{test_function.__name__}'\n"
+                             f"Type error in return value:\n"
+                             f"\tExpected type 'float64' for column A' but found type 'int64'\n"
+                             f"\tMissing column in DataFrame: 'B'"):
+        test_function()
+
+
+def test_coerce_dask_data_frame_argument(data_frame_type, data_frame):
+    @pandas_type_check(DataFrameArgument('arg', data_frame_type, coerce=True))
+    def test_function(arg: dd.DataFrame) -> dd.DataFrame:
+        return arg
+
+    result = test_function(dd.from_pandas(data_frame.astype({'B': 'int32'}), npartitions=2))
+    pd.testing.assert_frame_equal(result.compute(), data_frame)
+
+
+def test_validate_partitions_of_dask_data_frame_argument(data_frame_schema_with_checks, dask_data_frame):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameArgument('arg', data_frame_schema_with_checks, validate_partitions=True))
+    def test_function(arg: dd.DataFrame) -> dd.DataFrame:
+        return arg
+
+    # Structural check passes, value checks are deferred until the data frame is computed
+    result = test_function(dask_data_frame)
+
+    with pytest.raises(TypeError, match=re.escape(
+            f"Pandas type error in function '{test_function.__name__}'\n"
+            f"Type error in argument 'arg':\n"
+            f"\tColumn 'B' failed element-wise validator number 0: less_than(2) failure cases: 2")):
+        result.compute()
+
+
+def test_validate_partitions_of_dask_data_frame_return_value(data_frame_schema_with_checks, dask_data_frame,
+                                                             caplog):
+    @pandas_type_check(DataFrameReturnValue(data_frame_schema_with_checks, validate_partitions=True))
+    def test_function() -> dd.DataFrame:
+        return dask_data_frame
+
+    result = test_function()
+
+    config.log_type_errors = True
+    pd.testing.assert_frame_equal(result.compute(), dask_data_frame.compute())
+    assert caplog.records[-1].message == (f"Pandas type error in function '{test_function.__name__}'\n"
+                                          f"Type error in return value:\n"
+                                          f"\tColumn 'B' failed element-wise validator number 0: less_than(2) "
+                                          f"failure cases: 2")
+
+
+def test_validate_partitions_in_strict_mode(data_frame_type, data_frame):
+    dask_data_frame = dd.from_pandas(data_frame.assign(D=1), npartitions=2)
+    marker = DataFrameArgument('arg', data_frame_type)
+
+    validate_partitions(dask_data_frame, marker, 'test_function', 'arg').compute()
+    with pytest.raises(TypeError, match=re.escape("Found unspecified column in data frame: 'D'")):
+        validate_partitions(dask_data_frame, marker, 'test_function', 'arg', strict=True).compute()
+
+
+def test_validate_partitions_with_config_scope(data_frame_schema_with_checks, dask_data_frame, caplog):
+    @pandas_type_check(DataFrameArgument('arg', data_frame_schema_with_checks, validate_partitions=True))
+    def test_function(arg: dd.DataFrame) -> dd.DataFrame:
+        return arg
+
+    # The configuration scope in effect when the partition checks are attached applies on the Dask workers
+    with config_scope(log_type_errors=True):
+        result = test_function(dask_data_frame)
+
+    with dask.config.set(scheduler='threads'):
+        pd.testing.assert_frame_equal(result.compute(), dask_data_frame.compute())
+    assert "less_than(2) failure cases: 2" in caplog.records[-1].message
+
+
+def test_index_values_of_dask_data_frame(data_frame_type, data_frame):
+    index_spec = IndexSpec(dtype='int64', unique=True)
+    dask_data_frame = dd.from_pandas(data_frame.set_axis([0, 0]), npartitions=1)
+
+    # Index uniqueness cannot be checked against the metadata and is reported as not checked
+    errors = DataFrameReturnValue(data_frame_type, index=index_spec).type_check(dask_data_frame, strict=False)
+    assert [(err.error_msg, err.incomplete) for err in errors] == [
+        ("Index uniqueness and monotonicity of Dask data frames not checked: they are only checked within each "
+         "partition with 'validate_partitions=True'", True)
+    ]
+
+    # Index uniqueness is checked within each partition in partition validation mode
+    @pandas_type_check(DataFrameArgument('arg', data_frame_type, index=index_spec, validate_partitions=True))
+    def test_function(arg: dd.DataFrame) -> dd.DataFrame:
+        return arg
+
+    result = test_function(dask_data_frame)
+    with pytest.raises(TypeError, match="Expected unique index but found duplicate values"):
+        result.compute()
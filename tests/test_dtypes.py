@@ -0,0 +1,340 @@
+import datetime
+import decimal
+from unittest import mock
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from pandas_type_checks import config, dtypes
+from pandas_type_checks.core import SeriesArgument, DataFrameArgument
+from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.dtypes import AnyBackend, Categorical, DtypeClass, category_hash, logical_type
+from pandas_type_checks.dtypes import AnyFloat, AnyInteger, AnyString, Numeric, WidenableTo, compatibility_classes
+from pandas_type_checks.dtypes import ObjectOf, inferred_element_type
+
+
+def test_logical_type():
+    assert logical_type(np.dtype('int64')) == 'int64'
+    assert logical_type('int64') == 'int64'
+    assert logical_type(pd.Int64Dtype()) == 'int64'
+    assert logical_type(pd.BooleanDtype()) == 'bool'
+    assert logical_type(pd.Float32Dtype()) == 'float32'
+    assert logical_type('string') == 'string'
+    assert logical_type(pd.StringDtype('python')) == 'string'
+    assert logical_type('category') == 'category'
+
+
+def test_dtype_class_requires_matches():
+    class IncompleteDtypeClass(DtypeClass):
+        pass
+
+    with pytest.raises(TypeError, match='abstract'):
+        IncompleteDtypeClass()
+
+
+def test_any_backend():
+    assert AnyBackend('int64').matches(np.dtype('int64'))
+    assert AnyBackend('int64').matches(pd.Int64Dtype())
+    assert AnyBackend(pd.Int64Dtype()).matches(np.dtype('int64'))
+    assert not AnyBackend('int64').matches(np.dtype('int32'))
+    assert not AnyBackend('int64').matches(pd.Float64Dtype())
+    assert AnyBackend('int64') == AnyBackend('Int64')
+    assert str(AnyBackend('Int64')) == 'int64[any backend]'
+
+
+def test_data_frame_argument_with_any_backend(data_frame, data_frame_type):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameArgument('arg', {'A': AnyBackend('float64'), 'B': AnyBackend('int64'), 'C': 'string'}))
+    def test_function(arg: pd.DataFrame) -> pd.DataFrame:
+        return arg
+
+    pd.testing.assert_frame_equal(test_function(data_frame), data_frame)
+
+    nullable_data_frame = data_frame.astype({'A': 'Float64', 'B': 'Int64'})
+    pd.testing.assert_frame_equal(test_function(nullable_data_frame), nullable_data_frame)
+
+    with pytest.raises(TypeError,
+                       match=f"Pandas type error in function '{test_function.__name__}'\n"
+                             f"Type error in argument 'arg':\n"
+                             f"\tExpected type 'int64\\[any backend\\]' for column B' but found type 'int32'"):
+        test_function(data_frame.astype({'B': 'int32'}))
+
+
+def test_series_argument_with_any_backend(series):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(SeriesArgument('arg', AnyBackend('int64')))
+    def test_function(arg: pd.Series) -> pd.Series:
+        return arg
+
+    pd.testing.assert_series_equal(test_function(series), series)
+    pd.testing.assert_series_equal(test_function(series.astype('Int64')), series.astype('Int64'))
+
+    with pytest.raises(TypeError,
+                       match=f"Pandas type error in function '{test_function.__name__}'\n"
+                             f"Type error in argument 'arg':\n"
+                             f"\tExpected Series of type 'int64\\[any backend\\]' but found type 'float64'"):
+        test_function(series.astype('float64'))
+
+
+@pytest.fixture(scope='module')
+def categorical_data_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        'A': pd.Categorical(['foo', 'bar'], categories=['foo', 'bar', 'baz']),
+        'B': pd.Categorical([1, 2], categories=[1, 2], ordered=True)
+    })
+
+
+def test_categorical_strictness(categorical_data_frame):
+    column_type = categorical_data_frame['A'].dtype
+
+    assert Categorical().matches(column_type)
+    assert not Categorical().matches(np.dtype('object'))
+    # String categories are stored as 'object' or 'str' depending on the Pandas version
+    categories_dtype = column_type.categories.dtype
+    assert Categorical(categories_dtype=categories_dtype, strictness='dtype').matches(column_type)
+    assert not Categorical(categories_dtype='int64', strictness='dtype').matches(column_type)
+    assert not Categorical(categories_dtype=categories_dtype, ordered=True, strictness='dtype').matches(column_type)
+    assert Categorical(['foo', 'bar', 'baz']).matches(column_type)
+    assert Categorical(['baz', 'foo', 'bar']).matches(column_type)
+    assert not Categorical(['foo', 'bar']).matches(column_type)
+    assert not Categorical(['foo', 'bar', 'baz'], ordered=True).matches(column_type)
+
+    ordered_column_type = categorical_data_frame['B'].dtype
+    assert Categorical([1, 2], ordered=True).matches(ordered_column_type)
+    assert not Categorical([2, 1], ordered=True).matches(ordered_column_type)
+
+    with pytest.raises(ValueError, match="Categories are required for categorical strictness 'exact'."):
+        Categorical(strictness='exact')
+
+
+def test_categorical_without_categories():
+    # Categorical dtype without categories, e.g. mapped from Polars categoricals, only matches any categorical
+    column_type = pd.CategoricalDtype()
+
+    assert Categorical().matches(column_type)
+    assert not Categorical(categories_dtype='object', strictness='dtype').matches(column_type)
+    assert not Categorical(['foo', 'bar']).matches(column_type)
+
+
+def test_category_hash_is_cached():
+    categories = pd.CategoricalDtype([f'category_{i}' for i in range(1000)]).categories
+
+    with mock.patch.object(pd.util, 'hash_array', wraps=pd.util.hash_array) as hash_array:
+        first_hash = category_hash(categories, ordered=False)
+        assert category_hash(categories, ordered=False) == first_hash
+        assert hash_array.call_count == 1
+
+    assert category_hash(categories[::-1], ordered=False) == first_hash
+    assert category_hash(categories[::-1], ordered=True) != category_hash(categories, ordered=True)
+
+
+def test_data_frame_argument_with_categorical_columns(categorical_data_frame):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameArgument('arg', {
+        'A': 'category',
+        'B': pd.CategoricalDtype([1, 2], ordered=True)
+    }))
+    def test_function(arg: pd.DataFrame) -> pd.DataFrame:
+        return arg
+
+    pd.testing.assert_frame_equal(test_function(categorical_data_frame), categorical_data_frame)
+
+    with pytest.raises(TypeError,
+                       match=f"Pandas type error in function '{test_function.__name__}'\n"
+                             f"Type error in argument 'arg':\n"
+                             f"\tExpected type 'category' for column A' but found type 'object'\n"
+                             f"\tExpected type 'category\\[2 categories, ordered=True\\]' for column B' but found "
+                             f"type 'category'"):
+        test_function(categorical_data_frame.astype({'A': 'object', 'B': pd.CategoricalDtype([1, 2, 3])}))
+
+
+def test_series_argument_with_categorical_dtype(categorical_data_frame):
+    @pandas_type_check(SeriesArgument('arg', Categorical(categories_dtype='int64', ordered=True, strictness='dtype')))
+    def test_function(arg: pd.Series) -> pd.Series:
+        return arg
+
+    pd.testing.assert_series_equal(test_function(categorical_data_frame['B']), categorical_data_frame['B'])
+
+
+def test_compatibility_classes():
+    assert AnyInteger().matches(np.dtype('int8'))
+    assert AnyInteger().matches(pd.UInt64Dtype())
+    assert AnyInteger(signed=True).matches(pd.Int32Dtype())
+    assert not AnyInteger(signed=True).matches(np.dtype('uint32'))
+    assert AnyInteger(signed=False).matches(np.dtype('uint32'))
+    assert not AnyInteger().matches(np.dtype('float64'))
+    assert not AnyInteger().matches(np.dtype('bool'))
+    assert AnyFloat().matches(pd.Float32Dtype())
+    assert not AnyFloat().matches(np.dtype('int64'))
+    assert Numeric().matches(np.dtype('int16'))
+    assert Numeric().matches(np.dtype('float64'))
+    assert not Numeric().matches(np.dtype('bool'))
+    assert not Numeric().matches(np.dtype('object'))
+    assert AnyString().matches(pd.StringDtype('python'))
+    assert AnyString().matches('string')
+    assert not AnyString().matches(np.dtype('object'))
+    assert not AnyString().matches('category')
+    assert str(AnyInteger(signed=False)) == 'unsigned integer'
+    assert AnyInteger() == AnyInteger()
+    assert AnyInteger() != AnyFloat()
+
+
+def test_widenable_to():
+    assert WidenableTo('int64').matches(np.dtype('int8'))
+    assert WidenableTo('int64').matches(np.dtype('uint32'))
+    assert WidenableTo('int64').matches(pd.Int64Dtype())
+    assert not WidenableTo('int64').matches(np.dtype('uint64'))
+    assert not WidenableTo('int64').matches(np.dtype('float32'))
+    assert WidenableTo('Float64').matches(np.dtype('float32'))
+    assert WidenableTo('int64') == WidenableTo(pd.Int64Dtype())
+    assert str(WidenableTo('int64')) == 'widenable to int64'
+    assert WidenableTo('int32').concrete_type == np.dtype('int32')
+
+    with pytest.raises(ValueError, match="Unsupported target dtype 'datetime64\\[ns\\]'. Expected a numeric dtype."):
+        WidenableTo('datetime64[ns]')
+
+
+def test_compatibility_classes_are_cached():
+    timedelta_type = np.dtype('timedelta64[s]')
+    assert compatibility_classes(timedelta_type) == frozenset()
+
+    with mock.patch('pandas_type_checks.dtypes.logical_type') as logical_type_mock:
+        assert 'integer' in compatibility_classes(np.dtype('int64'))
+        assert 'integer' in compatibility_classes(pd.Int64Dtype())
+        assert compatibility_classes(timedelta_type) == frozenset()
+        logical_type_mock.assert_not_called()
+
+
+def test_data_frame_argument_with_compatibility_classes(data_frame, data_frame_type):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameArgument('arg', {'A': AnyFloat(), 'B': WidenableTo('int64'), 'C': AnyString()}))
+    def test_function(arg: pd.DataFrame) -> pd.DataFrame:
+        return arg
+
+    pd.testing.assert_frame_equal(test_function(data_frame), data_frame)
+    nullable_data_frame = data_frame.astype({'A': 'Float32', 'B': 'Int16', 'C': 'string'})
+    pd.testing.assert_frame_equal(test_function(nullable_data_frame), nullable_data_frame)
+
+    with pytest.raises(TypeError,
+                       match=f"Pandas type error in function '{test_function.__name__}'\n"
+                             f"Type error in argument 'arg':\n"
+                             f"\tExpected type 'float' for column A' but found type 'int64'\n"
+                             f"\tExpected type 'widenable to int64' for column B' but found type 'float64'"):
+        test_function(data_frame.astype({'A': 'int64', 'B': 'float64'}))
+
+
+def test_series_argument_with_compatibility_classes():
+    @pandas_type_check(SeriesArgument('arg', Numeric()))
+    def test_function(arg: pd.Series) -> pd.Series:
+        return arg
+
+    series = pd.Series([1, 2, 3], dtype='UInt8')
+    pd.testing.assert_series_equal(test_function(series), series)
+
+    with pytest.raises(TypeError,
+                       match=f"Pandas type error in function '{test_function.__name__}'\n"
+                             f"Type error in argument 'arg':\n"
+                             f"\tExpected Series of type 'numeric' but found type 'bool'"):
+        test_function(pd.Series([True, False]))
+
+
+@pytest.fixture
+def object_data_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        'A': pd.Series(['foo', None, 'bar'], dtype='object'),
+        'B': [b'foo', b'bar', None],
+        'C': [decimal.Decimal('1.5'), decimal.Decimal('2.5'), None],
+        'D': pd.Series([datetime.datetime(2024, 1, 1), None, datetime.datetime(2024, 1, 2)], dtype='object')
+    })
+
+
+def test_object_of(object_data_frame):
+    assert ObjectOf(str).matches(np.dtype('object'))
+    assert not ObjectOf(str).matches(pd.StringDtype())
+    assert str(ObjectOf(decimal.Decimal)) == 'object[Decimal]'
+
+    assert ObjectOf(str).element_type_error(object_data_frame['A']) is None
+    assert ObjectOf(bytes).element_type_error(object_data_frame['B']) is None
+    assert ObjectOf(decimal.Decimal).element_type_error(object_data_frame['C']) is None
+    assert ObjectOf(datetime.datetime).element_type_error(object_data_frame['D']) is None
+    assert ObjectOf(str).element_type_error(pd.Series([None, None], dtype='object')) is None
+    assert ObjectOf(str).element_type_error(object_data_frame['B']) == 'bytes'
+    assert ObjectOf(str).element_type_error(pd.Series(['foo', 1], dtype='object')) == 'mixed-integer'
+    assert ObjectOf('mixed').element_type_error(pd.Series(['foo', 1], dtype='object')) is None
+
+    with pytest.raises(ValueError, match="Unsupported element type 'int'"):
+        ObjectOf('int')
+
+
+def test_object_of_with_sample():
+    values = pd.Series(['foo'] * 10_000 + [1], dtype='object')
+
+    assert ObjectOf(str, sample_size=None).element_type_error(values) == 'mixed-integer'
+    # Samples of 10 elements are very unlikely to contain the single integer
+    assert ObjectOf(str, sample_size=10, seed=0).element_type_error(values) is None
+
+
+def test_inferred_element_type_is_cached(object_data_frame):
+    values = object_data_frame['A'].to_numpy()
+
+    with mock.patch.object(pd.api.types, 'infer_dtype', wraps=pd.api.types.infer_dtype) as infer_dtype:
+        assert inferred_element_type(values) == 'string'
+        assert inferred_element_type(object_data_frame['A'].to_numpy()) == 'string'
+        assert infer_dtype.call_count == 1
+        assert inferred_element_type(values[1:]) == 'string'
+        assert infer_dtype.call_count == 2
+
+
+def test_data_frame_argument_with_element_types(object_data_frame):
+    @pandas_type_check(DataFrameArgument('arg', {'A': ObjectOf(str), 'B': ObjectOf(bytes), 'C': 'object'}))
+    def test_function(arg: pd.DataFrame) -> pd.DataFrame:
+        return arg
+
+    pd.testing.assert_frame_equal(test_function(object_data_frame), object_data_frame)
+
+    with pytest.raises(TypeError,
+                       match=f"Pandas type error in function '{test_function.__name__}'\n"
+                             f"Type error in argument 'arg':\n"
+                             f"\tExpected type 'object\\[bytes\\]' for column B' but found type 'string'\n"
+                             f"\tExpected elements of type 'str' in column 'A' but found inferred type 'bytes'"):
+        test_function(object_data_frame.assign(A=object_data_frame['B'], B=object_data_frame['A'].astype('string')))
+
+
+def test_series_argument_with_element_type(object_data_frame):
+    @pandas_type_check(SeriesArgument('arg', ObjectOf(decimal.Decimal)))
+    def test_function(arg: pd.Series) -> pd.Series:
+        return arg
+
+    pd.testing.assert_series_equal(test_function(object_data_frame['C']), object_data_frame['C'])
+
+    with pytest.raises(TypeError,
+                       match=f"Pandas type error in function '{test_function.__name__}'\n"
+                             f"Type error in argument 'arg':\n"
+                             f"\tExpected Series with elements of type 'Decimal' but found inferred type 'floating'"):
+        test_function(pd.Series([1.5, 2.5], dtype='object'))
+
+
+def test_dtype_caches_are_bounded():
+    with mock.patch('pandas_type_checks.dtypes.MAX_CACHED_DTYPES', 64):
+        for i in range(200):
+            categorical_type = pd.CategoricalDtype([f'category_{i}'])
+            assert logical_type(categorical_type) == 'category'
+            assert compatibility_classes(categorical_type) == frozenset()
+
+        assert len(dtypes._logical_types) <= 64
+        assert len(dtypes._compatibility_classes) <= 64
+        # Precomputed compatibility classes are kept
+        assert 'integer' in dtypes._compatibility_classes[np.dtype('int64')]
@@ -0,0 +1,127 @@
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import pytest
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pandas_type_checks import config
+from pandas_type_checks.core import DataFrameArgument, SeriesReturnValue
+from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.error_sinks import ERROR_RECORD_SCHEMA, ArrowErrorSink
+from pandas_type_checks.errors import ErrorSink, PandasTypeCheckError, build_error_records
+
+
+class ListErrorSink(ErrorSink):
+    def __init__(self):
+        self.records: List[Dict[str, List[Any]]] = []
+
+    def write(self, records: Dict[str, List[Any]]) -> None:
+        self.records.append(records)
+
+
+@pytest.fixture
+def error_sink() -> ListErrorSink:
+    error_sink = ListErrorSink()
+    config.error_sink = error_sink
+    yield error_sink
+    config.error_sink = None
+
+
+def test_error_sink_requires_write():
+    class IncompleteErrorSink(ErrorSink):
+        pass
+
+    with pytest.raises(TypeError, match='abstract'):
+        IncompleteErrorSink()
+
+
+def test_build_error_records():
+    timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    records = build_error_records(
+        'test_function',
+        {'data': [PandasTypeCheckError("Missing column in DataFrame: 'C'", expected_type='bool', column_name='C')]},
+        [PandasTypeCheckError("Expected Series of type 'int64' but found type 'int32'", expected_type='int64',
+                              given_type='int32')],
+        timestamp=timestamp
+    )
+
+    assert records == {
+        'timestamp': [timestamp, timestamp],
+        'function': ['test_function', 'test_function'],
+        'argument': ['data', None],
+        'kind': ['argument', 'return_value'],
+        'column': ['C', None],
+        'expected_type': ['bool', 'int64'],
+        'given_type': [None, 'int32'],
+        'message': ["Missing column in DataFrame: 'C'", "Expected Series of type 'int64' but found type 'int32'"],
+        'incomplete': [False, False]
+    }
+
+
+def test_type_check_decorator_with_error_sink(error_sink, data_frame, data_frame_type):
+    @pandas_type_check(DataFrameArgument('data', data_frame_type), SeriesReturnValue('int64'))
+    def test_function(data: pd.DataFrame) -> pd.Series:
+        return data['A']
+
+    with pytest.raises(TypeError):
+        test_function(data_frame.drop(columns='C'))
+
+    assert len(error_sink.records) == 1
+    assert error_sink.records[0]['kind'] == ['argument', 'return_value']
+    assert error_sink.records[0]['column'] == ['C', None]
+    assert error_sink.records[0]['given_type'] == [None, 'float64']
+
+
+@pytest.mark.parametrize('file_format', ['parquet', 'ipc'])
+def test_arrow_error_sink(file_format, tmp_path):
+    error_sink = ArrowErrorSink(tmp_path, file_format=file_format, batch_size=10)
+    errors = {'data': [PandasTypeCheckError("Missing column in DataFrame: 'C'", column_name='C')]}
+
+    threads = [threading.Thread(target=lambda: [error_sink.report('test_function', errors, []) for _ in range(10)])
+               for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    error_sink.close()
+
+    if file_format == 'parquet':
+        tables = [pq.read_table(path) for path in error_sink.files]
+    else:
+        tables = [pa.ipc.open_file(path).read_all() for path in error_sink.files]
+    table = pa.concat_tables(tables)
+    assert table.schema == ERROR_RECORD_SCHEMA
+    assert table.num_rows == 60
+    assert set(table.column('column').to_pylist()) == {'C'}
+    assert error_sink.dropped_records == 0
+
+
+def test_arrow_error_sink_file_rotation(tmp_path):
+    error_sink = ArrowErrorSink(tmp_path, batch_size=100, flush_interval=60, max_file_records=2)
+    errors = {'data': [PandasTypeCheckError("Missing column in DataFrame: 'C'", column_name='C')]}
+
+    for _ in range(3):
+        error_sink.report('test_function', errors, [])
+        error_sink.flush()
+    error_sink.close()
+
+    assert [pq.read_table(path).num_rows for path in error_sink.files] == [2, 1]
+
+
+def test_arrow_error_sink_with_bounded_buffer(tmp_path):
+    error_sink = ArrowErrorSink(tmp_path, batch_size=100, flush_interval=60, max_buffered_records=5)
+    errors = {'data': [PandasTypeCheckError("Missing column in DataFrame: 'C'", column_name='C')] * 2}
+
+    for _ in range(3):
+        error_sink.report('test_function', errors, [])
+    error_sink.close()
+    error_sink.report('test_function', errors, [])
+
+    assert pq.read_table(error_sink.files[0]).num_rows == 4
+    assert error_sink.dropped_records == 4
+
+    with pytest.raises(ValueError, match="Unsupported error sink file format 'csv'."):
+        ArrowErrorSink(tmp_path, file_format='csv')
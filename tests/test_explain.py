@@ -0,0 +1,80 @@
+import pytest
+import pandas as pd
+
+from pandas_type_checks.core import DataFrameArgument, DataFrameReturnValue, SeriesArgument
+from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.index_spec import IndexSpec
+from pandas_type_checks.validated import mark_validated
+
+
+def test_explain(data_frame, data_frame_type):
+    calls = []
+
+    @pandas_type_check(DataFrameArgument('data', data_frame_type, coerce=True, detect_mutation='structure'),
+                       SeriesArgument('values', 'int64'),
+                       DataFrameReturnValue({'A': 'float64'}, index=IndexSpec(unique=True)),
+                       strict=True)
+    def test_function(data: pd.DataFrame, values: pd.Series, factor: int = 1) -> pd.DataFrame:
+        calls.append(factor)
+        return data[['A']] * factor
+
+    plan = test_function.explain(data_frame.astype({'B': 'int32'}), pd.Series([1, 2]), factor=2)
+
+    assert calls == [2]
+    assert plan.function_name.endswith('test_explain.<locals>.test_function')
+    assert [(marker.target, marker.engine, marker.details) for marker in plan.markers] == [
+        ('argument data', 'dict structural', '3 columns'),
+        ('argument values', 'dtype', ''),
+        ('return value', 'dict structural', '1 columns')
+    ]
+    assert [phase for phase, _ in plan.markers[0].phases] == [
+        'mutation fingerprint', 'coerce', 'dtypes', 'strict column scan', 'column types', 'element types', 'index',
+        'mutation check'
+    ]
+    assert [marker.num_errors for marker in plan.markers] == [0, 0, 0]
+    assert plan.check_time == pytest.approx(sum(seconds for marker in plan.markers for _, seconds in marker.phases))
+    assert plan.function_time > 0
+    assert "argument data: DataFrameArgument, dict structural (3 columns), 0 type errors" in str(plan)
+    assert plan.to_dict()['markers'][1]['phases'].keys() == {'series type'}
+
+
+def test_explain_method(data_frame, data_frame_type):
+    class Pipeline:
+        @pandas_type_check(DataFrameArgument('data', data_frame_type))
+        def run(self, data: pd.DataFrame) -> int:
+            return len(data)
+
+    plan = Pipeline.run.explain(Pipeline(), data_frame)
+
+    assert [(marker.target, marker.num_errors) for marker in plan.markers] == [('argument data', 0)]
+    assert Pipeline().run.explain is Pipeline.run.explain
+
+
+def test_explain_reports_type_errors_without_raising(data_frame, data_frame_type):
+    @pandas_type_check(DataFrameArgument('data', data_frame_type), strict=True)
+    def test_function(data: pd.DataFrame) -> int:
+        return len(data)
+
+    plan = test_function.explain(data_frame.assign(D=1).drop(columns='C'))
+
+    assert plan.markers[0].num_errors == 2
+
+    with pytest.raises(TypeError):
+        test_function(data_frame.assign(D=1))
+
+
+def test_explain_with_validated_data_frame_and_missing_argument(data_frame, data_frame_type):
+    data_frame_spec = DataFrameArgument('data', data_frame_type)
+
+    @pandas_type_check(data_frame_spec, SeriesArgument('values', 'int64'))
+    def test_function(data: pd.DataFrame, values=None) -> int:
+        return len(data)
+
+    mark_validated(data_frame, data_frame_spec.spec)
+    plan = test_function.explain(data_frame)
+
+    assert [(marker.engine, marker.details) for marker in plan.markers] == [
+        ('cached', '3 columns'),
+        ('not applicable', "value of type 'NoneType'")
+    ]
+    assert [phase for phase, _ in plan.markers[0].phases] == ['index']
@@ -0,0 +1,161 @@
+import re
+from unittest import mock
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from pandas_type_checks import config
+from pandas_type_checks.batch import check_many
+from pandas_type_checks.core import DataFrameArgument, DataFrameReturnValue, SeriesArgument
+from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.dtypes import AnyInteger
+from pandas_type_checks.index_spec import IndexSpec
+from pandas_type_checks.validated import mark_validated
+
+
+@pytest.fixture
+def multi_index_data_frame() -> pd.DataFrame:
+    dates = pd.DatetimeIndex(['2024-01-01', '2024-01-01', '2024-01-02'], dtype='datetime64[ns]')
+    index = pd.MultiIndex.from_arrays([dates, [1, 2, 1]], names=['date', 'id'])
+    return pd.DataFrame({'A': [1.0, 2.0, 3.0]}, index=index)
+
+
+def test_index_spec():
+    index = pd.Index([1, 2, 3], name='id')
+
+    assert IndexSpec(dtype='int64', names=['id'], unique=True, monotonic='increasing').type_check(index) == []
+    assert IndexSpec(dtype=AnyInteger()).type_check(index) == []
+    assert IndexSpec(levels=['int64']).type_check(index) == []
+
+    type_check_errors = IndexSpec(dtype='float64', names=['key'], monotonic='decreasing').type_check(index)
+    assert [err.error_msg for err in type_check_errors] == [
+        "Expected index of type 'float64' but found type 'int64'",
+        "Expected index names ['key'] but found ['id']",
+        "Expected monotonic decreasing index"
+    ]
+
+    type_check_errors = IndexSpec(unique=True, monotonic='increasing').type_check(pd.Index([2, 1, 1]))
+    assert [err.error_msg for err in type_check_errors] == [
+        "Expected unique index but found duplicate values",
+        "Expected monotonic increasing index"
+    ]
+
+    with pytest.raises(ValueError, match="Unsupported index monotonicity 'sorted'."):
+        IndexSpec(monotonic='sorted')
+
+
+def test_multi_index_spec(multi_index_data_frame):
+    index = multi_index_data_frame.index
+
+    assert IndexSpec(levels=['datetime64[ns]', 'int64'], names=['date', 'id'], unique=True).type_check(index) == []
+    assert IndexSpec(levels={'id': AnyInteger(), 'date': None}, monotonic='increasing').type_check(index) == []
+
+    type_check_errors = IndexSpec(dtype='int64', levels={'id': 'float64', 'key': 'int64'}).type_check(index)
+    assert [err.error_msg for err in type_check_errors] == [
+        "Expected single-level index but found MultiIndex with 2 levels",
+        "Expected type 'float64' for index level 'id' but found type 'int64'",
+        "Missing index level: 'key'"
+    ]
+
+    type_check_errors = IndexSpec(levels=['datetime64[ns]']).type_check(index)
+    assert [err.error_msg for err in type_check_errors] == ["Expected 1 index levels but found 2"]
+
+
+def test_multi_index_spec_does_not_materialize_level_values(multi_index_data_frame):
+    index_spec = IndexSpec(levels=['datetime64[ns]', 'int64'], names=['date', 'id'], unique=True,
+                           monotonic='increasing')
+
+    with mock.patch.object(pd.MultiIndex, 'get_level_values') as get_level_values_mock, \
+            mock.patch.object(pd.MultiIndex, 'copy') as copy_mock:
+        assert index_spec.type_check(multi_index_data_frame.index) == []
+        get_level_values_mock.assert_not_called()
+        copy_mock.assert_not_called()
+
+
+def test_index_spec_results_are_cached_per_index():
+    index_spec = IndexSpec(dtype='int64', names=['id'], unique=True)
+    index = pd.Index([1, 2, 3], name='id')
+    assert index_spec.type_check(index) == []
+
+    with mock.patch.object(IndexSpec, '_check_index', return_value=[]) as check_index_mock:
+        assert index_spec.type_check(index) == []
+        check_index_mock.assert_not_called()
+
+        # Renaming an index in place invalidates cached results
+        index.name = 'key'
+        index_spec.type_check(index)
+        check_index_mock.assert_called_once()
+
+
+def test_metadata_spec_is_reset_with_index_specification():
+    index_spec = IndexSpec(dtype='int64', names=['id'], unique=True)
+    metadata_spec = index_spec.metadata_spec()
+    assert str(metadata_spec) == "IndexSpec(dtype=dtype('int64'), names=['id'])"
+    assert index_spec.metadata_spec() is metadata_spec
+
+    index_spec.names = ['key']
+    index_spec.dtype = 'int32'
+    assert str(index_spec.metadata_spec()) == "IndexSpec(dtype=dtype('int32'), names=['key'])"
+    index_spec.levels = {'key': 'int32'}
+    assert index_spec.metadata_spec().levels == {'key': np.dtype('int32')}
+
+
+def test_data_frame_argument_with_index_spec(multi_index_data_frame):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameArgument('arg', {'A': np.dtype('float64')},
+                                         index=IndexSpec(levels={'date': 'datetime64[ns]', 'id': 'int64'},
+                                                         unique=True)))
+    def test_function(arg: pd.DataFrame) -> pd.DataFrame:
+        return arg
+
+    pd.testing.assert_frame_equal(test_function(multi_index_data_frame), multi_index_data_frame)
+
+    with pytest.raises(TypeError,
+                       match=re.escape(f"Pandas type error in function '{test_function.__name__}'\n"
+                                       f"Type error in argument 'arg':\n"
+                                       f"\tExpected type 'int64' for index level 'id' but found type 'float64'\n"
+                                       f"\tExpected unique index but found duplicate values")):
+        dates = pd.DatetimeIndex(['2024-01-01'] * 3, dtype='datetime64[ns]')
+        duplicate_index = pd.MultiIndex.from_arrays([dates, [1.0, 1.0, 2.0]], names=['date', 'id'])
+        test_function(multi_index_data_frame.set_axis(duplicate_index))
+
+
+def test_index_of_validated_data_frame_is_checked(multi_index_data_frame):
+    data_frame_type = {'A': np.dtype('float64')}
+    mark_validated(multi_index_data_frame, data_frame_type)
+
+    @pandas_type_check(DataFrameArgument('arg', data_frame_type, index=IndexSpec(names=['date'])))
+    def test_function(arg: pd.DataFrame) -> pd.DataFrame:
+        return arg
+
+    with pytest.raises(TypeError, match=re.escape("Expected index names ['date'] but found ['date', 'id']")):
+        test_function(multi_index_data_frame)
+
+
+def test_series_argument_with_index_spec():
+    @pandas_type_check(SeriesArgument('arg', 'float64', index=IndexSpec(dtype='int64', monotonic='increasing')))
+    def test_function(arg: pd.Series) -> pd.Series:
+        return arg
+
+    series = pd.Series([1.0, 2.0], index=[1, 2])
+    pd.testing.assert_series_equal(test_function(series), series)
+
+    with pytest.raises(TypeError,
+                       match=re.escape(f"Pandas type error in function '{test_function.__name__}'\n"
+                                       f"Type error in argument 'arg':\n"
+                                       f"\tExpected monotonic increasing index")):
+        test_function(pd.Series([1.0, 2.0], index=[2, 1]))
+
+
+def test_check_many_with_index_spec():
+    marker = DataFrameReturnValue({'A': np.dtype('float64')}, index=IndexSpec(unique=True))
+    data_frames = [pd.DataFrame({'A': [1.0, 2.0]}, index=index) for index in [[1, 2], [1, 1], [2, 3]]]
+
+    result = check_many(data_frames, marker)
+
+    assert result.num_layouts == 1
+    assert result.failed_frames == [1]
@@ -0,0 +1,204 @@
+import importlib
+import sys
+import textwrap
+
+import pytest
+
+from pandas_type_checks.core import DataFrameArgument, DataFrameReturnValue
+from pandas_type_checks.instrumentation import install_import_hook, instrument
+
+MODULE_SOURCE = '''
+import pandas as pd
+
+
+def process(data: pd.DataFrame) -> pd.DataFrame:
+    return data
+
+
+def untyped(data):
+    return data
+
+
+class Pipeline:
+    def run(self, data: pd.DataFrame) -> int:
+        return len(data)
+
+    @staticmethod
+    def load(data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+    @classmethod
+    def create(cls, data: pd.DataFrame) -> 'Pipeline':
+        return cls()
+
+    class Step:
+        def apply(self, data: pd.DataFrame) -> pd.DataFrame:
+            return data
+'''
+
+
+@pytest.fixture
+def module_name(tmp_path, monkeypatch):
+    name = f'instrumented_{tmp_path.name}'
+    (tmp_path / f'{name}.py').write_text(textwrap.dedent(MODULE_SOURCE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    sys.modules.pop(name, None)
+
+
+@pytest.fixture
+def specs(module_name, data_frame_type):
+    return {
+        f'{module_name}.process': [DataFrameArgument('data', data_frame_type), DataFrameReturnValue(data_frame_type)],
+        f'{module_name}.Pipeline.run': DataFrameArgument('data', data_frame_type),
+        f'{module_name}.Pipeline.load': DataFrameArgument('data', data_frame_type),
+        f'{module_name}.Pipeline.create': DataFrameArgument('data', data_frame_type),
+        f'{module_name}.Pipeline.Step.apply': DataFrameArgument('data', data_frame_type)
+    }
+
+
+def assert_instrumented(module, data_frame, wrong_data_frame):
+    pipeline = module.Pipeline()
+    for call in [module.process, pipeline.run, module.Pipeline.load, pipeline.load, module.Pipeline.create,
+                 module.Pipeline.Step().apply]:
+        call(data_frame)
+        with pytest.raises(TypeError):
+            call(wrong_data_frame)
+    assert isinstance(module.Pipeline.create(data_frame), module.Pipeline)
+
+
+def test_instrument(module_name, specs, data_frame, wrong_data_frame):
+    module = importlib.import_module(module_name)
+    original_attributes = {name: vars(module.Pipeline)[name] for name in ['run', 'load', 'create']}
+    original_process = module.process
+
+    instrumentation = instrument(module, specs)
+
+    assert sorted(instrumentation.instrumented_names) == sorted(specs)
+    assert instrumentation.unresolved_names == []
+    assert instrumentation.setup_time > 0
+    assert isinstance(vars(module.Pipeline)['load'], staticmethod)
+    assert isinstance(vars(module.Pipeline)['create'], classmethod)
+    assert module.process.__wrapped__ is original_process
+    assert_instrumented(module, data_frame, wrong_data_frame)
+
+    instrumentation.remove()
+
+    assert module.process is original_process
+    assert {name: vars(module.Pipeline)[name] for name in ['run', 'load', 'create']} == original_attributes
+    assert instrumentation.instrumented_names == []
+    module.process(wrong_data_frame)
+
+
+def test_instrument_class(module_name, specs, data_frame, wrong_data_frame):
+    module = importlib.import_module(module_name)
+
+    instrumentation = instrument(module.Pipeline, specs, strict=True)
+
+    assert sorted(instrumentation.instrumented_names) == sorted(name for name in specs if '.Pipeline.' in name)
+    module.process(wrong_data_frame)
+    with pytest.raises(TypeError):
+        module.Pipeline().run(data_frame.assign(D=1))
+    instrumentation.remove()
+
+
+def test_instrument_with_unresolved_names(module_name, data_frame_type, caplog):
+    module = importlib.import_module(module_name)
+    original_untyped = module.untyped
+
+    instrumentation = instrument(module, {
+        f'{module_name}.missing': DataFrameArgument('data', data_frame_type),
+        f'{module_name}.Pipeline.missing': DataFrameArgument('data', data_frame_type),
+        f'{module_name}.pd': DataFrameArgument('data', data_frame_type),
+        f'{module_name}.untyped': []
+    })
+
+    assert instrumentation.instrumented_names == [f'{module_name}.untyped']
+    assert instrumentation.unresolved_names == [f'{module_name}.missing', f'{module_name}.Pipeline.missing',
+                                                f'{module_name}.pd']
+    assert f"Cannot instrument '{module_name}.missing'" in caplog.text
+    assert module.untyped is not original_untyped
+    instrumentation.remove()
+    assert module.untyped is original_untyped
+
+
+def test_instrument_reloaded_module(module_name, specs, data_frame, wrong_data_frame):
+    module = importlib.import_module(module_name)
+    instrumentation = instrument(module, specs)
+    assert instrumentation.instrument(module) == []
+
+    module = importlib.reload(module)
+    reloaded_process = module.process
+    reloaded_pipeline = module.Pipeline
+    module.process(wrong_data_frame)
+
+    # Functions replaced by reloading the module are instrumented again
+    assert sorted(instrumentation.instrument(module)) == sorted(specs)
+    assert sorted(instrumentation.instrumented_names) == sorted(specs)
+    assert_instrumented(module, data_frame, wrong_data_frame)
+
+    instrumentation.remove()
+
+    assert module.process is reloaded_process
+    assert module.Pipeline is reloaded_pipeline
+    assert not hasattr(vars(module.Pipeline)['load'].__func__, '__wrapped__')
+    module.process(wrong_data_frame)
+
+
+def test_remove_keeps_replaced_functions(module_name, specs, wrong_data_frame):
+    module = importlib.import_module(module_name)
+    instrumentation = instrument(module, specs)
+
+    module = importlib.reload(module)
+    reloaded_process = module.process
+    instrumentation.remove()
+
+    assert module.process is reloaded_process
+
+
+def test_import_hook(module_name, specs, data_frame, wrong_data_frame):
+    hook = install_import_hook(specs)
+    try:
+        assert module_name not in sys.modules
+        module = importlib.import_module(module_name)
+
+        assert sorted(hook.instrumentation.instrumented_names) == sorted(specs)
+        assert_instrumented(module, data_frame, wrong_data_frame)
+        assert module.__loader__.get_source(module_name) == textwrap.dedent(MODULE_SOURCE)
+    finally:
+        hook.remove()
+
+    assert hook not in sys.meta_path
+    module.process(wrong_data_frame)
+    module.Pipeline.load(wrong_data_frame)
+
+
+def test_import_hook_with_reloaded_module(module_name, specs, data_frame, wrong_data_frame):
+    hook = install_import_hook(specs)
+    try:
+        module = importlib.reload(importlib.import_module(module_name))
+
+        assert_instrumented(module, data_frame, wrong_data_frame)
+    finally:
+        hook.remove()
+
+    module.process(wrong_data_frame)
+    module.Pipeline.load(wrong_data_frame)
+
+
+def test_import_hook_with_loaded_modules(module_name, specs, data_frame, wrong_data_frame):
+    module = importlib.import_module(module_name)
+
+    hook = install_import_hook(specs)
+    assert_instrumented(module, data_frame, wrong_data_frame)
+    hook.remove()
+
+    module.process(wrong_data_frame)
+
+
+def test_import_hook_ignores_other_modules(specs):
+    hook = install_import_hook(specs)
+    try:
+        assert hook.find_spec('json', None) is None
+    finally:
+        hook.remove()
@@ -0,0 +1,85 @@
+import re
+from unittest import mock
+
+import pytest
+import pandas as pd
+
+from pandas_type_checks.core import DataFrameArgument
+from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.fingerprint import MutationFingerprint, mutation_errors
+
+
+@pytest.fixture
+def caller_data_frame(data_frame) -> pd.DataFrame:
+    # Data frame owned by the caller of a decorated function, which may be mutated in place
+    return data_frame.copy()
+
+
+def test_mutation_errors(caller_data_frame):
+    fingerprint = MutationFingerprint(caller_data_frame)
+    assert mutation_errors(fingerprint, caller_data_frame) == []
+
+    caller_data_frame['D'] = 1
+    caller_data_frame['B'] = caller_data_frame['B'].astype('float64')
+    caller_data_frame.drop(columns='C', inplace=True)
+
+    assert mutation_errors(fingerprint, caller_data_frame) == [
+        "Column 'D' was added in place",
+        "Type of column 'B' was changed in place from 'int64' to 'float64'",
+        "Column 'C' was dropped in place"
+    ]
+
+
+def test_mutation_errors_for_rows_and_column_order(caller_data_frame):
+    fingerprint = MutationFingerprint(caller_data_frame)
+    caller_data_frame.drop(index=caller_data_frame.index[0], inplace=True)
+    caller_data_frame.columns = ['A', 'C', 'B']
+
+    assert mutation_errors(fingerprint, caller_data_frame) == [
+        "Type of column 'B' was changed in place from 'int64' to 'string'",
+        "Type of column 'C' was changed in place from 'string' to 'int64'",
+        f"Number of rows was changed in place from {len(caller_data_frame) + 1} to {len(caller_data_frame)}"
+    ]
+
+
+def test_mutation_errors_for_replaced_columns(caller_data_frame):
+    fingerprint = MutationFingerprint(caller_data_frame, buffers=True)
+    caller_data_frame['A'] = caller_data_frame['A'] * 2
+
+    assert mutation_errors(MutationFingerprint(caller_data_frame), caller_data_frame) == []
+    assert mutation_errors(fingerprint, caller_data_frame) == ["Column 'A' was replaced in place"]
+
+
+def test_mutation_fingerprint_does_not_copy_data(caller_data_frame):
+    with mock.patch.object(pd.DataFrame, 'copy') as copy_mock, mock.patch.object(pd.Series, 'copy') as series_copy_mock:
+        MutationFingerprint(caller_data_frame, buffers=True)
+        copy_mock.assert_not_called()
+        series_copy_mock.assert_not_called()
+
+
+def test_data_frame_argument_with_mutation_detection(caller_data_frame, data_frame_type):
+    @pandas_type_check(DataFrameArgument('data', data_frame_type, detect_mutation='structure'))
+    def test_function(data: pd.DataFrame, add_column: bool) -> int:
+        if add_column:
+            data['D'] = data['A'] * 2
+        return len(data)
+
+    assert test_function(caller_data_frame, False) == len(caller_data_frame)
+
+    with pytest.raises(TypeError,
+                       match=re.escape(f"Pandas type error in function '{test_function.__name__}'\n"
+                                       f"Type error in argument 'data':\n"
+                                       f"\tColumn 'D' was added in place")):
+        test_function(caller_data_frame, True)
+
+
+def test_data_frame_argument_without_mutation_detection(caller_data_frame, data_frame_type):
+    @pandas_type_check(DataFrameArgument('data', data_frame_type))
+    def test_function(data: pd.DataFrame) -> int:
+        data['D'] = 1
+        return len(data)
+
+    assert test_function(caller_data_frame) == len(caller_data_frame)
+
+    with pytest.raises(ValueError, match="Unsupported mutation detection mode 'values'."):
+        DataFrameArgument('data', data_frame_type, detect_mutation='values')
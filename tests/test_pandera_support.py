@@ -6,8 +6,12 @@ import pandas as pd
 import pandera as pa
 
 from pandas_type_checks import config
+from pandas_type_checks.batch import check_many
 from pandas_type_checks.core import SeriesReturnValue, SeriesArgument, DataFrameReturnValue, DataFrameArgument
 from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.pandera_support import has_row_wise_checks_only
+from pandas_type_checks.readers import read_csv
+from pandas_type_checks.validated import is_validated, mark_validated
 
 
 @pytest.fixture(scope='module')
@@ -207,3 +211,85 @@ def test_type_error_for_series_return_value_with_pandera_schema(series_schema, w
                              f"Type error in return value:\n"
                              f"\texpected series 'None' to have type int64, got float64"):
         test_function()
+
+
+def test_coerce_data_frame_argument_with_pandera_schema(data_frame_schema, data_frame):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+
+    @pandas_type_check(DataFrameArgument('arg', data_frame_schema, coerce=True))
+    def test_function(arg: pd.DataFrame) -> pd.DataFrame:
+        return arg
+
+    result = test_function(data_frame.astype({'A': 'float32', 'B': 'int32'}))
+    pd.testing.assert_frame_equal(result, data_frame)
+
+
+def test_read_csv_with_pandera_schema(data_frame_schema_with_checks, data_frame, tmp_path):
+    path = tmp_path / 'data.csv'
+    data_frame.to_csv(path, index=False)
+
+    result = read_csv(path, data_frame_schema_with_checks)
+    assert result.dtypes.to_dict() == {k: v.type for k, v in data_frame_schema_with_checks.dtypes.items()}
+    assert not is_validated(result, data_frame_schema_with_checks)
+
+    # Data frames read with a Pandera schema are not marked, since in-place changes of values keep their structure
+    data_frame.iloc[:1].to_csv(path, index=False)
+    result = read_csv(path, data_frame_schema_with_checks)
+    assert not is_validated(result, data_frame_schema_with_checks)
+
+
+def test_validated_data_frame_with_pandera_schema(data_frame_schema_with_checks, data_frame):
+    @pandas_type_check(DataFrameArgument('arg', data_frame_schema_with_checks))
+    def test_function(arg: pd.DataFrame) -> int:
+        return len(arg)
+
+    valid_data_frame = data_frame.iloc[:1].copy()
+    test_function(valid_data_frame)
+    mark_validated(valid_data_frame, data_frame_schema_with_checks)
+
+    # Changing values in place keeps the structure, the value checks of the schema are run nevertheless
+    valid_data_frame.loc[0, 'B'] = data_frame['B'].max()
+    with pytest.raises(TypeError):
+        test_function(valid_data_frame)
+
+
+def test_check_many_with_pandera_schema(data_frame_schema_with_checks, data_frame, wrong_data_frame):
+    valid_data_frame = data_frame.iloc[:1]
+    data_frames = [valid_data_frame, data_frame, wrong_data_frame, valid_data_frame.copy()]
+    marker = DataFrameReturnValue(data_frame_schema_with_checks)
+    expected_errors = [[err.error_msg for err in marker.type_check(data_frame, strict=False)]
+                       for data_frame in data_frames]
+
+    for options in [{}, {'max_workers': 2}, {'concatenate': True}]:
+        result = check_many(data_frames, data_frame_schema_with_checks, strict=False, **options)
+
+        assert result.failed_frames == [1, 2]
+        assert [[err.error_msg for err in errors] for errors in result.type_check_errors] == expected_errors
+
+
+def test_check_many_with_aggregate_checks(data_frame):
+    # Mean of column 'B' is 2 for the concatenation, but 1 and 3 for the individual data frames
+    schema = pa.DataFrameSchema({'B': pa.Column('int64', checks=pa.Check(lambda column: column.mean() >= 2))})
+    data_frames = [data_frame.assign(B=[1, 1]), data_frame.assign(B=[3, 3])]
+
+    result = check_many(data_frames, schema, strict=False, concatenate=True)
+
+    assert result.failed_frames == [0]
+    assert not has_row_wise_checks_only(schema)
+    assert has_row_wise_checks_only(pa.DataFrameSchema({'B': pa.Column('int64', checks=pa.Check.ge(0))}))
+    assert not has_row_wise_checks_only(pa.DataFrameSchema({'B': pa.Column('int64', checks=pa.Check.ge(0),
+                                                                           unique=True)}))
+
+
+def test_explain_with_pandera_schema(data_frame_schema_with_checks, data_frame):
+    @pandas_type_check(DataFrameArgument('data', data_frame_schema_with_checks), SeriesReturnValue('float64'))
+    def test_function(data: pd.DataFrame) -> pd.Series:
+        return data['A']
+
+    plan = test_function.explain(data_frame)
+
+    assert plan.markers[0].engine == 'pandera'
+    assert plan.markers[0].details == "3 columns, 3 checks"
+    assert [phase for phase, _ in plan.markers[0].phases] == ['dtypes', 'pandera validation', 'index']
+    assert plan.markers[0].num_errors == 2
@@ -0,0 +1,149 @@
+import re
+from unittest import mock
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from pandas_type_checks import config
+from pandas_type_checks.core import DataFrameArgument, DataFrameReturnValue
+from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.dtypes import AnyFloat
+from pandas_type_checks.patterns import ColumnPattern, Glob, Prefix, Regex
+from pandas_type_checks.readers import read_csv, read_parquet
+from pandas_type_checks.validated import is_validated
+
+
+@pytest.fixture(scope='module')
+def wide_data_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        'id': [1, 2],
+        **{f'feat_{i:04d}': [1.0, 2.0] for i in range(5)},
+        **{f'flag_{i}': [True, False] for i in range(3)}
+    })
+
+
+def test_column_patterns():
+    assert Regex(r'feat_\d{4}').matches('feat_0001')
+    assert not Regex(r'feat_\d{4}').matches('feat_00001')
+    assert not Regex(r'feat_\d{4}').matches(1)
+    assert Prefix('feat_').matches('feat_x')
+    assert not Prefix('feat_').matches('my_feat_x')
+    assert Glob('feat_*').matches('feat_0001')
+    assert not Glob('feat_*').matches('Feat_0001')
+    assert Regex('a') == Regex('a')
+    assert Regex('a') != Regex('a', min_count=1)
+    assert Regex('a') != Glob('a')
+    assert str(Prefix('feat_')) == "prefix 'feat_'"
+
+    with pytest.raises(ValueError, match="Invalid match counts for column glob 'feat_\\*': min_count=2, max_count=1"):
+        Glob('feat_*', min_count=2, max_count=1)
+
+
+def test_column_pattern_requires_matches():
+    class IncompleteColumnPattern(ColumnPattern):
+        pass
+
+    with pytest.raises(TypeError, match='abstract'):
+        IncompleteColumnPattern('A*')
+
+
+def test_data_frame_argument_with_column_patterns(wide_data_frame):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameArgument('arg', {
+        'id': np.dtype('int64'),
+        Regex(r'feat_\d{4}', min_count=1): AnyFloat(),
+        Prefix('flag_', max_count=3): np.dtype('bool')
+    }))
+    def test_function(arg: pd.DataFrame) -> pd.DataFrame:
+        return arg
+
+    pd.testing.assert_frame_equal(test_function(wide_data_frame), wide_data_frame)
+
+    with pytest.raises(TypeError,
+                       match=re.escape(f"Pandas type error in function '{test_function.__name__}'\n"
+                                       f"Type error in argument 'arg':\n"
+                                       f"\tExpected type 'float' for column feat_0001' matching regex 'feat_\\d{{4}}' "
+                                       f"but found type 'int64'\n"
+                                       f"\tExpected at most 3 columns matching prefix 'flag_' but found 4")):
+        test_function(wide_data_frame.astype({'feat_0001': 'int64'}).assign(flag_3=True))
+
+    with pytest.raises(TypeError,
+                       match=re.escape(f"Pandas type error in function '{test_function.__name__}'\n"
+                                       f"Type error in argument 'arg':\n"
+                                       f"\tExpected at least 1 columns matching regex 'feat_\\d{{4}}' but found 0")):
+        test_function(wide_data_frame[['id', 'flag_0']])
+
+
+def test_named_columns_take_precedence_over_column_patterns(wide_data_frame):
+    marker = DataFrameReturnValue({'feat_0000': np.dtype('float64'), Prefix('feat_', max_count=4): np.dtype('float64')})
+
+    assert marker.type_check(wide_data_frame.drop(columns=['id']), strict=False) == []
+
+
+def test_strict_type_check_with_column_patterns(wide_data_frame):
+    marker = DataFrameReturnValue({'id': np.dtype('int64'), Glob('feat_*'): np.dtype('float64')})
+
+    type_check_errors = marker.type_check(wide_data_frame, strict=True)
+
+    assert [err.error_msg for err in type_check_errors] == [
+        f"Found unspecified column in data frame: 'flag_{i}'" for i in range(3)
+    ]
+
+
+def test_column_pattern_resolution_is_cached(wide_data_frame):
+    pattern = Regex(r'feat_\d{4}')
+    marker = DataFrameReturnValue({'id': np.dtype('int64'), pattern: np.dtype('float64')})
+    assert marker.type_check(wide_data_frame, strict=True) != []
+
+    with mock.patch.object(Regex, 'matches') as matches_mock:
+        assert len(marker.type_check(wide_data_frame, strict=True)) == 3
+        matches_mock.assert_not_called()
+
+        marker.type_check(wide_data_frame[['id', 'feat_0000']], strict=True)
+        matches_mock.assert_called_once_with('feat_0000')
+
+
+def test_coerce_column_patterns(wide_data_frame):
+    marker = DataFrameReturnValue({Prefix('feat_'): np.dtype('float64')}, coerce=True)
+    data_frame = wide_data_frame.astype({'feat_0001': 'float32'})
+
+    coerced_data_frame = marker.coerce_types(data_frame)
+
+    assert coerced_data_frame['feat_0001'].dtype == np.dtype('float64')
+    assert coerced_data_frame['id'].dtype == np.dtype('int64')
+
+
+def test_read_csv_with_column_patterns(wide_data_frame, tmp_path):
+    path = tmp_path / 'wide_data.csv'
+    wide_data_frame.to_csv(path, index=False)
+    data_frame_type = {'id': np.dtype('int32'), Prefix('feat_'): np.dtype('float32')}
+
+    data_frame = read_csv(path, data_frame_type)
+
+    assert list(data_frame.columns) == ['id', *[f'feat_{i:04d}' for i in range(5)]]
+    assert set(data_frame.dtypes.iloc[1:]) == {np.dtype('float32')}
+    assert data_frame['id'].dtype == np.dtype('int32')
+    assert is_validated(data_frame, data_frame_type)
+
+    # Inferred columns which cannot be cast without loss keep their types
+    data_frame_type = {'id': np.dtype('int32'), Prefix('feat_'): np.dtype('int64')}
+    data_frame = read_csv(path, data_frame_type)
+
+    assert set(data_frame.dtypes.iloc[1:]) == {np.dtype('float64')}
+    assert not is_validated(data_frame, data_frame_type)
+
+
+def test_read_parquet_with_column_patterns(wide_data_frame, tmp_path):
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'wide_data.parquet'
+    wide_data_frame.to_parquet(path, index=False)
+    data_frame_type = {Glob('flag_*', min_count=3): np.dtype('bool')}
+
+    data_frame = read_parquet(path, data_frame_type)
+
+    assert list(data_frame.columns) == ['flag_0', 'flag_1', 'flag_2']
+    assert is_validated(data_frame, data_frame_type)
@@ -0,0 +1,96 @@
+import datetime
+from unittest import mock
+
+import pytest
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from pandas_type_checks import config
+from pandas_type_checks.core import DataFrameReturnValue, DataFrameArgument
+from pandas_type_checks.decorator import pandas_type_check, PandasTypeCheckDecoratorException
+from pandas_type_checks.dtypes import AnyBackend, Categorical
+from pandas_type_checks.polars_support import polars_column_types
+
+
+@pytest.fixture(scope='module')
+def polars_data_frame() -> pl.DataFrame:
+    return pl.DataFrame({
+        'A': [1.0, 2.0],
+        'B': [1, 2],
+        'C': ['foo', 'bar']
+    })
+
+
+def test_polars_column_types():
+    polars_data_frame = pl.DataFrame({
+        'A': pl.Series([1], dtype=pl.Int32),
+        'B': [True],
+        'C': [datetime.datetime(2024, 1, 1)],
+        'D': pl.Series(['foo'], dtype=pl.Categorical),
+        'E': [[1, 2]]
+    })
+
+    assert polars_column_types(polars_data_frame) == {
+        'A': np.dtype('int32'),
+        'B': np.dtype('bool'),
+        'C': np.dtype('datetime64[us]'),
+        'D': pd.CategoricalDtype(),
+        'E': np.dtype('object')
+    }
+
+
+def test_data_frame_argument_with_polars_data_frame(data_frame_type, polars_data_frame):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameArgument('arg', data_frame_type))
+    def test_function(arg: pl.DataFrame) -> pl.DataFrame:
+        return arg
+
+    assert test_function(polars_data_frame) is polars_data_frame
+
+
+def test_data_frame_return_value_with_polars_lazy_frame(data_frame_type, polars_data_frame):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameReturnValue(data_frame_type), strict=True)
+    def test_function() -> pl.LazyFrame:
+        return polars_data_frame.lazy().with_columns(pl.col('B').cast(pl.Int32), D=pl.lit('baz'))
+
+    with pytest.raises(TypeError,
+                       match=f"Pandas type error in function '{test_function.__name__}'\n"
+                             f"Type error in return value:\n"
+                             f"\tFound unspecified column in data frame: 'D'\n"
+                             f"\tExpected type 'int64' for column B' but found type 'int32'"):
+        test_function()
+
+
+def test_type_check_polars_lazy_frame_without_collecting(data_frame_type, polars_data_frame):
+    lazy_frame = polars_data_frame.lazy().filter(pl.col('B') > 1)
+
+    with mock.patch.object(pl.LazyFrame, 'collect') as collect:
+        assert DataFrameReturnValue(data_frame_type).type_check(lazy_frame, strict=True) == []
+        assert DataFrameReturnValue({'A': AnyBackend('float64')}).type_check(lazy_frame, strict=False) == []
+        collect.assert_not_called()
+
+
+def test_data_frame_argument_type_mismatch_for_polars_series(data_frame_type):
+    @pandas_type_check(DataFrameArgument('arg', data_frame_type))
+    def test_function(arg: pl.Series) -> pl.Series:
+        return arg
+
+    with pytest.raises(PandasTypeCheckDecoratorException,
+                       match="Argument type mismatch. Expected argument 'arg' of decorated function"):
+        test_function(pl.Series([1, 2]))
+
+
+def test_categorical_polars_data_frame():
+    polars_data_frame = pl.DataFrame({'A': pl.Series(['foo', 'bar'], dtype=pl.Categorical)})
+
+    assert DataFrameReturnValue({'A': Categorical()}).type_check(polars_data_frame, strict=True) == []
+    errors = DataFrameReturnValue({'A': Categorical(['foo', 'bar'])}).type_check(polars_data_frame, strict=True)
+    assert [err.column_name for err in errors] == ['A']
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from pandas_type_checks import config
+from pandas_type_checks.call_statistics import CallStatistics
+from pandas_type_checks.pytest_plugin import TypeCheckStatisticsPlugin
+
+TEST_MODULE = """
+import time
+
+import pandas as pd
+
+from pandas_type_checks import DataFrameArgument, SeriesReturnValue, pandas_type_check
+
+
+@pandas_type_check(DataFrameArgument('data', {'A': 'float64'}), SeriesReturnValue('float64'))
+def first_column(data: pd.DataFrame) -> pd.Series:
+    return data['A']
+
+
+@pandas_type_check(DataFrameArgument('data', {'A': 'float64'}))
+def slow_function(data: pd.DataFrame) -> int:
+    time.sleep(0.01)
+    return len(data)
+
+
+@pandas_type_check(DataFrameArgument('data', {'A': 'float64'}))
+def never_called(data: pd.DataFrame) -> int:
+    return len(data)
+
+
+def test_functions():
+    data = pd.DataFrame({'A': [1.0, 2.0]})
+    for _ in range(3):
+        first_column(data)
+    slow_function(data)
+"""
+
+
+@pytest.fixture
+def test_module(pytester):
+    pytester.makepyfile(test_module=TEST_MODULE)
+    return pytester
+
+
+def test_pytest_plugin_report(test_module):
+    result = test_module.runpytest('-p', 'pandas_type_checks.pytest_plugin', '--type-check-report=report.json')
+
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*pandas type check statistics*", "*test_module.first_column * 3 * 0 *",
+                                 "*Decorated functions never called: test_module.never_called*"])
+    report = json.loads((test_module.path / 'report.json').read_text())
+    assert report['functions']['test_module.first_column']['calls'] == 3
+    assert report['functions']['test_module.slow_function']['function_time'] >= 0.01
+    assert report['functions']['test_module.slow_function']['overhead'] < 1
+    assert 'test_module.never_called' in report['unexercised_functions']
+    assert report['violations'] == []
+    assert config.call_statistics is None
+
+
+def test_pytest_plugin_thresholds(test_module):
+    test_module.makeini("""
+        [pytest]
+        type_check_max_time_per_call = 0.000000001
+    """)
+    result = test_module.runpytest('-p', 'pandas_type_checks.pytest_plugin', '--type-check-max-overhead=1000')
+
+    result.assert_outcomes(passed=1)
+    assert result.ret == pytest.ExitCode.TESTS_FAILED
+    result.stdout.fnmatch_lines(["*Type check time per call of 'test_module.first_column' is *s, exceeding the "
+                                 "maximum of 1e-09s*"])
+    result.stdout.no_fnmatch_line("*Type check overhead of*")
+
+
+def test_pytest_plugin_is_disabled_by_default(test_module):
+    result = test_module.runpytest('-p', 'pandas_type_checks.pytest_plugin')
+
+    result.assert_outcomes(passed=1)
+    result.stdout.no_fnmatch_line("*pandas type check statistics*")
+
+
+def test_stopping_pytest_plugin_twice():
+    plugin = TypeCheckStatisticsPlugin()
+    plugin.start()
+    assert config.call_statistics is plugin.call_statistics
+    plugin.stop()
+
+    call_statistics = config.call_statistics = CallStatistics()
+    try:
+        plugin.stop()
+        assert config.call_statistics is call_statistics
+    finally:
+        config.call_statistics = None
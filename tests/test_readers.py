@@ -0,0 +1,139 @@
+from unittest import mock
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from pandas_type_checks import config
+from pandas_type_checks.core import DataFrameArgument
+from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.dtypes import ObjectOf
+from pandas_type_checks.readers import read_csv, read_parquet
+from pandas_type_checks.validated import is_validated, mark_validated
+
+
+@pytest.fixture(scope='module')
+def csv_file(tmp_path_factory) -> str:
+    path = tmp_path_factory.mktemp('data') / 'data.csv'
+    pd.DataFrame({
+        'A': [1.0, 2.0],
+        'B': [1, 2],
+        'C': ['foo', 'bar'],
+        'D': ['2024-01-01', '2024-01-02'],
+        'E': [True, False]
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+def test_read_csv(data_frame_type, csv_file):
+    data_frame = read_csv(csv_file, data_frame_type)
+
+    assert list(data_frame.columns) == ['A', 'B', 'C']
+    assert data_frame.dtypes.to_dict() == data_frame_type
+    assert is_validated(data_frame, data_frame_type)
+
+
+def test_read_csv_with_date_time_column(csv_file):
+    data_frame_type = {'B': np.dtype('int32'), 'D': np.dtype('datetime64[ns]')}
+    data_frame = read_csv(csv_file, data_frame_type)
+
+    assert data_frame.dtypes.to_dict() == data_frame_type
+    assert is_validated(data_frame, data_frame_type)
+
+
+def test_read_csv_with_type_check_marker(data_frame_type, csv_file):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    marker = DataFrameArgument('arg', data_frame_type)
+
+    @pandas_type_check(marker, strict=True)
+    def test_function(arg: pd.DataFrame) -> pd.DataFrame:
+        return arg
+
+    data_frame = read_csv(csv_file, marker)
+    with mock.patch.object(marker, 'type_check', wraps=marker.type_check) as type_check:
+        test_function(data_frame)
+        type_check.assert_not_called()
+
+        # Changing the structure of the data frame invalidates the mark
+        data_frame['B'] = data_frame['B'].astype('int32')
+        assert not is_validated(data_frame, data_frame_type)
+        with pytest.raises(TypeError,
+                           match=f"Pandas type error in function '{test_function.__name__}'\n"
+                                 f"Type error in argument 'arg':\n"
+                                 f"\tExpected type 'int64' for column B' but found type 'int32'"):
+            test_function(data_frame)
+        type_check.assert_called_once()
+
+
+def test_read_csv_with_overridden_reader_arguments(data_frame_type, csv_file):
+    data_frame = read_csv(csv_file, data_frame_type, usecols=['A', 'B', 'C', 'E'])
+
+    # Data frame with unspecified column is not marked as validated
+    assert 'E' in data_frame.columns
+    assert not is_validated(data_frame, data_frame_type)
+
+
+@pytest.mark.parametrize('kwargs', [{'index_col': 'A'}, {'names': ['A', 'B', 'C', 'D', 'E'], 'header': 0},
+                                    {'header': 0}, {'converters': {'E': str}}])
+def test_read_csv_with_arguments_changing_the_structure(data_frame_type, csv_file, kwargs):
+    marker = DataFrameArgument('arg', data_frame_type)
+
+    # Data frame is type checked before being marked as validated
+    with mock.patch.object(marker, 'type_check', wraps=marker.type_check) as type_check:
+        data_frame = read_csv(csv_file, marker, **kwargs)
+        type_check.assert_called_once()
+    assert is_validated(data_frame, data_frame_type) == ('A' in data_frame.columns)
+
+
+@pytest.mark.parametrize('element_type', [str, bytes])
+def test_read_csv_with_object_column(csv_file, element_type):
+    spec = {'A': 'float64', 'C': ObjectOf(element_type)}
+
+    data_frame = read_csv(csv_file, spec)
+
+    assert data_frame.dtypes.to_dict() == {'A': np.dtype('float64'), 'C': np.dtype('object')}
+    assert is_validated(data_frame, spec) == (element_type is str)
+
+
+def test_mark_validated_is_specific_to_type_specification(data_frame, data_frame_type):
+    mark_validated(data_frame, data_frame_type)
+
+    assert is_validated(data_frame, data_frame_type)
+    assert not is_validated(data_frame, dict(data_frame_type))
+    assert not is_validated(data_frame.copy(), data_frame_type)
+
+
+def test_read_parquet(data_frame, data_frame_type, tmp_path):
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'data.parquet'
+    data_frame.assign(B=data_frame['B'].astype('int32'), D=['baz', 'baz']).to_parquet(path)
+
+    result = read_parquet(path, data_frame_type)
+
+    assert list(result.columns) == ['A', 'B', 'C']
+    assert result.dtypes.to_dict() == data_frame_type
+    assert is_validated(result, data_frame_type)
+
+
+@pytest.mark.parametrize('values, expected_type', [([1.5, 2.7], 'int64'), ([300, 2], 'int8')])
+def test_read_parquet_with_lossy_cast(tmp_path, values, expected_type):
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'data.parquet'
+    pd.DataFrame({'B': values}).to_parquet(path)
+    spec = {'B': expected_type}
+
+    data_frame = read_parquet(path, spec)
+
+    # The stored values are kept instead of being truncated or wrapped around, and the data frame is not marked
+    assert data_frame['B'].tolist() == values
+    assert not is_validated(data_frame, spec)
+
+    @pandas_type_check(DataFrameArgument('data', spec))
+    def test_function(data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+    with pytest.raises(TypeError, match=f"Expected type '{expected_type}' for column B'"):
+        test_function(data_frame)
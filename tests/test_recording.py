@@ -0,0 +1,150 @@
+import gc
+import json
+import weakref
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from pandas_type_checks import config, decorator, recording
+from pandas_type_checks.core import DataFrameArgument
+from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.recording import StructureRecorder, observe, qualified_name
+
+
+@pytest.fixture
+def recorder(monkeypatch) -> StructureRecorder:
+    # Use an empty structure recorder for each test
+    structure_recorder = StructureRecorder()
+    monkeypatch.setattr(recording, 'structure_recorder', structure_recorder)
+    monkeypatch.setattr(decorator, 'structure_recorder', structure_recorder)
+    return structure_recorder
+
+
+def test_observe(recorder):
+    @observe
+    def test_function(data: pd.DataFrame, values: pd.Series, factor: int = 1) -> pd.DataFrame:
+        return data[['A']] * factor
+
+    data_frame = pd.DataFrame({'A': [1.0, 2.0], 'B': [1, 2], 'C': ['a', 'b']})
+    for _ in range(3):
+        test_function(data_frame, pd.Series([1, 2]), factor=2)
+    test_function(data_frame.drop(columns='C').astype({'B': 'int32'}), values=pd.Series([1.0]))
+
+    structures = recorder.structures[qualified_name(test_function)]
+    assert list(structures) == ['data', 'values', 'return']
+    assert structures['data'].num_observations == 4
+    assert structures['data'].num_layouts == 2
+
+    report = recorder.report()[qualified_name(test_function)]
+    assert report['data']['spec'] == {'A': 'float64'}
+    assert report['data']['missing_columns'] == {'C': 1}
+    assert report['data']['varying_dtypes'] == {'B': {'int64': 3, 'int32': 1}}
+    assert report['values']['spec'] is None
+    assert report['values']['varying_dtypes'] == {None: {'int64': 3, 'float64': 1}}
+    assert report['return'] == {'kind': 'DataFrame', 'observations': 4, 'layouts': 1, 'spec': {'A': 'float64'},
+                                'index': None, 'missing_columns': {}, 'varying_dtypes': {}, 'varying_kinds': {}}
+
+
+def test_observe_with_parentheses(recorder):
+    @observe()
+    def test_function(values: pd.Series) -> pd.Series:
+        return values
+
+    test_function(pd.Series([1, 2], index=pd.Index([1, 2], name='id')))
+
+    report = recorder.report()[qualified_name(test_function)]
+    assert report['values']['spec'] == 'int64'
+    assert report['values']['index'] == {'names': ['id'], 'levels': ['int64']}
+
+
+def test_observed_functions_can_be_garbage_collected(recorder):
+    def test_function(data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+    function_reference = weakref.ref(test_function)
+    observe(test_function)(pd.DataFrame({'A': [1.0, 2.0]}))
+    del test_function
+    gc.collect()
+
+    assert function_reference() is None
+
+
+def test_recording_deduplicates_structures(recorder):
+    data_frame = pd.DataFrame({'A': [1.0, 2.0]})
+    for _ in range(100):
+        recorder.record('test_function', 'data', data_frame)
+
+    structure = recorder.structures['test_function']['data']
+    assert structure.num_observations == 100
+    assert structure.num_layouts == 1
+
+    # Values which are neither data frames nor series are not recorded
+    recorder.record('test_function', 'factor', 2)
+    assert list(recorder.structures['test_function']) == ['data']
+
+
+def test_recording_keeps_observations_of_varying_kinds(recorder):
+    data_frame = pd.DataFrame({'A': [1.0, 2.0], 'B': [1, 2]})
+    for _ in range(3):
+        recorder.record('test_function', 'data', data_frame)
+    recorder.record('test_function', 'data', data_frame['A'])
+    recorder.record('test_function', 'data', data_frame.drop(columns='B'))
+
+    report = recorder.report()['test_function']['data']
+    assert report['kind'] == 'DataFrame'
+    assert report['observations'] == 5
+    assert report['layouts'] == 3
+    assert report['varying_kinds'] == {'DataFrame': 4, 'Series': 1}
+    assert report['missing_columns'] == {'B': 1}
+    assert report['spec'] is None
+
+
+def test_recording_mode_of_type_check_decorator(recorder, data_frame, data_frame_type):
+    @pandas_type_check(DataFrameArgument('data', data_frame_type))
+    def test_function(data: pd.DataFrame) -> pd.Series:
+        return data['A']
+
+    test_function(data_frame)
+    assert recorder.structures == {}
+
+    config.record_structures = True
+    test_function(data_frame)
+    config.enable_type_checks = False
+    test_function(data_frame.drop(columns='C'))
+
+    report = recorder.report()[qualified_name(test_function)]
+    assert report['data']['observations'] == 2
+    assert report['data']['spec'] == {'A': 'float64', 'B': 'int64'}
+    assert report['data']['missing_columns'] == {'C': 1}
+    assert report['return']['spec'] == 'float64'
+
+
+def test_to_decorator(recorder):
+    @observe
+    def test_function(data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+    index = pd.MultiIndex.from_arrays([[10, 20], [1, 2]], names=['key', 'id'])
+    test_function(pd.DataFrame({'A': [1.0, 2.0], 'B': [1, 2]}, index=index))
+
+    assert recorder.to_decorator(qualified_name(test_function)) == (
+        "@pandas_type_check(\n"
+        "    DataFrameArgument('data', {'A': 'float64', 'B': 'int64'}, "
+        "index=IndexSpec(levels=['int64', 'int64'], names=['key', 'id'])),\n"
+        "    DataFrameReturnValue({'A': 'float64', 'B': 'int64'}, "
+        "index=IndexSpec(levels=['int64', 'int64'], names=['key', 'id']))\n"
+        ")"
+    )
+
+    with pytest.raises(KeyError, match="No recorded structures for function 'unknown'."):
+        recorder.to_decorator('unknown')
+
+
+def test_dump(recorder, tmp_path):
+    recorder.record('test_function', 'data', pd.DataFrame({1: np.array([1, 2], dtype='int32')}))
+    path = tmp_path / 'structures.json'
+
+    recorder.dump(path)
+
+    assert json.loads(path.read_text())['test_function']['data']['spec'] == {'1': 'int32'}
@@ -0,0 +1,162 @@
+import json
+import re
+from unittest import mock
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from pandas_type_checks import config, core
+from pandas_type_checks.core import DataFrameArgument, DataFrameReturnValue
+from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.patterns import Prefix
+from pandas_type_checks.readers import read_csv
+from pandas_type_checks.registry import CompiledSchema, SchemaRegistry
+
+
+@pytest.fixture
+def registry(monkeypatch) -> SchemaRegistry:
+    # Use an empty schema registry for each test
+    schema_registry = SchemaRegistry()
+    monkeypatch.setattr(core, 'schema_registry', schema_registry)
+    return schema_registry
+
+
+@pytest.fixture
+def schema_file(tmp_path) -> str:
+    path = tmp_path / 'schemas.json'
+    path.write_text(json.dumps({
+        'measurements': {'A': 'float64', 'B': 'int64'},
+        'labels': {'C': 'string'}
+    }))
+    return str(path)
+
+
+def test_register_schema(registry, data_frame, data_frame_type):
+    registry.register('data', data_frame_type)
+
+    assert 'data' in registry
+    assert registry.names == ['data']
+    assert registry.get('data') is registry.get('data')
+    assert DataFrameReturnValue('data').type_check(data_frame, strict=True) == []
+
+    with pytest.raises(ValueError, match="Schema 'data' is already registered."):
+        registry.register('data', data_frame_type)
+
+    with pytest.raises(KeyError, match="Unknown schema 'unknown'."):
+        registry.get('unknown')
+
+
+def test_compiled_schema_is_shared_and_immutable(registry, data_frame_type):
+    registry.register('data', {**data_frame_type, Prefix('feat_'): np.dtype('float64')})
+
+    markers = [DataFrameReturnValue('data'), DataFrameArgument('arg', 'data')]
+    assert markers[0].expected_column_types is markers[1].expected_column_types
+    assert dict(markers[0].column_patterns) == {Prefix('feat_'): np.dtype('float64')}
+
+    compiled_schema = registry.get('data')
+    with pytest.raises(AttributeError, match="Compiled schema 'data' is immutable"):
+        compiled_schema.spec = {}
+    with pytest.raises(TypeError):
+        compiled_schema.column_types['A'] = np.dtype('int64')  # type: ignore
+
+
+def test_schema_is_compiled_once(registry, data_frame, data_frame_type):
+    registry.register('data', data_frame_type)
+
+    with mock.patch('pandas_type_checks.registry.compile_schema', wraps=lambda name, spec: CompiledSchema(
+            name, spec, dict(data_frame.dtypes), {})) as compile_schema_mock:
+        for _ in range(3):
+            assert DataFrameReturnValue('data').type_check(data_frame, strict=False) == []
+        compile_schema_mock.assert_called_once()
+
+
+def test_data_frame_argument_with_schema_name(registry, data_frame, data_frame_type):
+    assert config.enable_type_checks is True
+    assert config.strict_type_checks is False
+    assert config.log_type_errors is False
+
+    @pandas_type_check(DataFrameArgument('arg', 'data'))
+    def test_function(arg: pd.DataFrame) -> pd.DataFrame:
+        return arg
+
+    # Schemas can be registered after the decorated function has been defined
+    registry.register('data', data_frame_type)
+
+    pd.testing.assert_frame_equal(test_function(data_frame), data_frame)
+
+    with pytest.raises(TypeError,
+                       match=re.escape(f"Pandas type error in function '{test_function.__name__}'\n"
+                                       f"Type error in argument 'arg':\n"
+                                       f"\tExpected type 'int64' for column B' but found type 'float64'")):
+        test_function(data_frame.astype({'B': 'float64'}))
+
+
+def test_read_csv_with_schema_name(registry, data_frame, data_frame_type, tmp_path):
+    registry.register('data', data_frame_type)
+    path = tmp_path / 'data.csv'
+    data_frame.to_csv(path, index=False)
+
+    @pandas_type_check(DataFrameArgument('arg', 'data'))
+    def test_function(arg: pd.DataFrame) -> pd.DataFrame:
+        return arg
+
+    read_data_frame = read_csv(path, 'data')
+
+    # Data frames read with a schema name are marked as validated against the registered schema
+    with mock.patch.object(DataFrameArgument, 'type_check') as type_check_mock:
+        test_function(read_data_frame)
+        type_check_mock.assert_not_called()
+
+
+def test_load_schema_file(registry, schema_file, data_frame, tmp_path):
+    cache_dir = tmp_path / 'cache'
+
+    assert registry.load(schema_file, cache_dir=cache_dir) == ['measurements', 'labels']
+    assert registry.load(schema_file, cache_dir=cache_dir) == ['measurements', 'labels']
+    [cache_file] = cache_dir.glob('*.json')
+    assert json.loads(cache_file.read_text())['measurements'] == {
+        'spec': {'A': 'float64', 'B': 'int64'},
+        'column_types': {'A': 'float64', 'B': 'int64'}
+    }
+
+    assert registry.get('measurements').column_types == {'A': np.dtype('float64'), 'B': np.dtype('int64')}
+    assert DataFrameReturnValue('labels').type_check(data_frame, strict=False) == []
+
+
+def test_load_precompiled_schema_file(registry, schema_file, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    SchemaRegistry().load(schema_file, cache_dir=cache_dir)
+
+    with mock.patch('pandas_type_checks.registry.compile_schema') as compile_schema_mock:
+        assert registry.load(schema_file, cache_dir=cache_dir) == ['measurements', 'labels']
+        compile_schema_mock.assert_not_called()
+
+    assert registry.get('labels').column_types == {'C': pd.StringDtype()}
+
+
+def test_load_schema_file_with_corrupt_cache(registry, schema_file, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    SchemaRegistry().load(schema_file, cache_dir=cache_dir)
+    for cache_file in cache_dir.glob('*.json'):
+        cache_file.write_bytes(b'corrupt')
+
+    assert registry.load(schema_file, cache_dir=cache_dir) == ['measurements', 'labels']
+    assert registry.get('measurements').column_types['B'] == np.dtype('int64')
+
+
+def test_load_invalid_schema_file(registry, tmp_path):
+    path = tmp_path / 'schemas.json'
+    path.write_text(json.dumps({'data': ['A', 'B']}))
+
+    with pytest.raises(ValueError, match="Invalid schema file"):
+        registry.load(path, use_cache=False)
+
+
+def test_load_yaml_schema_file(registry, tmp_path):
+    pytest.importorskip('yaml')
+    path = tmp_path / 'schemas.yaml'
+    path.write_text("data:\n  A: float64\n  B: Int64\n")
+
+    assert registry.load(path, cache_dir=tmp_path / 'cache') == ['data']
+    assert registry.get('data').column_types == {'A': np.dtype('float64'), 'B': pd.Int64Dtype()}
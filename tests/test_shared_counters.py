@@ -0,0 +1,177 @@
+import json
+import multiprocessing
+import os
+import threading
+from unittest import mock
+
+import pytest
+import pandas as pd
+
+from pandas_type_checks import config
+from pandas_type_checks.core import DataFrameArgument
+from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.shared_counters import FunctionCounters, SharedCounters, main
+
+NUM_PROCESSES = 4
+NUM_CALLS = 500
+
+
+@pytest.fixture
+def counter_path(tmp_path):
+    return tmp_path / 'type_checks.counters'
+
+
+def count_calls(path, num_calls: int) -> None:
+    counters = SharedCounters(path)
+    for i in range(num_calls):
+        counters.record('module.process', i % 5 == 0, 1000)
+        counters.record(f'module.function_{i % 3}', False, 10)
+    counters.close()
+
+
+def increment_inherited_counters(counters: SharedCounters, num_calls: int) -> None:
+    # Counter file inherited from the parent process, as in a pre-fork server
+    for _ in range(num_calls):
+        counters.record('module.process', False, 1)
+
+
+def test_shared_counters(counter_path):
+    counters = SharedCounters(counter_path, num_slots=16)
+    counters.record('module.process', False, 2_000_000)
+    counters.record('module.process', True, 3_000_000)
+    counters.record('module.other', False, 1_000)
+
+    assert counters.snapshot() == {
+        'module.process': FunctionCounters(calls=2, failures=1, check_time=0.005),
+        'module.other': FunctionCounters(calls=1, failures=0, check_time=1e-6)
+    }
+
+    # Existing counter files keep their layout
+    reader = SharedCounters(counter_path, num_slots=1024)
+    assert reader.num_slots == 16
+    assert reader.snapshot() == counters.snapshot()
+    reader.close()
+    counters.close()
+
+
+def test_shared_counters_with_full_file(counter_path):
+    counters = SharedCounters(counter_path, num_slots=2)
+    for name in ['a', 'b', 'c', 'a']:
+        counters.record(name, False, 0)
+
+    assert {name: function_counters.calls for name, function_counters in counters.snapshot().items()} == \
+        {'a': 2, 'b': 1}
+    assert counters.dropped_updates == 1
+    counters.close()
+
+
+def test_shared_counters_with_long_names(counter_path):
+    counters = SharedCounters(counter_path, num_slots=16)
+    prefix = 'module.' + 'x' * 100
+    counters.record(prefix + '.first', False, 0)
+    counters.record(prefix + '.second', False, 0)
+    counters.record(prefix + '.second', False, 0)
+
+    snapshot = counters.snapshot()
+    assert sorted(function_counters.calls for function_counters in snapshot.values()) == [1, 2]
+    assert all(len(name) == 88 and name.startswith(prefix[:70]) for name in snapshot)
+    counters.close()
+
+
+def test_shared_counters_share_file_within_process(counter_path):
+    with mock.patch('os.register_at_fork') as register_at_fork_mock:
+        counters = SharedCounters(counter_path)
+        other_counters = SharedCounters(counter_path)
+    register_at_fork_mock.assert_not_called()
+    assert other_counters._file is counters._file
+
+    # Closing one instance keeps the descriptor of the file, and thereby the record locks, of the other one
+    fd = counters._file.fd
+    other_counters.close()
+    other_counters.close()
+    os.fstat(fd)
+    counters.record('module.process', False, 0)
+    assert counters.snapshot()['module.process'].calls == 1
+    counters.close()
+    with pytest.raises(OSError):
+        os.fstat(fd)
+
+    # The file is opened again after all instances have been closed
+    reopened_counters = SharedCounters(counter_path)
+    assert reopened_counters.snapshot()['module.process'].calls == 1
+    reopened_counters.close()
+
+
+def test_shared_counters_with_invalid_file(counter_path):
+    counter_path.write_bytes(b'not a counter file' * 10)
+
+    with pytest.raises(ValueError, match="is not a type check counter file of version 1"):
+        SharedCounters(counter_path)
+
+
+def test_shared_counters_across_processes(counter_path):
+    counters = SharedCounters(counter_path)
+    context = multiprocessing.get_context('fork')
+    processes = [context.Process(target=count_calls, args=(counter_path, NUM_CALLS)) for _ in range(NUM_PROCESSES)]
+    processes += [context.Process(target=increment_inherited_counters, args=(counters, NUM_CALLS))
+                  for _ in range(NUM_PROCESSES)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    snapshot = counters.snapshot()
+    assert snapshot['module.process'].calls == 2 * NUM_PROCESSES * NUM_CALLS
+    assert snapshot['module.process'].failures == NUM_PROCESSES * NUM_CALLS // 5
+    assert sum(snapshot[f'module.function_{i}'].calls for i in range(3)) == NUM_PROCESSES * NUM_CALLS
+    counters.close()
+
+
+def test_shared_counters_across_threads(counter_path):
+    counters = SharedCounters(counter_path)
+    threads = [threading.Thread(target=increment_inherited_counters, args=(counters, NUM_CALLS)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counters.snapshot()['module.process'].calls == 4 * NUM_CALLS
+    counters.close()
+
+
+def test_type_check_decorator_with_shared_counters(counter_path, data_frame, data_frame_type):
+    config.shared_counters = SharedCounters(counter_path)
+    try:
+        @pandas_type_check(DataFrameArgument('data', data_frame_type))
+        def test_function(data: pd.DataFrame) -> int:
+            return len(data)
+
+        test_function(data_frame)
+        with pytest.raises(TypeError):
+            test_function(data_frame.drop(columns='C'))
+
+        [function_counters] = config.shared_counters.snapshot().values()
+        assert function_counters.calls == 2
+        assert function_counters.failures == 1
+        assert function_counters.check_time > 0
+    finally:
+        config.shared_counters.close()
+        config.shared_counters = None
+
+
+def test_shared_counters_command_line(counter_path, capsys):
+    counters = SharedCounters(counter_path)
+    counters.record('module.process', True, 1_500_000_000)
+    counters.close()
+
+    main([str(counter_path), '--json'])
+    assert json.loads(capsys.readouterr().out) == {
+        'module.process': {'calls': 1, 'failures': 1, 'check_time': 1.5}
+    }
+
+    main([str(counter_path)])
+    assert capsys.readouterr().out.splitlines()[1].split() == ['module.process', '1', '1', '1.500000']
+
+    with pytest.raises(SystemExit):
+        main([str(counter_path.with_name('missing.counters'))])
@@ -0,0 +1,142 @@
+import logging
+import re
+import time
+
+import pytest
+import pandas as pd
+import pandera as pa
+
+from pandas_type_checks import config
+from pandas_type_checks.core import DataFrameArgument, DataFrameReturnValue
+from pandas_type_checks.decorator import pandas_type_check
+from pandas_type_checks.pandera_support import split_data_frame_schema, validate_before_deadline
+from pandas_type_checks.time_budget import time_budget_counters
+
+
+def slow_check(seconds: float) -> pa.Check:
+    def check(series: pd.Series) -> bool:
+        time.sleep(seconds)
+        return True
+
+    return pa.Check(check, name=f'sleep_{seconds}')
+
+
+@pytest.fixture
+def slow_schema() -> pa.DataFrameSchema:
+    return pa.DataFrameSchema({
+        'A': pa.Column(float, [slow_check(0.2), pa.Check.ge(0)]),
+        'B': pa.Column(int, pa.Check.le(2)),
+        'C': pa.Column('string', slow_check(0.01))
+    })
+
+
+@pytest.fixture(autouse=True)
+def reset_time_budget_counters():
+    time_budget_counters.reset()
+    yield
+    config.validation_time_budget = None
+
+
+def test_type_check_with_time_budget(slow_schema, data_frame):
+    marker = DataFrameReturnValue(slow_schema)
+
+    # The slow check of column 'A' exhausts the time budget, the remaining value checks are skipped
+    type_check_errors = marker.type_check(data_frame.assign(A=-1.0), strict=False, time_budget=0.1)
+
+    assert [err.incomplete for err in type_check_errors] == [True]
+    assert type_check_errors[0].error_msg == (
+        "Validation incomplete: time budget of 0.1s exceeded, skipped 3 checks: "
+        "greater_than_or_equal_to of column 'A', less_than_or_equal_to of column 'B', sleep_0.01 of column 'C'"
+    )
+    assert time_budget_counters.timed_out_checks == 1
+    assert time_budget_counters.skipped_steps == 3
+
+
+def test_structural_checks_ignore_time_budget(slow_schema, data_frame):
+    marker = DataFrameReturnValue(slow_schema)
+
+    type_check_errors = marker.type_check(data_frame.astype({'B': 'int32'}), strict=False, time_budget=0)
+
+    assert [err.incomplete for err in type_check_errors] == [False, True]
+    assert "expected series 'B' to have type int64" in type_check_errors[0].error_msg
+    assert "skipped 4 checks" in type_check_errors[1].error_msg
+
+
+def test_type_check_within_time_budget(slow_schema, data_frame):
+    marker = DataFrameReturnValue(slow_schema)
+
+    assert marker.type_check(data_frame, strict=False, time_budget=10) == []
+    type_check_errors = marker.type_check(data_frame.assign(B=3), strict=False, time_budget=10)
+    assert len(type_check_errors) == 1
+    assert "less_than_or_equal_to" in type_check_errors[0].error_msg
+    assert time_budget_counters.timed_out_checks == 0
+
+
+def test_split_schema_is_reset_with_type_specification(slow_schema, data_frame):
+    marker = DataFrameReturnValue(slow_schema)
+    marker.type_check(data_frame, strict=False, time_budget=10)
+    assert marker._split_schema_cache[0] is slow_schema
+
+    marker.dtype = pa.DataFrameSchema({'B': pa.Column(int, pa.Check.le(1))})
+    assert marker._split_schema_cache is None
+    type_check_errors = marker.type_check(data_frame, strict=False, time_budget=10)
+    assert len(type_check_errors) == 1
+    assert "less_than_or_equal_to(1)" in type_check_errors[0].error_msg
+
+
+def test_incomplete_type_check_does_not_fail(slow_schema, data_frame, caplog):
+    @pandas_type_check(DataFrameArgument('data', slow_schema), time_budget=0)
+    def test_function(data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+    with caplog.at_level(logging.WARNING, logger='pandas_type_checks'):
+        pd.testing.assert_frame_equal(test_function(data_frame), data_frame)
+    assert "Validation incomplete: time budget of 0s exceeded, skipped 4 checks" in caplog.text
+
+
+def test_global_time_budget(slow_schema, data_frame):
+    config.validation_time_budget = 0.1
+
+    @pandas_type_check(DataFrameArgument('data', slow_schema))
+    def test_function(data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+    # The failing check of column 'A' is skipped after the slow check exhausted the time budget
+    pd.testing.assert_frame_equal(test_function(data_frame.assign(A=-1.0)), data_frame.assign(A=-1.0))
+    assert time_budget_counters.timed_out_checks == 1
+
+    # A time budget given to the decorator takes precedence over the configured time budget
+    @pandas_type_check(DataFrameArgument('data', slow_schema), time_budget=None)
+    def unbounded_function(data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+    with pytest.raises(TypeError,
+                       match=re.escape(f"Pandas type error in function '{unbounded_function.__name__}'\n"
+                                       f"Type error in argument 'data':\n"
+                                       f"\tColumn 'A' failed element-wise validator number 1: "
+                                       f"greater_than_or_equal_to(0)")):
+        unbounded_function(data_frame.assign(A=-1.0))
+
+
+def test_value_checks_run_on_coerced_data_frame():
+    schema = pa.DataFrameSchema({'A': pa.Column(int, pa.Check.isin([1, 2]), coerce=True)})
+    marker = DataFrameReturnValue(schema)
+
+    assert marker.type_check(pd.DataFrame({'A': ['1', '2']}), strict=False, time_budget=10) == []
+    type_check_errors = marker.type_check(pd.DataFrame({'A': ['1', '3']}), strict=False, time_budget=10)
+    assert len(type_check_errors) == 1
+    assert "isin" in type_check_errors[0].error_msg
+
+
+def test_skipped_checks_without_name():
+    check = pa.Check.ge(0)
+    check.name = None
+    unnamed_check = pa.Check.le(2)
+    unnamed_check.name = unnamed_check.error = None
+    base_schema, check_schemas = split_data_frame_schema(pa.DataFrameSchema({'A': pa.Column(int, [check])},
+                                                                            checks=[unnamed_check]))
+
+    assert [description for description, _ in check_schemas] == ["greater_than_or_equal_to(0) of column 'A'",
+                                                                 "unnamed check of data frame"]
+    _, skipped_checks = validate_before_deadline(base_schema, check_schemas, pd.DataFrame({'A': [1]}), deadline=0)
+    assert skipped_checks == ["greater_than_or_equal_to(0) of column 'A'", "unnamed check of data frame"]
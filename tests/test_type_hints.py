@@ -0,0 +1,134 @@
+import re
+from typing import Optional
+from unittest import mock
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from pandas_type_checks import decorator
+from pandas_type_checks.core import DataFrameArgument, DataFrameReturnValue, SeriesArgument, SeriesReturnValue
+from pandas_type_checks.decorator import PandasTypeCheckDecoratorException, pandas_type_check
+from pandas_type_checks.index_spec import IndexSpec
+from pandas_type_checks.type_hints import markers_from_type_hints
+
+try:
+    from typing import Annotated
+except ImportError:  # pragma: no cover
+    from typing_extensions import Annotated  # type: ignore
+
+
+def test_markers_from_type_hints():
+    def test_function(data: Annotated[pd.DataFrame, {'A': 'float64'}, IndexSpec(unique=True)],
+                      values: Annotated[pd.Series, 'int64'],
+                      factor: Optional[int] = None) -> Annotated[pd.Series, np.dtype('float64')]:
+        return data['A']
+
+    markers = markers_from_type_hints(test_function)
+
+    assert [type(marker) for marker in markers] == [DataFrameArgument, SeriesArgument, SeriesReturnValue]
+    assert markers[0].name == 'data'
+    assert markers[0].expected_column_types == {'A': np.dtype('float64')}
+    assert markers[0].index.unique is True
+    assert markers[1].name == 'values'
+    assert markers[2].expected_type == np.dtype('float64')
+
+
+def test_markers_from_string_annotations():
+    def test_function(data: 'Annotated[pd.DataFrame, {"A": "float64"}]',
+                      other: 'UndefinedType') -> 'Annotated[pd.DataFrame, {"A": "float64"}]':  # noqa: F821
+        return data
+
+    markers = markers_from_type_hints(test_function)
+
+    assert [type(marker) for marker in markers] == [DataFrameArgument, DataFrameReturnValue]
+
+
+def test_bare_type_check_decorator(data_frame, data_frame_type):
+    @pandas_type_check
+    def test_function(data: Annotated[pd.DataFrame, data_frame_type]) -> Annotated[pd.Series, 'float64']:
+        return data['A']
+
+    pd.testing.assert_series_equal(test_function(data_frame), data_frame['A'])
+
+    with pytest.raises(TypeError,
+                       match=re.escape(f"Pandas type error in function '{test_function.__name__}'\n"
+                                       f"Type error in argument 'data':\n"
+                                       f"\tExpected type 'int64' for column B' but found type 'float64'")):
+        test_function(data_frame.astype({'B': 'float64'}))
+
+
+def test_type_hints_are_ignored_with_type_check_markers(data_frame, data_frame_type):
+    @pandas_type_check(DataFrameArgument('data', {'A': np.dtype('float64')}), strict=True)
+    def test_function(data: Annotated[pd.DataFrame, data_frame_type],
+                      values: Annotated[pd.Series, 'int64']) -> Annotated[pd.Series, 'int64']:
+        return values
+
+    # Type check markers given to the decorator replace the type hints
+    with pytest.raises(TypeError, match=re.escape("Found unspecified column in data frame: 'B'")):
+        test_function(data_frame, pd.Series([1, 2]))
+
+    test_function(data_frame[['A']], pd.Series([1.0, 2.0]))
+
+
+def test_arguments_passed_by_keyword_or_by_default(data_frame, data_frame_type):
+    @pandas_type_check
+    def test_function(factor: int, data: Annotated[pd.DataFrame, data_frame_type] = None,
+                      values: Annotated[pd.Series, 'float64'] = None) -> int:
+        return factor
+
+    assert test_function(2) == 2
+    assert test_function(2, values=pd.Series([1.0])) == 2
+    assert test_function(factor=2, data=data_frame) == 2
+
+    with pytest.raises(TypeError, match=re.escape("Expected Series of type 'float64' but found type 'int64'")):
+        test_function(2, values=pd.Series([1]))
+
+
+def test_metadata_which_is_not_a_type_specification_is_ignored(data_frame):
+    @pandas_type_check
+    def test_function(data: Annotated[pd.DataFrame, 1.5, IndexSpec(unique=True), {'A': 'float64'}],
+                      values: Annotated[pd.Series, 42, 'int64'], other: Annotated[pd.Series, None]) -> int:
+        return len(data)
+
+    assert [type(marker) for marker in markers_from_type_hints(test_function)] == [DataFrameArgument, SeriesArgument]
+    assert test_function(data_frame, pd.Series([1]), pd.Series(['a'])) == 2
+
+    with pytest.raises(TypeError, match=re.escape("Expected Series of type 'int64' but found type 'float64'")):
+        test_function(data_frame, pd.Series([1.0]), pd.Series(['a']))
+
+
+def test_type_hints_are_resolved_once(data_frame):
+    @pandas_type_check
+    def test_function(data: 'Annotated[pd.DataFrame, LATER_DEFINED_SPEC]') -> pd.DataFrame:  # noqa: F821
+        return data
+
+    # Forward references are resolved on the first call
+    globals()['LATER_DEFINED_SPEC'] = {'A': 'float64'}
+    try:
+        with mock.patch('pandas_type_checks.decorator.markers_from_type_hints',
+                        wraps=markers_from_type_hints) as markers_from_type_hints_mock:
+            for _ in range(3):
+                test_function(data_frame)
+            markers_from_type_hints_mock.assert_called_once()
+    finally:
+        del globals()['LATER_DEFINED_SPEC']
+
+
+def test_unresolvable_type_hints(data_frame):
+    @pandas_type_check
+    def test_function(data: 'Annotated[pd.DataFrame, UNDEFINED_SPEC]') -> pd.DataFrame:  # noqa: F821
+        return data
+
+    with pytest.raises(PandasTypeCheckDecoratorException,
+                       match="Cannot resolve type hints of decorated function 'test_function'"):
+        test_function(data_frame)
+
+
+def test_type_check_decorator_without_annotated_support():
+    with mock.patch.object(decorator, 'annotated_support', False):
+        with pytest.raises(PandasTypeCheckDecoratorException,
+                           match="No type specifications given for decorated function 'test_function'"):
+            @pandas_type_check
+            def test_function(data: pd.DataFrame) -> pd.DataFrame:
+                return data